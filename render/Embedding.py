@@ -16,6 +16,9 @@ Filing = None
 
 class FactAxisMemberGroup(object):
 
+    __slots__ = ('fact', 'preferredLabel', 'factAxisMemberRowList', 'axisMemberPositionTupleRowList',
+                 'factAxisMemberColList', 'axisMemberPositionTupleColList')
+
     def __init__(self, fact, preferredLabel=None):
         self.fact = fact
         self.preferredLabel = preferredLabel
@@ -34,6 +37,8 @@ class FactAxisMemberGroup(object):
 
 class FactAxisMember(object):
 
+    __slots__ = ('pseudoAxisName', 'member', 'axisMemberPositionTuple', 'memberLabel', 'memberIsDefault')
+
     def __init__(self, pseudoAxisName, member, axisMemberPositionTuple=None, memberLabel='None', memberIsDefault=False):
         self.pseudoAxisName = pseudoAxisName
         self.member = member  # either a qname or a startEndContext or a unitID object
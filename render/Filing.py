@@ -8,20 +8,18 @@ are not subject to domestic copyright protection. 17 U.S.C. 105.
 """
 
 from gettext import gettext as _
-from collections import defaultdict
+from collections import defaultdict, Counter
 import os, math, datetime, dateutil.relativedelta, lxml, sys, time
 import regex as re
-from itertools import chain
 import arelle.ModelValue, arelle.XbrlConst
 from arelle.ModelDtsObject import ModelConcept
 from arelle.ModelObject import ModelObject
 from arelle.PythonUtil import OrderedSet
 from arelle.XmlUtil import collapseWhitespace
 from arelle.XmlValidateConst import VALID, VALID_NO_CONTENT
-from arelle.XbrlConst import parentChild
 from lxml import etree
 
-from . import Cube, Embedding, Report, PresentationGroup, Summary, Utils, Xlout
+from . import Cube, Embedding, Report, PresentationGroup, Summary, Utils, Xlout, IoManager
 
 usGaapOrIfrsPattern = re.compile(".*/fasb[.]org/(us-gaap|srt)/20|.*/xbrl[.]ifrs[.]org/taxonomy/[0-9-]{10}/ifrs-full", re.I)
 deiPattern = re.compile(".*/xbrl[.]sec[.]gov/dei/20", re.I)
@@ -95,51 +93,56 @@ def mainFun(controller, modelXbrl, outputFolderName, transform=None, suplSuffix=
         modelXbrl.debug("debug",
                         _("Validating renderable reports"),
                         modelObject=modelXbrl.modelDocument)
-    for cube in sortedCubeList:
-        _funStartedAt = time.time()
-        if cube.noFactsOrAllFactsSuppressed:
-            for embedding in cube.embeddingList:
+    try:
+        for cube in sortedCubeList:
+            _funStartedAt = time.time()
+            if cube.noFactsOrAllFactsSuppressed:
+                for embedding in cube.embeddingList:
+                    Utils.embeddingGarbageCollect(embedding)
+            elif cube.isEmbedded:
+                continue  # unless cube.noFactsOrAllFactsSuppressed we want to save it for later when we embed it
+            else:
+                embedding = cube.embeddingList[0]
+                if not embedding.isEmbeddingOrReportBroken:
+                    filing.reportDriverAfterFlowThroughSuppression(embedding, xlWriter)
+                    filing.finishOffReportIfNotEmbedded(embedding)
                 Utils.embeddingGarbageCollect(embedding)
-        elif cube.isEmbedded:
-            continue  # unless cube.noFactsOrAllFactsSuppressed we want to save it for later when we embed it
-        else:
-            embedding = cube.embeddingList[0]
-            if not embedding.isEmbeddingOrReportBroken:
-                filing.reportDriverAfterFlowThroughSuppression(embedding, xlWriter)
-                filing.finishOffReportIfNotEmbedded(embedding)
-            Utils.embeddingGarbageCollect(embedding)
-        controller.logDebug("R{} total {:.3f} secs.".format(cube.fileNumber, time.time() - _funStartedAt))
-        Utils.cubeGarbageCollect(cube)
+            controller.logDebug("R{} total {:.3f} secs.".format(cube.fileNumber, time.time() - _funStartedAt))
+            Utils.cubeGarbageCollect(cube)
 
-    _funStartedAt = time.time()
+        _funStartedAt = time.time()
 
-    # now we make sure that every cube referenced by embedded command facts actually gets embedded.  this might not happen
-    # if for example, the embedded command facts were all filtered out.  In that case, we make a generic embedding and
-    # write it to a file, just like we would any other cube that isn't embedded anywhere by an embedding command fact.
-    filing.disallowEmbeddings = True  # this stops any more embeddings from happening
+        # now we make sure that every cube referenced by embedded command facts actually gets embedded.  this might not happen
+        # if for example, the embedded command facts were all filtered out.  In that case, we make a generic embedding and
+        # write it to a file, just like we would any other cube that isn't embedded anywhere by an embedding command fact.
+        filing.disallowEmbeddings = True  # this stops any more embeddings from happening
 
-    for cube in filing.embeddedCubeSet:
-        _funStartedAt = time.time()
-        try:
-            if cube.noFactsOrAllFactsSuppressed:
+        for cube in filing.embeddedCubeSet:
+            _funStartedAt = time.time()
+            try:
+                if cube.noFactsOrAllFactsSuppressed:
+                    continue
+            except AttributeError:  # may happen if it has been garbage collected above because cube.noFactsOrAllFactsSuppressed
                 continue
-        except AttributeError:  # may happen if it has been garbage collected above because cube.noFactsOrAllFactsSuppressed
-            continue
 
-        embedding = Embedding.Embedding(filing, cube, [])  # make a generic embedding
-        cube.embeddingList += [embedding]
-        cube.isEmbedded = False
-        filing.embeddingDriverBeforeFlowThroughSuppression(embedding)
-        if not embedding.isEmbeddingOrReportBroken:
-            # the second arg is None because we don't generate excel files for filings with embeddings.
-            filing.reportDriverAfterFlowThroughSuppression(embedding, None)
-            filing.finishOffReportIfNotEmbedded(embedding)
-
-        # it might have other embeddings, but they didn't get embedded and we don't need them anymore.
-        for embedding in cube.embeddingList:
-            Utils.embeddingGarbageCollect(embedding)
-        controller.logDebug("R{} total {:.3f} secs.".format(cube.fileNumber, time.time() - _funStartedAt))
-        Utils.cubeGarbageCollect(cube)
+            embedding = Embedding.Embedding(filing, cube, [])  # make a generic embedding
+            cube.embeddingList += [embedding]
+            cube.isEmbedded = False
+            filing.embeddingDriverBeforeFlowThroughSuppression(embedding)
+            if not embedding.isEmbeddingOrReportBroken:
+                # the second arg is None because we don't generate excel files for filings with embeddings.
+                filing.reportDriverAfterFlowThroughSuppression(embedding, None)
+                filing.finishOffReportIfNotEmbedded(embedding)
+
+            # it might have other embeddings, but they didn't get embedded and we don't need them anymore.
+            for embedding in cube.embeddingList:
+                Utils.embeddingGarbageCollect(embedding)
+            controller.logDebug("R{} total {:.3f} secs.".format(cube.fileNumber, time.time() - _funStartedAt))
+            Utils.cubeGarbageCollect(cube)
+    finally:
+        _funStartedAt = time.time()
+        filing.reportEmitter.close()  # write R files still being transformed, and stop its threads when layout fails
+    controller.logDebug("Filing R file emitter finish {:.3f} secs.".format(time.time() - _funStartedAt))
 
     if len(filing.reportSummaryList) > 0:
         controller.nextFileNum = filing.reportSummaryList[-1].fileNumber + 1
@@ -165,7 +168,7 @@ def mainFun(controller, modelXbrl, outputFolderName, transform=None, suplSuffix=
         for unusedFact in filing.unusedFactSet:
             concept = unusedFact.concept
             context = unusedFact.context
-            baseSets = factAppearsInParentChildBaseSets(unusedFact)  # base sets are defined in XBRL 2.1.
+            baseSets = factAppearsInParentChildBaseSets(unusedFact, filing)  # base sets are defined in XBRL 2.1.
             if len(context.segDimValues) == 0:
                 modelXbrl.warning(("EXG.7.3.UncategorizedFact")
                                   , _(f"{concept.qname} in context {context.id} was not selected in any presentation group."
@@ -187,14 +190,22 @@ def mainFun(controller, modelXbrl, outputFolderName, transform=None, suplSuffix=
     return filing.reportSummaryList
 
 
-def factAppearsInParentChildBaseSets (fact) -> set:
-    appearsInRsets = set()
-    for k, rset in fact.modelXbrl.relationshipSets.items():
-        arcrole, roleURI, *ignore = k
-        if arcrole == parentChild and roleURI is not None:
-            if (fact.concept in chain(rset.loadModelRelationshipsFrom() or [], rset.loadModelRelationshipsTo() or [])):
-                appearsInRsets.add(roleURI)
-    return appearsInRsets
+def factAppearsInParentChildBaseSets (fact, filing) -> set:
+    return set(filing.conceptParentChildLinkroles.get(fact.concept, ()))
+
+
+def duplicateFactSortKey(fact):
+    # among facts of a concept and context, the fact to keep comes first, its duplicates follow
+    if fact.isNumeric:
+        if fact.isNil: discriminator = float("INF")  # Null values always last
+        elif fact.decimals is None: discriminator = 0  # Can happen with invalid xbrl
+        else: discriminator = 0 - float(fact.decimals)  # Larger decimal values come first
+    else:  # non-numeric
+        if fact.isNil: discriminator = '\uffff'  # Null values always last (highest 2-byte unicode character)
+        elif fact.xmlLang in ('en-US', 'en-us'): discriminator = 'aa-AA'  # en-US comes first.  en-us is canonical form
+        elif fact.xmlLang is None: discriminator = 'aa-AA'  # no lang means en-US
+        else: discriminator = fact.xmlLang  # followed by all others
+    return (discriminator, fact.sourceline or 0)  # sourceLine is the tiebreaker
 
 
 def contextDims(context) -> dict:
@@ -223,6 +234,7 @@ class Filing(object):
         self.embeddedCubeSet = set()
         self.usedOrBrokenFactDefDict = defaultdict(set)
         self.unusedFactSet = OrderedSet() # preserve order of discovery
+        self.conceptParentChildLinkroles = defaultdict(set)  # presentation linkroles having the concept as parent or child
         self.skippedFactsList = []
 
         self.hasEmbeddings = []
@@ -345,6 +357,10 @@ class Filing(object):
             self.fileNameBase = self.reportZip = None
 
         self.reportSummaryList = []
+        self.reportEmitter = IoManager.ReportEmitter(controller.renderingThreads)
+        self.transformCache = getattr(controller, "rFileTransformCache", None)  # R file html by tree digest, when rendering private data
+        self.cachedTransform = getattr(controller, "rFileCachedTransform", None)  # the xslt whose R file html is cached
+        self.isTransformCacheFilling = getattr(controller, "isRFileTransformCacheFilling", False)  # else only looked up
 
         self.rowSeparatorStr = ' | '
         self.titleSeparatorStr = ' - '
@@ -383,6 +399,9 @@ class Filing(object):
             parentChildRelationshipSet = self.modelXbrl.relationshipSet(arelle.XbrlConst.parentChild)
             parentChildRelationshipSet.loadModelRelationshipsTo()
             parentChildRelationshipSet.loadModelRelationshipsFrom()
+            for relationship in parentChildRelationshipSet.modelRelationships:
+                self.conceptParentChildLinkroles[relationship.fromModelObject].add(relationship.linkrole)
+                self.conceptParentChildLinkroles[relationship.toModelObject].add(relationship.linkrole)
             # Find the axes in presentation groups
             toDimensions = {c for c in parentChildRelationshipSet.modelRelationshipsTo.keys() if isinstance(c, ModelConcept) and c.isDimensionItem}
             fromDimensions = {c for c in parentChildRelationshipSet.modelRelationshipsFrom.keys() if isinstance(c, ModelConcept) and c.isDimensionItem}
@@ -411,6 +430,7 @@ class Filing(object):
                                          axes=cube.defaultFilteredOutAxisSet)
 
             footnoteRelationships = self.modelXbrl.relationshipSet('XBRL-footnotes')
+            hasFootnotes = bool(footnoteRelationships.modelRelationships)
 
             # initialize elements
             for qname, factSet in self.modelXbrl.factsByQname.items():
@@ -418,55 +438,44 @@ class Filing(object):
                 # as another fact.  Also, keep the first fact with an 'en-US' language, or if there is none, keep the first fact.
                 # the others need to be proactively added to the set of unused facts.
                 if len(factSet) > 1:
-
-                    def factSortKey (fact):
-                        if getattr(fact, "xValid", 0) < VALID:
-                            return ("", "", 0)
-                        if fact.isNumeric:
-                            if fact.isNil: discriminator = float("INF")  # Null values always last
-                            elif fact.decimals is None: discriminator = 0  # Can happen with invalid xbrl
-                            else: discriminator = 0 - float(fact.decimals)  # Larger decimal values come first
-                        else:  # non-numeric
-                            if fact.isNil: discriminator = '\uffff'  # Null values always last (highest 2-byte unicode character)
-                            elif fact.xmlLang in ('en-US', 'en-us'): discriminator = 'aa-AA'  # en-US comes first.  en-us is canonical form
-                            elif fact.xmlLang is None: discriminator = 'aa-AA'  # no lang means en-US
-                            else: discriminator = fact.xmlLang  # followed by all others
-                        return (fact.contextID, discriminator, fact.sourceline or 0)  # sourceLine is the tiebreaker
-
-                    sortedFactList = sorted(factSet, key=factSortKey)
-                    while len(sortedFactList) > 0:
-                        firstFact = sortedFactList.pop(0)
-                        if getattr(firstFact, "xValid", 0) < VALID:
-                            continue
-                        lineNumOfFactWeAreKeeping = firstFact.sourceline
-                        discardedLineNumberList = []
-                        discardedCounter = 0
-                        discardedFactList = []
-                        # finds facts with same qname, context and unit as firstFact
-                        while (len(sortedFactList) > 0 and
-                               getattr(sortedFactList[0], "xValid", 0) >= VALID and
-                               sortedFactList[0].qname == firstFact.qname and
-                               sortedFactList[0].context == firstFact.context and
-                               sortedFactList[0].unitID == firstFact.unitID):
-                            discardedCounter += 1
-                            fact = sortedFactList.pop(0)
-                            duplicateFacts.add(fact)  # not keeping this fact
-                            discardedFactList += [fact]
-                            if footnoteRelationships.fromModelObject(fact):  # does duplicate have any footnotes?
-                                dupFactFootnoteOrigin[fact] = firstFact  # track first fact for footnotes from duplicate
-                            discardedLineNumberList += [str(fact.sourceline)]  # these are added in sorted order by sourceline (should be an ordered set)
-
-                        if discardedCounter > 0:
-                            # start it off because we can assume that these facts have a qname and a context
-                            qnameContextIDUnitStr = 'qname {!s}, context {}'.format(firstFact.qname, firstFact.contextID)
-                            if getattr(firstFact, 'unitID', None) is not None:
-                                qnameContextIDUnitStr += ', unit ' + firstFact.unitID
-                            self.modelXbrl.debug("debug",
-                                                 _("There are multiple facts with %(contextUnitIds)s. The first fact on line %(lineNumOfFactWeAreKeeping)s of the instance "
-                                                   "document will be rendered, and the rest at line(s) %(linesDiscarded)s will not."),
-                                                 modelObject=[firstFact] + discardedFactList, contextUnitIds=qnameContextIDUnitStr,
-                                                 lineNumOfFactWeAreKeeping=lineNumOfFactWeAreKeeping,
-                                                 linesDiscarded=', '.join(discardedLineNumberList))
+                    # group the valid facts by context in one pass, only groups of more than one fact need to be ordered
+                    # (decimals or language, then source line) to find the fact to keep and its duplicates
+                    factsByContextID = defaultdict(list)
+                    for fact in factSet:
+                        if getattr(fact, "xValid", 0) >= VALID:
+                            factsByContextID[fact.contextID].append(fact)
+                    for contextID in sorted(cid for cid, contextFacts in factsByContextID.items() if len(contextFacts) > 1):
+                        sortedFactList = sorted(factsByContextID[contextID], key=duplicateFactSortKey)
+                        i = 0
+                        while i < len(sortedFactList):
+                            firstFact = sortedFactList[i]
+                            i += 1
+                            lineNumOfFactWeAreKeeping = firstFact.sourceline
+                            discardedLineNumberList = []
+                            discardedFactList = []
+                            # finds facts with same qname, context and unit as firstFact
+                            while (i < len(sortedFactList) and
+                                   sortedFactList[i].context == firstFact.context and
+                                   sortedFactList[i].unitID == firstFact.unitID):
+                                fact = sortedFactList[i]
+                                i += 1
+                                duplicateFacts.add(fact)  # not keeping this fact
+                                discardedFactList += [fact]
+                                if hasFootnotes and footnoteRelationships.fromModelObject(fact):  # does duplicate have any footnotes?
+                                    dupFactFootnoteOrigin[fact] = firstFact  # track first fact for footnotes from duplicate
+                                discardedLineNumberList += [str(fact.sourceline)]  # these are added in sorted order by sourceline (should be an ordered set)
+
+                            if discardedFactList:
+                                # start it off because we can assume that these facts have a qname and a context
+                                qnameContextIDUnitStr = 'qname {!s}, context {}'.format(firstFact.qname, firstFact.contextID)
+                                if getattr(firstFact, 'unitID', None) is not None:
+                                    qnameContextIDUnitStr += ', unit ' + firstFact.unitID
+                                self.modelXbrl.debug("debug",
+                                                     _("There are multiple facts with %(contextUnitIds)s. The first fact on line %(lineNumOfFactWeAreKeeping)s of the instance "
+                                                       "document will be rendered, and the rest at line(s) %(linesDiscarded)s will not."),
+                                                     modelObject=[firstFact] + discardedFactList, contextUnitIds=qnameContextIDUnitStr,
+                                                     lineNumOfFactWeAreKeeping=lineNumOfFactWeAreKeeping,
+                                                     linesDiscarded=', '.join(discardedLineNumberList))
 
                 for fact in factSet:  # we only want one thing, but we don't want to pop from the set so we "loop" and then break right away
                     if getattr(fact, "xValid", 0) < VALID:
@@ -1034,7 +1043,8 @@ class Filing(object):
             report.generateRowAndOrColHeadingsGeneralCase()
         self.controller.logDebug("R{} headings {:.3f} secs.".format(cube.fileNumber, time.time() - _rStartedAt)); _rStartedAt = time.time()
 
-        report.emitRFile()
+        # the rows of an R file may be serialized as they're emitted unless it's embedded or written to excel
+        report.emitRFile(isTreeNeeded=bool(xlWriter and self.controller.hasXlout) or cube.isEmbedded)
         self.controller.logDebug("R{} emit RFile {:.3f} secs.".format(cube.fileNumber, time.time() - _rStartedAt))
 
         if xlWriter and self.controller.hasXlout:  # not (self.isRR or self.isVip or self.isN2Prospectus or self.isFeeExhibit):
@@ -1119,14 +1129,21 @@ class Filing(object):
                 else:
                     nonStatementElementsAndElementMemberPairs.update(cube.embeddingList[0].hasElementsAndElementMemberPairs)
 
-        for i, cube in filter(lambda c: not c[1].isStatementOfEquity, enumerate(statementCubesList)):
-            # initialize to all the non statement elements and non statement element member pairs
-            elementQnamesInOtherReportsAndElementQnameMemberPairs = nonStatementElementsAndElementMemberPairs.copy()
-            # now add other statements
-            for j, otherStatement in enumerate(statementCubesList):
-                if i != j:
-                    elementQnamesInOtherReportsAndElementQnameMemberPairs.update(otherStatement.embeddingList[0].hasElementsAndElementMemberPairs)
-            # now elementQnamesInOtherReportsAndElementQnameMemberPairs has all the qnames used in every other report except for the statement we're using
+        # count, for each element qname and element qname member pair, the statements having it, so that whether it is in
+        # a report other than a statement is whether it is a non statement one or counted in more statements than this one
+        statementsHavingElementsAndElementMemberPairs = Counter()
+        for cube in statementCubesList:
+            statementsHavingElementsAndElementMemberPairs.update(cube.embeddingList[0].hasElementsAndElementMemberPairs)
+
+        for cube in statementCubesList:
+            if cube.isStatementOfEquity:
+                continue
+            hasElementsAndElementMemberPairs = cube.embeddingList[0].hasElementsAndElementMemberPairs
+
+            def isInOtherReports(elementQnameOrElementQnameMemberPair):
+                return (elementQnameOrElementQnameMemberPair in nonStatementElementsAndElementMemberPairs or
+                        statementsHavingElementsAndElementMemberPairs[elementQnameOrElementQnameMemberPair] >
+                        (elementQnameOrElementQnameMemberPair in hasElementsAndElementMemberPairs))
 
             report = cube.embeddingList[0].report  # we know there's no embeddings, so the report is on the first and only embedding
             columnsToKill = []
@@ -1137,8 +1154,8 @@ class Filing(object):
                 if not col.isHidden:
                     setOfElementQnamesInCol = {fact.qname for fact in col.factList}
                     setOfElementQnamesAndQnameMemberPairsForCol = setOfElementQnamesInCol.union(col.elementQnameMemberForColHidingSet)
-                    # the operator <= means subset, not a proper subset.  so if all the facts in the column are elsewhere, then hide column.
-                    if setOfElementQnamesAndQnameMemberPairsForCol <= elementQnamesInOtherReportsAndElementQnameMemberPairs:
+                    # if all the facts in the column are elsewhere, then hide column.
+                    if all(isInOtherReports(e) for e in setOfElementQnamesAndQnameMemberPairsForCol):
                         columnsToKill += [col]
                     else:
                         elementQnamesThatWillBeKeptProvidingThatWeHideTheseCols.update(setOfElementQnamesInCol)
@@ -1147,6 +1164,9 @@ class Filing(object):
                 cube.embeddingList[0].hasElements = elementQnamesThatWillBeKeptProvidingThatWeHideTheseCols  # update hasElements, might have less now
                 # TODO: that is a bug; subsequent flow through tests the following property, not just the .hasElements property. -wch
                 cube.embeddingList[0].hasElementsAndElementMemberPairs = elementQnamesThatWillBeKeptProvidingThatWeHideTheseCols;
+                # subsequent statements' flow through is tested against this statement's kept elements
+                statementsHavingElementsAndElementMemberPairs.subtract(hasElementsAndElementMemberPairs)
+                statementsHavingElementsAndElementMemberPairs.update(elementQnamesThatWillBeKeptProvidingThatWeHideTheseCols)
                 for col in columnsToKill:
                     col.hide()
                     # print("cube {} removing col {}".format(cube.shortName,col.__dict__))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+:mod:`EdgarRenderer.FilingQueue`
+~~~~~~~~~~~~~~~~~~~
+Edgar(tm) Renderer was created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment
+are not subject to domestic copyright protection. 17 U.S.C. 105.
+"""
+
+import os, sys, select, struct, time, heapq, ctypes, ctypes.util
+from . import Utils
+
+"""
+The daemon filing queue keeps the filings folder's zip files in memory ordered oldest (mtime) first.
+On Linux it is updated from inotify events, so a zip closed after writing or moved into the filings
+folder is dequeued as soon as it arrives.  Elsewhere (or if inotify can't be initialized) the folder is
+polled, but only names not already queued are stat'ed, so a deep queue doesn't cost a stat per entry
+per poll.  Queued names may be claimed (renamed away) by other daemon workers; a dequeuer must expect
+that a popped name no longer exists.
+"""
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o0004000
+IN_CLOEXEC = 0o2000000
+inotifyEventHeader = struct.Struct("iIII")  # wd, mask, cookie, len (of null-padded name which follows)
+
+
+def openInotify(folder):
+    # returns inotify file descriptor watching folder for arriving files, or None if inotify is not available
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(folder), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+class FilingQueue(object):
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.heap = []  # (mtime, file) of queued zip files
+        self.queued = set()
+        self.inotifyFd = openInotify(folder)
+        self.rescan()
+
+    @property
+    def isEventDriven(self):
+        return self.inotifyFd is not None
+
+    def add(self, file):
+        if file not in self.queued and Utils.isZipFilename(file):
+            try:
+                mtime = os.stat(os.path.join(self.folder, file)).st_mtime
+            except OSError:
+                return  # already removed or claimed by another worker
+            heapq.heappush(self.heap, (mtime, file))
+            self.queued.add(file)
+
+    def rescan(self):
+        # catch up with the folder, stat'ing only names which aren't already queued
+        for file in os.listdir(self.folder):
+            self.add(file)
+
+    def pop(self):
+        # oldest queued file name, or None if queue is empty
+        if self.heap:
+            mtime, file = heapq.heappop(self.heap)
+            self.queued.discard(file)
+            return file
+        return None
+
+    def wait(self, timeout):
+        # wait up to timeout seconds for files to arrive; inotify returns as soon as a file arrives
+        if self.inotifyFd is None:
+            time.sleep(timeout)
+            self.rescan()
+            return
+        readable = select.select([self.inotifyFd], [], [], timeout)[0]
+        if not readable:
+            self.rescan()  # safety net for events not delivered (e.g., network file systems)
+            return
+        try:
+            data = os.read(self.inotifyFd, 65536)
+        except BlockingIOError:
+            return
+        i = 0
+        while i + inotifyEventHeader.size <= len(data):
+            wd, mask, cookie, nameLen = inotifyEventHeader.unpack_from(data, i)
+            i += inotifyEventHeader.size
+            name = os.fsdecode(data[i:i + nameLen].rstrip(b"\0"))
+            i += nameLen
+            if mask & IN_Q_OVERFLOW:
+                self.rescan()
+            elif name:
+                self.add(name)
+
+    def close(self):
+        if self.inotifyFd is not None:
+            os.close(self.inotifyFd)
+            self.inotifyFd = None
+        self.heap.clear()
+        self.queued.clear()
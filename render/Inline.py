@@ -19,7 +19,7 @@ from arelle.UrlUtil import isHttpUrl
 from arelle.ValidateFilingText import CDATApattern
 from arelle.XbrlConst import standardLabel, documentationLabel, terseLabel
 from arelle.XmlValidateConst import VALID
-import os, zipfile, io
+import os, io
 from optparse import SUPPRESS_HELP
 from lxml.etree import XML, XMLSyntaxError
 from collections import defaultdict
@@ -66,9 +66,9 @@ def saveTargetDocumentIfNeeded(cntlr, options, modelXbrl, filing, suffix="_htm."
         targetFilename = os.path.basename(targetFilename)
         if cntlr.reportZip:
             zipStream = io.BytesIO()
-            filingZip = zipfile.ZipFile(zipStream, 'w', zipfile.ZIP_DEFLATED, True)
+            filingZip = cntlr.openOutputZip(zipStream, 'w')
         elif cntlr.reportsFolder is not None and saveTargetPath:
-            filingZip = zipfile.ZipFile(saveTargetPath, mode='w', compression=zipfile.ZIP_DEFLATED, allowZip64=False)
+            filingZip = cntlr.openOutputZip(saveTargetPath, 'w', allowZip64=False)
 
         filingFiles = set()
 
@@ -10,10 +10,13 @@ are not subject to domestic copyright protection. 17 U.S.C. 105.
 from os import getpid, remove, makedirs, listdir  # , getenv
 from os.path import basename, isfile, abspath, isdir, dirname, exists, join, splitext, normpath
 from io import IOBase
-import json, shutil, sys, datetime, os, zipfile
+import json, shutil, sys, datetime, os, zipfile, tempfile, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import regex as re
 import arelle.XbrlConst
 from lxml.etree import tostring as treeToString
+from arelle.PluginManager import pluginClassMethods
 from . import Utils
 
 jsonIndent = 1  # None for most compact, 0 for left aligned
@@ -68,6 +71,166 @@ def writeHtmlDoc(filing, root, reportZip, reportFolder, filename, zipDir=""):
         filing.writeFile(os.path.join(reportFolder, filename), htmlText)
 
 
+def zipHasMember(zf, name):
+    # constant time member check of a zip being written or read (namelist() builds a new list on each call)
+    if hasattr(zf, "hasMember"):  # validate's report zip, including members pending deflate
+        return zf.hasMember(name)
+    return name in zf.NameToInfo
+
+
+def zipWriteFileObject(zf, name, fileObj):
+    # write a member from a file object in chunks, opened by name so it has the zip's compression and level (and, for
+    # validate's report zip, is stored when already compressed media)
+    try:
+        position = fileObj.tell()
+        size = fileObj.seek(0, 2) - position
+        fileObj.seek(position)
+        force_zip64 = size * 1.05 > zipfile.ZIP64_LIMIT  # as zipfile decides for a member of known size
+    except (AttributeError, OSError, ValueError):  # not seekable
+        force_zip64 = True
+    with zf.open(name, 'w', force_zip64=force_zip64) as dest:
+        shutil.copyfileobj(fileObj, dest, 1024 * 1024)
+
+
+class OutputArchive(object):
+    # a zip archive built in a spooled temporary file (in memory only while small) which tracks its member names
+    # in a set, and is then streamed to its destination, a member of another zip or a file
+
+    spoolMaxSize = 16 * 1024 * 1024
+
+    def __init__(self, openZip=None):
+        # openZip(stream, mode) opens the archive as the filing's report zip is opened (deflate level and threads)
+        self.stream = tempfile.SpooledTemporaryFile(max_size=self.spoolMaxSize)
+        if openZip is not None:
+            self.zip = openZip(self.stream, 'w')
+        else:
+            self.zip = zipfile.ZipFile(self.stream, 'w', zipfile.ZIP_DEFLATED, True)
+        self.names = set()
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def writestr(self, name, data):
+        self.zip.writestr(name, data)
+        self.names.add(name)
+
+    def writeFileObject(self, name, fileObj):
+        zipWriteFileObject(self.zip, name, fileObj)
+        self.names.add(name)
+
+    def saveToZip(self, zf, name):
+        self.zip.close()
+        self.stream.seek(0)
+        zipWriteFileObject(zf, name, self.stream)
+        self.stream.close()
+
+    def saveToFile(self, filing, filepath):
+        self.zip.close()
+        self.stream.seek(0)
+        if any(True for pluginXbrlMethod in pluginClassMethods("Security.Crypt.Write")):
+            filing.writeFile(filepath, self.stream.read())  # writer plugin requires the data
+        else:
+            with open(filepath, "wb") as fh:
+                shutil.copyfileobj(self.stream, fh, 1024 * 1024)
+        self.stream.close()
+
+
+class SpooledTransformCache(object):
+    # transformed R file html by key, kept in a spooled temporary file (in memory only while small) so a large filing
+    # doesn't hold every first pass R file's html in memory until the dissemination pass.  An entry is released when
+    # popped.  Entries are stored and popped by emitter pool threads.
+
+    spoolMaxSize = 16 * 1024 * 1024
+
+    def __init__(self):
+        self.stream = tempfile.SpooledTemporaryFile(max_size=self.spoolMaxSize)
+        self.extents = {}  # by key, (offset, length) of its html in stream
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.extents)
+
+    def __setitem__(self, key, htmlText):
+        with self.lock:
+            offset = self.stream.seek(0, 2)
+            self.stream.write(htmlText)
+            self.extents[key] = (offset, len(htmlText))
+
+    def pop(self, key, default=None):
+        with self.lock:
+            extent = self.extents.pop(key, None)
+            if extent is None:
+                return default
+            self.stream.seek(extent[0])
+            return self.stream.read(extent[1])
+
+    def close(self):
+        self.extents.clear()
+        self.stream.close()
+
+
+class ReportEmitter(object):
+    # R files are transformed and serialized by a bounded pool of threads (lxml releases the GIL while transforming
+    # and serializing) while the main thread lays out the next report.  Outputs are written by the main thread in the
+    # order emitted, so files and zip entries are the same as when written serially.  An output which fails to be
+    # produced or written doesn't stop the others, close() raises the first failure, naming its output.
+
+    def __init__(self, numThreads):
+        numThreads = int(numThreads or 0)
+        if numThreads <= 0:
+            numThreads = min(4, os.cpu_count() or 1)
+        self.executor = ThreadPoolExecutor(numThreads, thread_name_prefix="EdgarRendererEmitter") if numThreads > 1 else None
+        self.maxPending = 2 * numThreads  # bounds the report trees held in memory awaiting transform
+        self.pending = deque()  # (future, writer, output name) in order emitted
+        self.failures = []  # (output name, exception) of outputs not written
+
+    def emit(self, produce, write, name):
+        # produce() runs on a pool thread (it must not modify shared state), write(result) runs on the main thread
+        if self.executor is None:
+            self.write(lambda: write(produce()), name)
+            return
+        self.pending.append((self.executor.submit(produce), write, name))
+        self.writeCompleted(self.maxPending)
+
+    def emitWrite(self, write, name):
+        # write of an output produced on the main thread, ordered after any pending emitted outputs
+        if not self.pending:
+            self.write(lambda: write(None), name)
+        else:
+            self.pending.append((None, write, name))
+
+    def writeCompleted(self, maxPending):
+        # write completed outputs in emitted order, waiting for outputs while more than maxPending are pending
+        while self.pending:
+            future, write, name = self.pending[0]
+            if future is not None and not future.done() and len(self.pending) <= maxPending:
+                break
+            self.pending.popleft()
+            self.write(lambda: write(future.result() if future is not None else None), name)
+
+    def write(self, produceAndWrite, name):
+        try:
+            produceAndWrite()
+        except Exception as err:  # raised by close, after the other outputs are written
+            self.failures.append((name, err))
+
+    def close(self):
+        # writes outputs still pending, then raises the first failure of any output
+        try:
+            self.writeCompleted(0)
+        finally:
+            self.pending.clear()
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+        if self.failures:
+            name, err = self.failures[0]
+            numOthers = len(self.failures) - 1
+            self.failures = []
+            raise RuntimeError("{} was not written{}: {}".format(
+                name, " (nor {} other outputs)".format(numOthers) if numOthers else "", err)) from err
+
+
 def writeJsonDoc(lines, pathOrStream, sort_keys=True):
     if isinstance(pathOrStream, str):
         with open(pathOrStream, mode='w') as f:
@@ -78,7 +241,7 @@ def writeJsonDoc(lines, pathOrStream, sort_keys=True):
 
 def moveToZip(zf, abspath, zippath):
     if isfile(abspath) and not isFileHidden(abspath):
-        zf.write(abspath, zippath, zipfile.ZIP_DEFLATED)
+        zf.write(abspath, zippath)  # with the zip's compression
         remove(abspath)
 
 
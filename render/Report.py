@@ -13,16 +13,18 @@ from matplotlib import use as matplotlib_use
 # must initialize matplotlib to not use tkinter or $DISPLAY (before other imports)
 matplotlib_use("Agg")
 
-import os, datetime, decimal, io, time
+import os, datetime, decimal, io, time, hashlib
 import regex as re
-from collections import defaultdict
-from lxml.etree import Element, SubElement, XSLT, tostring as treeToString, fromstring
+from collections import defaultdict, deque
+from lxml.etree import Element, SubElement, ProcessingInstruction, XSLT, tostring as treeToString, fromstring
 import arelle.XbrlConst
 from . import Utils
 Filing = None
 from arelle.XbrlConst import qnIXbrl11Hidden
 
 xlinkRole = '{' + arelle.XbrlConst.xlink + '}role'  # constant belongs in XbrlConsts`headingList
+maxTransformedCells = 50000  # R files with more cells (including embedded reports' cells) are not transformed to html
+streamedRowsTarget = 'EdgarRendererStreamedRows'  # processing instruction in Rows replaced by the serialized rows
 
 
 class Report(object):
@@ -53,6 +55,11 @@ class Report(object):
         self.rootETree = Element('InstanceReport', nsmap={'xsi': 'http://www.w3.org/2001/XMLSchema-instance'})
         self.columnsETree = SubElement(self.rootETree, 'Columns')  # children added later
         self.rowsETree = SubElement(self.rootETree, 'Rows')  # children added later
+        self.streamedRows = None  # serialized rows, when rows are serialized as emitted instead of kept in rowsETree
+
+        self.numColumnsEmitted = 0
+        self.numRowsEmitted = 0
+        self.numCellsEmitted = 0  # including cells of embedded reports
 
         self.shortName = self.cube.shortName  # each Report can edit its own shortName
 
@@ -380,22 +387,23 @@ class Report(object):
         else:
             unitsAxisOnRowsOrCols = self.embedding.columnUnitPosition != -1
 
-        tempRowOrColList = sorted(rowOrColList, key=lambda thing: thing.coordinateListWithoutUnitPeriod)
+        occupancies = {}  # by row or col, bitset of its occupied cells, for doVectorsOverlap
+        tempRowOrColList = deque(sorted(rowOrColList, key=lambda thing: thing.coordinateListWithoutUnitPeriod))
         while len(tempRowOrColList) > 0:
 
             previousCoordinateListWithoutPeriodAndUnit = tempRowOrColList[0].coordinateListWithoutUnitPeriod
             instantRowOrColList = []
             durationRowOrColList = []
             while len(tempRowOrColList) > 0 and previousCoordinateListWithoutPeriodAndUnit == tempRowOrColList[0].coordinateListWithoutUnitPeriod:
-                rowOrCol = tempRowOrColList.pop(0)
+                rowOrCol = tempRowOrColList.popleft()
                 if not rowOrCol.isHidden and rowOrCol.startEndContext is not None:
                     if rowOrCol.startEndContext.periodTypeStr == 'instant':
                         instantRowOrColList += [rowOrCol]
                     else:
                         durationRowOrColList += [rowOrCol]
 
-            instantRowOrColList.sort (key=lambda thing: thing.startEndContext.endTime)
-            durationRowOrColList.sort(key=lambda thing: thing.startEndContext.endTime)
+            instantRowOrColList = deque(sorted(instantRowOrColList, key=lambda thing: thing.startEndContext.endTime))
+            durationRowOrColList = deque(sorted(durationRowOrColList, key=lambda thing: thing.startEndContext.endTime))
 
             while len(instantRowOrColList) > 0 and len(durationRowOrColList) > 0:
                 instantRowOrCol = instantRowOrColList[0]
@@ -403,26 +411,55 @@ class Report(object):
 
                 # compare instants to durations.  if not equal, throw one away and try again, else continue
                 if   instantRowOrCol.startEndContext.endTime < durationRowOrCol.startEndContext.endTime:
-                    del instantRowOrColList[0]
+                    instantRowOrColList.popleft()
                 elif instantRowOrCol.startEndContext.endTime > durationRowOrCol.startEndContext.endTime:
-                    del durationRowOrColList[0]
+                    durationRowOrColList.popleft()
 
                 else:
                     # if we're doing the rows and units isn't on the rows (and vice versa), we don't check unit compatibility,
                     # otherwise we need the units to be compatible. Also make sure the vectors don't overlap.
                     if      ((not unitsAxisOnRowsOrCols or self.areFactsCompatableByUnits(instantRowOrCol, durationRowOrCol)) and
-                             not self.doVectorsOverlap([instantRowOrCol, durationRowOrCol], rowOrColStr)):
+                             not self.doVectorsOverlap([instantRowOrCol, durationRowOrCol], rowOrColStr, occupancies)):
                         self.deepCopyRowsOrCols(rowOrColStr, durationRowOrCol, instantRowOrCol)
-                    del durationRowOrColList[0]
-
-    def doVectorsOverlap(self, rowsOrCols, rowOrColStr):
-        # zip takes multiple lists and zips them together and gives you tuples. the star character basically takes a list or
-        # set of lists and makes each one an argument for zip(). The lists here are basically lists of true/false values,
-        # where true means that the cell is occupied and false means it's empty. then i do some boolean math and since True == 1,
-        # and false == 0, you can sum the tuple that zip provides and if the sum is greater than 1, you know that you that
-        # for some position the vectors overlap, so you can't combine them.
-        z = zip(*[[cell is not None for cell in self.generateCellVector(rowOrColStr, rowOrCol.index)[1]] for rowOrCol in rowsOrCols])
-        return any(sum(trueFalseTuple) > 1 for trueFalseTuple in z)
+                        occupancies.pop(durationRowOrCol, None)  # has the instant's cells now
+                    durationRowOrColList.popleft()
+
+    def occupancy(self, rowOrColStr, rowOrCol):
+        # bitset (as an int) of the cells of rowOrCol's vector (see generateCellVector) which are occupied, that is, bit i
+        # is set when the i-th non-hidden col (of a row) or row (of a col) has a cell for a fact.
+        occupied = 0
+        bit = 1
+        if rowOrColStr == 'col':
+            index = rowOrCol.index
+            for row in self.rowList:
+                if not row.isHidden:
+                    if row.cellList[index] is not None:
+                        occupied |= bit
+                    bit <<= 1
+        else:
+            for cell, col in zip(rowOrCol.cellList, self.colList):
+                if not col.isHidden:
+                    if cell is not None:
+                        occupied |= bit
+                    bit <<= 1
+        return occupied
+
+    def doVectorsOverlap(self, rowsOrCols, rowOrColStr, occupancies=None):
+        # the vectors overlap if for some position more than one of them has a cell, so they can't be combined.  the
+        # occupancy bitsets of the vectors are and'ed, occupancies (if provided) keeps them for the rest of the instants into
+        # durations merge pass, where a vector is compared again with the next one.
+        occupied = 0
+        for rowOrCol in rowsOrCols:
+            if occupancies is None:
+                rowOrColOccupancy = self.occupancy(rowOrColStr, rowOrCol)
+            else:
+                rowOrColOccupancy = occupancies.get(rowOrCol)
+                if rowOrColOccupancy is None:
+                    rowOrColOccupancy = occupancies[rowOrCol] = self.occupancy(rowOrColStr, rowOrCol)
+            if occupied & rowOrColOccupancy:
+                return True
+            occupied |= rowOrColOccupancy
+        return False
 
     def areFactsCompatableByUnits(self, colOrRowToBeMerged, colOrRowToBeMergedInto):
         colOrRowToBeMergedMonetaryUnitSet = {fact.unit for fact in (colOrRowToBeMerged.unitTypeToFactSetDefaultDict.get('monetaryDerivedType') or [])}
@@ -449,37 +486,39 @@ class Report(object):
 
             if mergeCell is not None:  # do a deep copy
                 fact = mergeCell.fact
-                preferredLabel = mergeCell.preferredLabel
                 if fact.unit is not None:  # update unitTypeToFactSetDefaultDict with new cell
                     self.updateUnitTypeToFactSetDefaultDict(fact, mergeIntoThisRowOrCol)
 
                 if rowOrColStr == 'col':
                     row = self.rowList[i]
                     col = mergeIntoThisRowOrCol
-                    mergeIntoThisCell = row.cellList[col.index] = Cell(self.filing, row, col, col.index, fact=fact, preferredLabel=preferredLabel)
+                    row.cellList[col.index] = mergeCell.copyTo(row, col, col.index)
                 else:
                     row = mergeIntoThisRowOrCol
                     col = self.colList[i]
-                    mergeIntoThisCell = row.cellList[i] = Cell(self.filing, row, col, i, fact=fact, preferredLabel=preferredLabel)
-
-                mergeIntoThisCell.currencySymbol = mergeCell.currencySymbol
-                mergeIntoThisCell.currencyCode = mergeCell.currencyCode
-                mergeIntoThisCell.unitID = mergeCell.unitID
-                mergeIntoThisCell.showCurrencySymbol = mergeCell.showCurrencySymbol
+                    row.cellList[i] = mergeCell.copyTo(row, col, i)
         mergeRowOrCol.hide()
         mergeIntoThisRowOrCol.factList += mergeRowOrCol.factList
 
     def hideRedundantColumns(self):
-        factSets = {}
+        # a visible column is redundant if its facts are all in another visible column.  columns are grouped by their
+        # set of facts, the first column of a set is kept unless the set is a subset of another column's set.
+        colsByFactSet = {}
         for col in self.colList:
             if not col.isHidden:
-                factSets[col] = set(col.factList)  # fact objects are unique and not copied.
-        for col1, facts1 in factSets.items():
-            if not col1.isHidden:
-                for col2, facts2 in factSets.items():
-                    if not col1 is col2 and not col2.isHidden:
-                        if facts2.issubset(facts1):
-                            col2.hide()
+                colsByFactSet.setdefault(frozenset(col.factList), []).append(col)  # fact objects are unique and not copied.
+        factSetsByFact = defaultdict(list)
+        for factSet in colsByFactSet:
+            for fact in factSet:
+                factSetsByFact[fact].append(factSet)
+        for factSet, cols in colsByFactSet.items():
+            if factSet: # any other set with all of its facts has at least the sets having its least used fact
+                candidates = min((factSetsByFact[fact] for fact in factSet), key=len)
+                isSubset = any(otherSet is not factSet and factSet < otherSet for otherSet in candidates)
+            else:
+                isSubset = len(colsByFactSet) > 1
+            for col in (cols if isSubset else cols[1:]):
+                col.hide()
 
     def updateUnitTypeToFactSetDefaultDict(self, fact, rowOrCol):
         if fact.concept.isMonetary:
@@ -664,7 +703,7 @@ class Report(object):
 
             row = self.rowList[counter]
             if      (not row.isHidden and
-                     (prevRow == None or vars(row)[coordinateList] != vars(prevRow)[coordinateList])):
+                     (prevRow == None or getattr(row, coordinateList) != getattr(prevRow, coordinateList))):
 
                 prevRow = self.rowList[counter]
 
@@ -935,10 +974,16 @@ class Report(object):
                         thisRow.hide()
         del mergeableRows
 
-    def emitRFile(self):
+    def emitRFile(self, isTreeNeeded=True):
         # we emit the cols and rows first and then plug them into the header and footer later.
         # this is because there are side effects of the col and row processing that the header and footer depend on.
         self.emitRFileCols()
+        # when nothing but the xml file needs the rows (not embedded, no excel, no html transform of the tree),
+        # each row is serialized as it's emitted and dropped, so a huge report doesn't keep its whole tree.
+        if not isTreeNeeded and self.filing.reportXmlFormat and (
+                not self.filing.reportHtmlFormat or
+                self.numColumnsEmitted * sum(not row.isHidden for row in self.rowList) > maxTransformedCells):
+            self.streamedRows = []
         self.emitRFileRows()
         self.emitRFileHeaderAndFooter()
 
@@ -946,11 +991,23 @@ class Report(object):
         for index, col in enumerate(self.colList):
             if not col.isHidden:
                 col.emitColumn(index)
+                self.numColumnsEmitted += 1
 
     def emitRFileRows(self):
+        if self.streamedRows is not None:
+            streamETree = Element('InstanceReport', nsmap=self.rootETree.nsmap)
+            streamRowsETree = SubElement(streamETree, 'Rows')
         for index, row in enumerate(self.rowList):
             if not row.isHidden:
-                row.emitRow(index)
+                rowETree = row.emitRow(index)
+                self.numRowsEmitted += 1
+                self.numCellsEmitted += self.numColumnsEmitted  # a cell per emitted column
+                if self.streamedRows is not None:
+                    # serialized at the same depth as in the R file, so its pretty printing is the same
+                    streamRowsETree.append(rowETree)
+                    rowsText = treeToString(streamETree, encoding='utf-8', pretty_print=True)
+                    self.streamedRows.append(rowsText[rowsText.index(b'<Rows>\n') + 7:rowsText.rindex(b'  </Rows>')])
+                    streamRowsETree.remove(rowETree)
 
     def emitRFileHeaderAndFooter(self):
         SubElement(self.rootETree, 'Version').text = self.filing.controller.VERSION
@@ -967,6 +1024,8 @@ class Report(object):
         SubElement(self.rootETree, 'HasEmbeddedReports').text = str(self.hasEmbeddedReports).casefold()
 
         self.rootETree.append(self.columnsETree)
+        if self.streamedRows:
+            self.rowsETree.append(ProcessingInstruction(streamedRowsTarget))  # placeholder for the serialized rows
         self.rootETree.append(self.rowsETree)
 
         footnotes = SubElement(self.rootETree, 'Footnotes')
@@ -990,8 +1049,8 @@ class Report(object):
         SubElement(self.rootETree, 'IsMultiCurrency').text = 'false'
         SubElement(self.rootETree, 'ReportType').text = 'Sheet'
         SubElement(self.rootETree, 'RoleURI').text = self.cube.linkroleUri
-        SubElement(self.rootETree, 'NumberOfCols').text = str(int(self.rootETree.xpath('count(/InstanceReport/Columns/Column)')))
-        SubElement(self.rootETree, 'NumberOfRows').text = str(int(self.rootETree.xpath('count(/InstanceReport/Rows/Row)')))
+        SubElement(self.rootETree, 'NumberOfCols').text = str(self.numColumnsEmitted)
+        SubElement(self.rootETree, 'NumberOfRows').text = str(self.numRowsEmitted)
 
     def emitContextRef(self, mcuETree, factAxisMemberList, context):
         contextRefETree = SubElement(mcuETree, 'contextRef')
@@ -1106,45 +1165,102 @@ class Report(object):
     def writeXmlFile(self, baseNameBeforeExtension, tree, reportSummary):
         baseName = (self.filing.rFilePrefix or '') + baseNameBeforeExtension + '.xml' + (self.filing.suplSuffix or '')
         reportSummary.xmlFileName = baseName
-        xmlText = treeToString(tree, xml_declaration=True, encoding='utf-8', pretty_print=True)
-        if self.filing.reportZip:
-            self.filing.reportZip.writestr(self.filing.zipDir + baseName, xmlText)
-            self.controller.renderedFiles.add(baseName)
-        elif self.filing.fileNameBase is not None:
-            self.controller.writeFile(os.path.join(self.filing.fileNameBase, baseName), xmlText)
-            self.controller.renderedFiles.add(baseName)
+        filing = self.filing
+        controller = self.controller  # report may be garbage collected before its files are written
+        streamedRows = self.streamedRows
+
+        def serialize():
+            xmlText = treeToString(tree, xml_declaration=True, encoding='utf-8', pretty_print=True)
+            if streamedRows:  # replace the placeholder's line, the serialized rows are indented and end lines
+                placeholder = treeToString(ProcessingInstruction(streamedRowsTarget))
+                if xmlText.count(placeholder) != 1:
+                    raise RuntimeError("placeholder of {} serialized rows not found".format(len(streamedRows)))
+                i = xmlText.index(placeholder)
+                xmlText = b''.join([xmlText[:xmlText.rindex(b'\n', 0, i) + 1]] + streamedRows + [xmlText[xmlText.index(b'\n', i) + 1:]])
+            return xmlText
+
+        def write(xmlText):
+            if filing.reportZip:
+                filing.reportZip.writestr(filing.zipDir + baseName, xmlText)
+                controller.renderedFiles.add(baseName)
+            elif filing.fileNameBase is not None:
+                controller.writeFile(os.path.join(filing.fileNameBase, baseName), xmlText)
+                controller.renderedFiles.add(baseName)
+        filing.reportEmitter.emit(serialize, write, baseName)
 
     def writeHtmlFile(self, baseNameBeforeExtension, tree, reportSummary):
         baseName = (self.filing.rFilePrefix or '') + baseNameBeforeExtension + '.htm' + (self.filing.suplSuffix or '')
         reportSummary.htmlFileName = baseName
-        _startedAt = time.time()
-        cell_count = sum(1 for x in tree.iter('Cell'))
-        if cell_count > 50000:
-            self.controller.logWarn(f"There are {cell_count} cells; skipping transformation.",
-                                    messageCode="EXG.rendering.tooManyCells")
-            result = fromstring("<HTML><HEAD><TITLE>NOPE</TITLE></HEAD><BODY>Not available</BODY></HTML>")
-        else:
-            keywordArgs = { "asPage": XSLT.strparam("true") }
-            if getattr(self.embedding, "disclaimer", None) and getattr(self.embedding, "disclaimerStyle", None):
-                keywordArgs["disclaimer"] = XSLT.strparam(self.embedding.disclaimer)
-                keywordArgs["disclaimerStyle"] = XSLT.strparam(self.embedding.disclaimerStyle)
-            result = self.filing.transform(tree, **keywordArgs)
-        htmlText = treeToString(result, method='html', with_tail=False, pretty_print=True, encoding='us-ascii')
-        if self.filing.reportZip:
-            self.filing.reportZip.writestr(self.filing.zipDir + baseName, htmlText)
-            self.controller.renderedFiles.add(baseName)
-        elif self.filing.fileNameBase is not None:
-            self.controller.writeFile(os.path.join(self.filing.fileNameBase, baseName), htmlText)
-            self.controller.renderedFiles.add(baseName)
-        if self.filing.altTransform is not None and cell_count <= 50000:
+        filing = self.filing
+        controller = self.controller  # report and cube may be garbage collected before the transform completes
+        fileNumber = self.cube.fileNumber
+        cell_count = self.numCellsEmitted
+        xsltParams = {"asPage": "true"}
+        if cell_count > maxTransformedCells:
+            controller.logWarn(f"There are {cell_count} cells; skipping transformation.",
+                               messageCode="EXG.rendering.tooManyCells")
+        elif getattr(self.embedding, "disclaimer", None) and getattr(self.embedding, "disclaimerStyle", None):
+            xsltParams["disclaimer"] = self.embedding.disclaimer
+            xsltParams["disclaimerStyle"] = self.embedding.disclaimerStyle
+        keywordArgs = dict((name, XSLT.strparam(value)) for name, value in xsltParams.items())
+        altBaseName = None
+        if filing.altTransform is not None and cell_count <= maxTransformedCells:
             # secondary output for workstation
-            baseName = baseNameBeforeExtension + '.htm' + (self.filing.altSuffix or '')
-            reportSummary.htmlFileName = baseName
-            result = self.filing.altTransform(tree, **keywordArgs)
-            htmlText = treeToString(result, method='html', with_tail=False, pretty_print=True, encoding='us-ascii')
-            self.controller.writeFile(os.path.join(self.filing.altFolder, baseName), htmlText)
-            self.controller.renderedFiles.add(baseName)
-        self.controller.logDebug("R{} htm XSLT {:.3f} secs.".format(self.cube.fileNumber, time.time() - _startedAt))
+            altBaseName = baseNameBeforeExtension + '.htm' + (filing.altSuffix or '')
+            reportSummary.htmlFileName = altBaseName
+        transformCache = filing.transformCache
+        cachedTransform = filing.cachedTransform
+        isTransformCacheFilling = filing.isTransformCacheFilling
+        if transformCache is not None and not (cachedTransform is filing.transform or
+                                               (altBaseName is not None and cachedTransform is filing.altTransform)):
+            transformCache = None  # neither of this R file's transforms is cached, its tree needn't be digested
+
+        def transformToHtml(xslt, treeDigest, lookups):
+            # when rendering private data, an R file tree of the dissemination pass identical to one of the first pass
+            # (e.g., a report without redacted facts) reuses the first pass html
+            key = (treeDigest, tuple(sorted(xsltParams.items()))) if treeDigest and xslt is cachedTransform else None
+            if key and not isTransformCacheFilling:
+                htmlText = transformCache.pop(key, None)
+                lookups.append(htmlText is not None)
+                if htmlText is not None:
+                    return htmlText
+            htmlText = treeToString(xslt(tree, **keywordArgs), method='html', with_tail=False, pretty_print=True, encoding='us-ascii')
+            if key and isTransformCacheFilling:
+                transformCache[key] = htmlText
+            return htmlText
+
+        def transform():  # runs on an emitter thread, tree is no longer modified
+            _startedAt = time.time()
+            lookups = []  # True for each reused transform
+            if cell_count > maxTransformedCells:
+                result = fromstring("<HTML><HEAD><TITLE>NOPE</TITLE></HEAD><BODY>Not available</BODY></HTML>")
+                htmlText = treeToString(result, method='html', with_tail=False, pretty_print=True, encoding='us-ascii')
+                treeDigest = None
+            else:
+                treeDigest = hashlib.sha256(treeToString(tree)).digest() if transformCache is not None else None
+                htmlText = transformToHtml(filing.transform, treeDigest, lookups)
+            altHtmlText = None
+            if altBaseName is not None:
+                altHtmlText = transformToHtml(filing.altTransform, treeDigest, lookups)
+            return htmlText, altHtmlText, lookups, time.time() - _startedAt
+
+        def write(transformed):
+            htmlText, altHtmlText, lookups, secs = transformed
+            numReused = sum(lookups)
+            if filing.reportZip:
+                filing.reportZip.writestr(filing.zipDir + baseName, htmlText)
+                controller.renderedFiles.add(baseName)
+            elif filing.fileNameBase is not None:
+                controller.writeFile(os.path.join(filing.fileNameBase, baseName), htmlText)
+                controller.renderedFiles.add(baseName)
+            if altHtmlText is not None:
+                controller.writeFile(os.path.join(filing.altFolder, altBaseName), altHtmlText)
+                controller.renderedFiles.add(altBaseName)
+            if lookups:
+                controller.rFileTransformLookups += len(lookups)
+                controller.rFileTransformsReused += numReused
+            controller.logDebug("R{} htm XSLT {:.3f} secs{}.".format(fileNumber, secs, ", reused" if numReused else ""))
+        filing.reportEmitter.emit(transform, write, baseName)
 
     def generateBarChart(self):
         # change rendering guide bar chart documentation
@@ -1278,6 +1394,14 @@ class Report(object):
 
 class Row(object):
 
+    __slots__ = ('filing', 'report', 'index', 'factAxisMemberGroup', 'coordinateList',
+                 'coordinateListWithoutPrimary', 'coordinateListWithoutUnit',
+                 'coordinateListWithoutUnitPeriod', 'coordinateListWithoutUnitPeriodPrimary',
+                 'coordinateListWithoutUnitPrimary', 'headingList', 'axisInSegmentTitleHeaderBoolList',
+                 'isSegmentTitle', 'IsCalendarTitle', 'IsAbstractGroupTitle', 'factList', 'level',
+                 'cellList', 'footnoteNumberSet', 'originalElementQname', 'elementQnameStr',
+                 'preferredLabel', 'isHidden', 'startEndContext', 'context', 'unitTypeToFactSetDefaultDict')
+
     # note that grouped has been removed
     #===========================================================================
     # def __init__(self, filing, report, startEndContext=None, index=None, factAxisMemberGroup=None,
@@ -1311,7 +1435,7 @@ class Row(object):
         self.IsAbstractGroupTitle = IsAbstractGroupTitle
         self.factList = []
         self.level = level
-        self.cellList = [None for ignore in range(report.numColumns)]
+        self.cellList = [None] * report.numColumns
         self.footnoteNumberSet = set()
         self.originalElementQname = elementQname
 
@@ -1397,6 +1521,7 @@ class Row(object):
                 else:  # write a non-empty cell
                     cell.emitCell(cellsETree)
         self.emitRowFooter(rowETree)
+        return rowETree
 
     def emitRowHeader(self, rowETree, index):
         SubElement(rowETree, 'Id').text = str(index + 1)
@@ -1527,6 +1652,11 @@ class Row(object):
 
 class Column(object):
 
+    __slots__ = ('filing', 'report', 'index', 'factAxisMemberGroup', 'coordinateList',
+                 'coordinateListWithoutUnit', 'coordinateListWithoutUnitPeriod', 'footnoteNumberSet',
+                 'isHidden', 'headingList', 'factList', 'elementQnameMemberForColHidingSet', 'context',
+                 'startEndContext', 'unitTypeToFactSetDefaultDict', 'preferredLabel')
+
     def __init__(self, filing, report, startEndContext, factAxisMemberGroup, coordinateList, coordinateListWithoutUnit, coordinateListWithoutUnitPeriod):
         self.filing = filing
         self.report = report
@@ -1612,6 +1742,10 @@ class Column(object):
 
 class Cell(object):
 
+    __slots__ = ('filing', 'row', 'column', 'index', 'fact', 'footnoteNumberSet', 'scalingFactor',
+                 'quantum', 'NonNumericText', 'preferredLabel', 'currencyCode', 'unitID', 'currencySymbol',
+                 'showCurrencySymbol')
+
     def __init__(self, filing, row, column, index, fact=None, preferredLabel=None, NonNumericText=''):
         self.filing = filing
         self.row = row
@@ -1654,6 +1788,26 @@ class Cell(object):
             self.currencySymbol = None
             self.showCurrencySymbol = False
 
+    def copyTo(self, row, column, index):
+        # copy of this cell for its fact (and currency, unit and preferred label) in another row and column, when
+        # merging rows or columns, without recomputing the fact's currency and unit symbols
+        cell = Cell.__new__(Cell)
+        cell.filing = self.filing
+        cell.row = row
+        cell.column = column
+        cell.index = index + 1
+        cell.fact = self.fact
+        cell.footnoteNumberSet = set()
+        cell.scalingFactor = None
+        cell.quantum = 0
+        cell.NonNumericText = ''
+        cell.preferredLabel = self.preferredLabel
+        cell.currencyCode = self.currencyCode
+        cell.unitID = self.unitID
+        cell.currencySymbol = self.currencySymbol
+        cell.showCurrencySymbol = self.showCurrencySymbol
+        return cell
+
     def emitCell(self, cellsETree):
         fact = self.fact
         report = self.row.report
@@ -1805,11 +1959,15 @@ class Cell(object):
                     file = io.BytesIO()
                     self.filing.controller.renderedFiles.add(pngname)
                     fig.savefig(file, bbox_inches='tight', dpi=150)
-                    file.seek(0)
-                    if self.filing.reportZip:
-                        self.filing.reportZip.writestr(self.filing.zipDir + pngname, file.read())
-                    else:
-                        self.filing.controller.writeFile(os.path.join(self.filing.fileNameBase, pngname), file.read())
+                    filing = self.filing
+                    pngBytes = file.getvalue()
+
+                    def write(_ignored):  # after any R files emitted before this bar chart
+                        if filing.reportZip:
+                            filing.reportZip.writestr(filing.zipDir + pngname, pngBytes)
+                        else:
+                            filing.controller.writeFile(os.path.join(filing.fileNameBase, pngname), pngBytes)
+                    filing.reportEmitter.emitWrite(write, pngname)
                     file.close()
                     del file  # dereference
                 from matplotlib import pyplot
@@ -1825,6 +1983,7 @@ class Cell(object):
         SubElement(EmbeddedReport, 'IsTransposed').text = str(self.row.report.cube.isTransposed).casefold()
         SubElement(EmbeddedReport, 'Role')
         EmbeddedReport.append(embedding.report.rootETree)
+        report.numCellsEmitted += embedding.report.numCellsEmitted
 
 # this is broken.
 #===============================================================================
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+:mod:`EdgarRenderer.TaxonomyPreloader`
+~~~~~~~~~~~~~~~~~~~
+Edgar(tm) Renderer was created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment
+are not subject to domestic copyright protection. 17 U.S.C. 105.
+"""
+
+from arelle import FileSource, ModelDocument, ModelXbrl, XbrlConst
+from arelle.ModelDtsObject import ModelResource
+
+"""
+Fork-server support for the daemon.  The daemon parent loads the current (latest version) standard taxonomies
+of the disclosure system's edgartaxonomies into a template DTS, before forking a child process per filing.
+Each child inherits the parsed documents copy-on-write.  When a child's filing DTS discovers a preloaded
+document, the document (and the preloaded documents it references) are adopted by the filing's modelXbrl,
+contributing their concepts, types, role types and linkbase base sets as if they had been discovered
+and parsed by the filing, instead of being parsed again.
+
+Adopted documents are moved to the filing's modelXbrl, so only the first modelXbrl of a child discovering a
+document adopts it; any later modelXbrl of the same filing loads it normally.  Adoption is only enabled in
+forked children, so the template in the parent stays intact for the next filing.
+"""
+
+template = None  # modelXbrl of preloaded documents
+docContributions = {}  # per preloaded document, what it contributes to its modelXbrl's DTS indexes
+adoptionEnabled = False
+
+dtsQnameIndexes = ("qnameConcepts", "qnameAttributes", "qnameAttributeGroups", "qnameGroupDefinitions", "qnameTypes")
+
+
+def latestStandardTaxonomyHrefs(disclosureSystem):
+    # hrefs of the latest version of each taxonomy family, schemas first
+    hrefs = []
+    for family, erxlLocs in sorted(disclosureSystem.familyHrefs.items()):
+        latestVersion = max((loc.version or "") for loc in erxlLocs)
+        for loc in sorted(erxlLocs, key=lambda loc: (loc.attType != "SCH", loc.href)):
+            if (loc.version or "") == latestVersion and loc.href not in hrefs:
+                hrefs.append(loc.href)
+    return hrefs
+
+
+def preload(cntlr):
+    # load template DTS in the daemon (parent) process, returns number of documents preloaded
+    global template
+    discard()
+    modelManager = cntlr.modelManager
+    hrefs = latestStandardTaxonomyHrefs(modelManager.disclosureSystem)
+    if not hrefs:
+        return 0
+    modelXbrl = ModelXbrl.create(modelManager)
+    modelXbrl.fileSource = FileSource.FileSource(hrefs[0], cntlr)
+    modelXbrl.closeFileSource = True
+    modelXbrl.modelDocument = None
+    for href in hrefs:
+        modelDocument = ModelDocument.load(modelXbrl, href, isDiscovered=True)
+        if modelXbrl.modelDocument is None:
+            modelXbrl.modelDocument = modelDocument  # the template has no entry point, but a modelXbrl needs a modelDocument
+    template = modelXbrl
+    indexContributions(modelXbrl)
+    return len(docContributions)
+
+
+def indexContributions(modelXbrl):
+    # record, in template discovery order, each document's entries in the modelXbrl DTS indexes
+    def contribution(doc):
+        if doc not in docContributions:
+            docContributions[doc] = {"urls": [], "namespaces": [], "baseSets": [], "roleTypes": [], "arcroleTypes": [],
+                                     "langs": set(), "labelroles": set(),
+                                     **dict((index, []) for index in dtsQnameIndexes)}
+        return docContributions[doc]
+    for doc in sorted(set(modelXbrl.urlDocs.values()), key=lambda doc: doc.objectIndex):
+        c = contribution(doc)
+        if doc.type == ModelDocument.Type.LINKBASE and doc.xmlRootElement is not None:
+            for elt in doc.xmlRootElement.iterdescendants():
+                if isinstance(elt, ModelResource):
+                    if elt.xmlLang:
+                        c["langs"].add(elt.xmlLang)
+                    if elt.localName == "label":
+                        c["labelroles"].add(elt.role)
+    for url, doc in modelXbrl.urlDocs.items():
+        contribution(doc)["urls"].append(url)
+    for namespace, docs in modelXbrl.namespaceDocs.items():
+        for doc in docs:
+            contribution(doc)["namespaces"].append(namespace)
+    for index in dtsQnameIndexes:
+        for qname, obj in getattr(modelXbrl, index).items():
+            if obj.modelDocument in docContributions:
+                docContributions[obj.modelDocument][index].append((qname, obj))
+    for index in ("roleTypes", "arcroleTypes"):
+        for uri, objs in getattr(modelXbrl, index).items():
+            for obj in objs:
+                if obj.modelDocument in docContributions:
+                    docContributions[obj.modelDocument][index].append((uri, obj))
+    for key, links in modelXbrl.baseSets.items():
+        for link in links:
+            if link.modelDocument in docContributions:
+                docContributions[link.modelDocument]["baseSets"].append((key, link))
+
+
+def enableAdoption():
+    # called in a forked per-filing child process
+    global adoptionEnabled
+    adoptionEnabled = template is not None
+
+
+def initModelXbrl(modelXbrl):
+    # ModelXbrl.Init: number new model objects after the preloaded ones so adopted objects keep their objectIndex
+    if adoptionEnabled and modelXbrl is not template:
+        modelXbrl.modelObjects.extend(template.modelObjects)
+
+
+def adoptDocument(modelXbrl, normalizedUri):
+    # ModelDocument.PullLoader: returns preloaded document adopted by modelXbrl, or None to load it normally
+    if not adoptionEnabled or modelXbrl is template:
+        return None
+    modelDocument = template.urlDocs.get(normalizedUri)
+    if modelDocument is None or modelDocument.modelXbrl is not template:
+        return None  # not preloaded, or already adopted by another modelXbrl of this filing
+    docs = set()
+    pending = [modelDocument]
+    while pending:
+        doc = pending.pop()
+        if doc.modelXbrl is template and doc in docContributions and doc not in docs:
+            docs.add(doc)
+            pending.extend(doc.referencesDocument.keys())
+    for doc in sorted(docs, key=lambda doc: doc.objectIndex):
+        c = docContributions[doc]
+        doc.modelXbrl = modelXbrl
+        for url in c["urls"]:
+            modelXbrl.urlDocs.setdefault(url, doc)
+        for namespace in c["namespaces"]:
+            modelXbrl.namespaceDocs[namespace].append(doc)
+        for index in dtsQnameIndexes:
+            getattr(modelXbrl, index).update(c[index])
+        for qname, concept in c["qnameConcepts"]:
+            modelXbrl.nameConcepts[qname.localName].append(concept)
+        for index in ("roleTypes", "arcroleTypes"):
+            for uri, obj in c[index]:
+                getattr(modelXbrl, index)[uri].append(obj)
+        for key, link in c["baseSets"]:
+            modelXbrl.baseSets[key].append(link)
+        modelXbrl.langs |= c["langs"]
+        modelXbrl.labelroles |= c["labelroles"]
+        if doc.targetNamespace == XbrlConst.xbrldt:
+            modelXbrl.hasXDT = True
+    return modelDocument
+
+
+def discard():
+    global template, adoptionEnabled
+    if template is not None:
+        template.close()
+    template = None
+    docContributions.clear()
+    adoptionEnabled = False
@@ -6,9 +6,10 @@ Edgar(tm) Renderer was created by staff of the U.S. Securities and Exchange Comm
 Data and content created by government employees within the scope of their employment
 are not subject to domestic copyright protection. 17 U.S.C. 105.
 """
-import sys, math, logging
+import sys, math, logging, os, threading
 import regex as re
 import arelle.XbrlConst
+from lxml import etree
 
 durationStartRoleError = "durationStartRoleError"  # fake role URI to indicate that a periodStart label role was put on a duration concept.
 durationEndRoleError = "durationEndRoleError"  # fake role URI to indicate that a periodEnd label role was put on a duration concept.
@@ -442,14 +443,23 @@ def embeddingGarbageCollect(embedding):
         for row in report.rowList:
             for cell in row.cellList:
                 if cell is not None:
-                    cell.__dict__.clear()
-            row.__dict__.clear()
+                    clearSlots(cell)
+            clearSlots(row)
         for col in report.colList:
-            col.__dict__.clear()
+            clearSlots(col)
         report.__dict__.clear()
     embedding.__dict__.clear()
 
 
+def clearSlots(obj):
+    # as __dict__.clear() for objects with __slots__ (rows, columns and cells), releases what they reference
+    for name in type(obj).__slots__:
+        try:
+            delattr(obj, name)
+        except AttributeError:
+            pass  # not set
+
+
 class RenderingException(Exception):
 
     def __init__(self, code, message):
@@ -467,3 +477,27 @@ class Errmsg(object):
         self.msgCode = messageCode
         self.msg = message
 
+
+# compiled XSLT stylesheets are kept for the process lifetime (e.g., a daemon rendering many filings), by path and
+# modification time so that an edited stylesheet is recompiled.  XSLT objects may be shared by threads.
+compiledXsltCache = {}
+compiledXsltCacheStats = {"hits": 0, "misses": 0}
+compiledXsltCacheLock = threading.Lock()
+
+
+def compiledXslt(path):
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    with compiledXsltCacheLock:
+        xslt = compiledXsltCache.get(key)
+        if xslt is not None:
+            compiledXsltCacheStats["hits"] += 1
+            return xslt
+        compiledXsltCacheStats["misses"] += 1
+        for priorKey in [k for k in compiledXsltCache if k[0] == key[0]]:
+            del compiledXsltCache[priorKey]  # stylesheet was modified since compiled
+        xslt = compiledXsltCache[key] = etree.XSLT(etree.parse(path))
+        return xslt
+
+
+def compiledXsltCacheSummary():
+    return "compiled XSLT cache hits {hits}, misses {misses}".format(**compiledXsltCacheStats)
@@ -15,7 +15,7 @@ At this moment, Xlout.py requires openpyxl 2.1.4, it does not work with openpyxl
 
 import os.path, datetime, time, lxml, decimal, collections, openpyxl.cell, openpyxl.styles, openpyxl.utils, openpyxl.worksheet.dimensions
 import regex as re
-from . import IoManager
+from . import IoManager, Utils
 from lxml.etree import tostring as treeToString
 
 # note that number pattern allows word before number like shares (1,234,567) (but would misfire on same in text block!)
@@ -44,7 +44,7 @@ class XlWriter(object):
     def __init__(self, controller, outputFolderName):
         self.controller = controller
         self.outputFolderName = outputFolderName
-        self.simplified_transform = lxml.etree.XSLT(lxml.etree.parse(controller.excelXslt))
+        self.simplified_transform = Utils.compiledXslt(controller.excelXslt)
         self.wb = openpyxl.Workbook()
         self.sheetNames = set()  # prevent duplicates
         self.workSheet = None
@@ -156,8 +156,8 @@ from arelle.ValidateFilingText import elementsWithNoContent
 from arelle.XhtmlValidate import xhtmlValidate
 from arelle.XmlValidateConst import VALID, NONE, UNVALIDATED
 from arelle.XmlValidate import validate as xmlValidate
-from . import RefManager, IoManager, Inline, Utils, Filing, Summary, iXBRLViewerInterface
-import datetime, zipfile, logging, shutil, gettext, time, shlex, sys, traceback, linecache, os, io, tempfile
+from . import RefManager, IoManager, Inline, Utils, Filing, Summary, iXBRLViewerInterface, FilingQueue, TaxonomyPreloader
+import datetime, zipfile, logging, shutil, gettext, time, shlex, sys, traceback, linecache, os, io, tempfile, copy, gc, signal
 import regex as re
 from lxml import etree
 from os import getcwd, remove, removedirs
@@ -236,6 +236,12 @@ def edgarRendererCmdLineOptionExtender(parser, *args, **kwargs):
                       help=_("Relative path and name of the archive folder, where successfully-processed original filings are stored."))
     parser.add_option("--processingfrequency", dest="processingFrequency",
                       help=_("The sleep time for the RE3 daemon shell if no XBRL filing is present in the staging area."))
+    parser.add_option("--daemonFilingsPerProcess", dest="daemonFilingsPerProcess",
+                      help=_("Number of filings a daemon process renders, keeping the controller, plugins and caches loaded, before exiting to the daemon shell; 0 for no limit."))
+    parser.add_option("--daemonWorkers", dest="daemonWorkers",
+                      help=_("Number of daemon worker processes forked to render filings from the shared filings folder (requires fork, e.g. Linux or MacOS)."))
+    parser.add_option("--daemonPreloadTaxonomies", dest="daemonPreloadTaxonomies", action="store_true",
+                      help=_("Boolean to indicate if the daemon preloads the latest standard taxonomies and renders each filing in a forked process sharing them (requires fork, e.g. Linux or MacOS)."))
     parser.add_option("--renderingService", dest="renderingService",
                       help=_("Type of service...Instance: one time rendering, or Daemon: background processing."))
     parser.add_option("--totalClean", dest="totalClean", action="store_true",
@@ -247,6 +253,10 @@ def edgarRendererCmdLineOptionExtender(parser, *args, **kwargs):
 
     parser.add_option("--reportFormat", dest="reportFormat",
                       help=_("One of Xml, Html, HtmlAndXml or None."))
+    parser.add_option("--renderingThreads", dest="renderingThreads",
+                      help=_("Number of threads transforming and serializing R files while further reports are laid out, and deflating large output zip members; 1 for none, 0 (default) for up to 4 depending on processors."))
+    parser.add_option("--zipCompressionLevel", dest="zipCompressionLevel",
+                      help=_("Deflate level of output zip members, 0 (fastest) to 9 (smallest), default zlib's (6). Already compressed media members are stored."))
 
     parser.add_option("--failFile", dest="failFile", help=_("Relative path and name of fail file. "))
 
@@ -339,6 +349,9 @@ class EdgarRenderer(Cntlr.Cntlr):
         self.defaultValueDict['auxMetadata'] = str(False)
         self.defaultValueDict['copyInlineFilesToOutput'] = str(False)
         self.defaultValueDict['copyXbrlFilesToOutput'] = str(False)
+        self.defaultValueDict['daemonFilingsPerProcess'] = '1'  # 1 exits after each filing (prior behavior)
+        self.defaultValueDict['daemonWorkers'] = '1'
+        self.defaultValueDict['daemonPreloadTaxonomies'] = str(False)
         self.defaultValueDict['zipXbrlFilesToOutput'] = str(False)
         self.defaultValueDict['includeLogsInSummary'] = str(False)
         self.defaultValueDict['includeLogsInSummaryDissem'] = str(False)
@@ -358,6 +371,7 @@ class EdgarRenderer(Cntlr.Cntlr):
         self.defaultValueDict['renderingLogsXslt'] = None
         self.defaultValueDict['renderingService'] = 'Instance'
         self.defaultValueDict['reportFormat'] = 'Html'
+        self.defaultValueDict['renderingThreads'] = '0'
         self.defaultValueDict['reportsFolder'] = 'Reports'
         self.defaultValueDict['reportXslt'] = 'InstanceReport.xslt'
         self.defaultValueDict['reportXsltDissem'] = None
@@ -372,6 +386,7 @@ class EdgarRenderer(Cntlr.Cntlr):
         self.defaultValueDict['validate'] = str(False)
         self.defaultValueDict['validateEFM'] = str(False)
         self.defaultValueDict['zipOutputFile'] = None
+        self.defaultValueDict['zipCompressionLevel'] = None
         self.defaultValueDict['logMessageTextFile'] = None
 
         # The configDict holds the values as they were read from the config file.
@@ -411,7 +426,9 @@ class EdgarRenderer(Cntlr.Cntlr):
         options.renderingService = setProp('renderingService', options.renderingService, rangeList=['Instance', 'Daemon'])
         options.reportFormat = setProp('reportFormat', options.reportFormat, rangeList=['Html', 'Xml', 'HtmlAndXml', 'None'])
         options.htmlReportFormat = setProp('htmlReportFormat', options.htmlReportFormat, rangeList=['Complete', 'Fragment'])
+        options.renderingThreads = setProp('renderingThreads', getattr(options, 'renderingThreads', None))
         options.zipOutputFile = setProp('zipOutputFile', options.zipOutputFile, cs=True)
+        options.zipCompressionLevel = setProp('zipCompressionLevel', getattr(options, 'zipCompressionLevel', None))
         options.sourceList = " ".join(setProp('sourceList', options.sourceList, cs=True).split()).split(',')
         self.sourceDict = {}
         # Parse comma and colon separated list a:b b:c, d:e:f into a dictionary {'a': ('b b','c'), 'd': ('e','f') }:
@@ -546,7 +563,9 @@ class EdgarRenderer(Cntlr.Cntlr):
         self.renderingService = options.renderingService
         self.reportFormat = options.reportFormat
         self.htmlReportFormat = options.htmlReportFormat
+        self.renderingThreads = options.renderingThreads
         self.zipOutputFile = options.zipOutputFile
+        self.zipCompressionLevel = options.zipCompressionLevel
         self.sourceList = options.sourceList
         self.sourceDict = {}
         # Parse comma and colon separated list a:b b:c, d:e:f into a dictionary {'a': ('b b','c'), 'd': ('e','f') }:
@@ -657,6 +676,9 @@ class EdgarRenderer(Cntlr.Cntlr):
             return value
 
         setProp('processingFrequency', options.processingFrequency, required=True)
+        setProp('daemonFilingsPerProcess', options.daemonFilingsPerProcess, required=True)
+        setProp('daemonWorkers', options.daemonWorkers, required=True)
+        self.daemonPreloadTaxonomies = Utils.booleanFromString(setProp('daemonPreloadTaxonomies', options.daemonPreloadTaxonomies))
 
     @property
     def renderMode(self):
@@ -678,39 +700,51 @@ class EdgarRenderer(Cntlr.Cntlr):
         options.entrypointFile = None  # no entrypoint file(s)
         # check for next filing in input folder
         # as usual, self.{some}Folder is absolute, while options.{some}Folder is what was specified in the input.
-        self.originalProcessingFolder = os.path.join(getcwd(), self.processingFolder)
+        if not getattr(self, "originalProcessingFolder", None):  # processingFolder is changed to the per-filing folder below
+            self.originalProcessingFolder = os.path.join(getcwd(), self.processingFolder)
         self.logDebug(_("Checking for the oldest zip file in {}").format(self.filingsFolder))
+        if getattr(self, "filingQueue", None) is None:  # created per process, after any worker fork
+            self.filingQueue = FilingQueue.FilingQueue(self.filingsFolder)
+            self.logDebug(_("Filings queue is {}").format("event driven" if self.filingQueue.isEventDriven else "polled"))
         while not zipfound:
-            for file in sorted(os.listdir(self.filingsFolder), key=lambda file: os.stat(join(self.filingsFolder, file)).st_mtime):
-                if not zipfound and Utils.isZipFilename(file):
-                    inputFileSource = join(self.filingsFolder, file)
-                    self.processingFolder = IoManager.createNewFolder(self, self.originalProcessingFolder, file)
-                    # reportsFolder = normpath(join(self.processingFolder,options.reportsFolder))
-                    processingFileSource = join(self.processingFolder, file)
-                    if not exists(inputFileSource): continue  # it got deleted before we could process it.
-                    self.logDebug(_("Found a new zip file to process; moving {} to Processing folder ").format(inputFileSource))
-                    try:
-                        IoManager.move_clobbering_file(inputFileSource, processingFileSource)
-                        options.entrypointFile = processingFileSource
-                        zipfound = True
-                    except IOError as err:
-                        self.logError(str(err))
-                        # self.logError(_(ErrorMgr.getError('FILING_MOVE_ERROR').format(self.processingFolder)))
-                        self.logError(_("Could not remove {}").format(self.processingFolder))
-                        try: removedirs(self.processingFolder)
-                        except IOError: continue
-                    # provide these parameters to FilingStart via options
-                    options.zipOutputFile = join(self.processingFolder, "-out".join(os.path.splitext(file)))
-                    options.doneFile = join(self.archiveFolder, file)
-                    # self.failFile = join(self.errorsFolder,file)
-                    if self.createdFolders:  # pass to filing processing any created folders
-                        options.daemonCreatedFolders = self.createdFolders
-                    break
+            for file in iter(self.filingQueue.pop, None):
+                inputFileSource = join(self.filingsFolder, file)
+                # claim the filing by an atomic rename within the filings folder, so that other daemon
+                # worker processes sharing the filings folder can't also dequeue it
+                claimedFileSource = join(self.filingsFolder, ".{}.claimed-{}".format(file, os.getpid()))
+                try:
+                    os.rename(inputFileSource, claimedFileSource)
+                except OSError:
+                    continue  # it got deleted or claimed by another worker before we could process it.
+                self.processingFolder = IoManager.createNewFolder(self, self.originalProcessingFolder, file)
+                processingFileSource = join(self.processingFolder, file)
+                self.logDebug(_("Found a new zip file to process; moving {} to Processing folder ").format(inputFileSource))
+                try:
+                    IoManager.move_clobbering_file(claimedFileSource, processingFileSource)
+                except IOError as err:
+                    self.logError(str(err))
+                    # self.logError(_(ErrorMgr.getError('FILING_MOVE_ERROR').format(self.processingFolder)))
+                    self.logError(_("Could not remove {}").format(self.processingFolder))
+                    try: os.rename(claimedFileSource, inputFileSource)  # unclaim for a later retry
+                    except OSError: pass
+                    try: removedirs(self.processingFolder)
+                    except OSError: pass
+                    self.createdFolders.remove(self.processingFolder)
+                    continue
+                options.entrypointFile = processingFileSource
+                zipfound = True
+                # provide these parameters to FilingStart via options
+                options.zipOutputFile = join(self.processingFolder, "-out".join(os.path.splitext(file)))
+                options.doneFile = join(self.archiveFolder, file)
+                # self.failFile = join(self.errorsFolder,file)
+                if self.createdFolders:  # pass to filing processing any created folders
+                    options.daemonCreatedFolders = self.createdFolders
+                break
             # no more files.
             if not zipfound:
                 sleep = self.processingFrequency
-                self.logDebug(_("Sleeping for " + sleep + " seconds. "))
-                time.sleep(float(sleep))
+                self.logDebug(_("Waiting up to " + sleep + " seconds for a filing. "))
+                self.filingQueue.wait(float(sleep))
                 self.cntlr.logHandler.flush()  # flush log buffer (if any)
         return
 
@@ -742,7 +776,169 @@ class EdgarRenderer(Cntlr.Cntlr):
             IoManager.handleFolder(self, self.archiveFolder, False, self.totalClean)
             if self.errorsFolder is not None:  # You might not have an errors folder.
                 IoManager.handleFolder(self, self.errorsFolder, False, self.totalClean)
-            self.daemonDequeueInputZip(options)  # loop, waiting for an input to process, then returns and processes input as if --file specified the input
+            if self.daemonPreloadTaxonomies:
+                if hasattr(os, "fork"):  # preload before forking any workers, so all workers share the preloaded taxonomies
+                    _startedAt = time.time()
+                    numDocs = TaxonomyPreloader.preload(self.cntlr)
+                    self.logInfo(_("Preloaded {} standard taxonomy documents in {:.3f} secs").format(numDocs, time.time() - _startedAt))
+                else:
+                    self.logWarn(_("Daemon preload taxonomies requires fork, which is not available on this platform, not preloading."))
+                    self.daemonPreloadTaxonomies = False
+            numWorkers = int(self.daemonWorkers)
+            if numWorkers > 1:
+                if hasattr(os, "fork"):
+                    self.daemonSuperviseWorkers(options, numWorkers)  # only returns in a forked worker process
+                else:
+                    self.logWarn(_("Daemon workers {} requires fork, which is not available on this platform, running one worker.").format(numWorkers))
+            filingsLimit = int(self.daemonFilingsPerProcess)
+            self.daemonFilingCounts = [0, 0]  # good, bad
+            while True:
+                self.daemonDequeueInputZip(options)  # loop, waiting for an input to process, then returns and processes input as if --file specified the input
+                if filingsLimit > 0 and sum(self.daemonFilingCounts) + 1 >= filingsLimit and not self.daemonPreloadTaxonomies:
+                    return  # last filing of this process is processed by the invoking CntlrCmdLine.run
+                self.daemonRunFiling(options)
+                if filingsLimit > 0 and sum(self.daemonFilingCounts) >= filingsLimit:  # preloading, each filing was rendered in a forked process
+                    self.cntlr.logHandler.flush()
+                    raise SystemExit  # terminates CntlrCmdLine.run processing
+
+    def daemonSuperviseWorkers(self, options, numWorkers):
+        # fork worker processes that share the daemon folders, claiming filings atomically in daemonDequeueInputZip,
+        # and replace each worker as it exits (e.g., after daemonFilingsPerProcess filings), until terminated
+        workerPids = set()
+        stopSignals = []
+        def stopWorkers(signum, frame):
+            stopSignals.append(signum)
+            for pid in workerPids:
+                try: os.kill(pid, signal.SIGTERM)
+                except OSError: pass
+        signal.signal(signal.SIGTERM, stopWorkers)
+        signal.signal(signal.SIGINT, stopWorkers)
+        failFile = self.failFile
+        while not stopSignals:
+            while len(workerPids) < numWorkers and not stopSignals:
+                self.cntlr.logHandler.flush()  # don't duplicate buffered log records into the worker
+                pid = os.fork()
+                if pid == 0:  # worker process, continues to dequeue and render filings
+                    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                    signal.signal(signal.SIGINT, signal.SIG_DFL)
+                    if failFile is not None:  # per-worker fail file, counted by the supervisor when the worker exits
+                        options.failFile = self.failFile = "{}.{}".format(failFile, os.getpid())
+                    return
+                workerPids.add(pid)
+                self.logInfo(_("Started daemon worker process {}").format(pid))
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                continue
+            workerPids.discard(pid)
+            claimSuffix = ".claimed-{}".format(pid)
+            for file in os.listdir(self.filingsFolder):  # unclaim any filing the worker claimed but did not move to processing
+                if file.startswith(".") and file.endswith(claimSuffix):
+                    try: os.rename(join(self.filingsFolder, file), join(self.filingsFolder, file[1:-len(claimSuffix)]))
+                    except OSError: pass
+            if failFile is not None and isfile("{}.{}".format(failFile, pid)):
+                os.remove("{}.{}".format(failFile, pid))
+                self.logInfo(_("Daemon worker process {} exited after a failed filing").format(pid))
+            elif status:
+                self.logWarn(_("Daemon worker process {} exited with status {}").format(pid, status))
+        while workerPids:
+            try:
+                workerPids.discard(os.wait()[0])
+            except ChildProcessError:
+                break
+        self.logInfo(_("Daemon workers stopped"))
+        self.cntlr.logHandler.flush()
+        raise SystemExit  # terminates CntlrCmdLine.run processing in the supervisor
+
+    def daemonRunFiling(self, options):
+        # process the dequeued filing within this process (or, preloading taxonomies, a forked process), keeping the controller,
+        # plugins, web cache and disclosure system warm
+        _startedAt = time.time()
+        if self.daemonPreloadTaxonomies:
+            self.daemonForkFiling(options)
+        else:
+            self.daemonProcessFiling(options)
+        if self.failFile is not None and isfile(self.failFile):
+            os.remove(self.failFile)  # fail file signals the daemon shell only for the filing the shell itself processes
+            self.daemonFilingCounts[1] += 1
+        else:
+            self.daemonFilingCounts[0] += 1
+        self.logInfo(_("Processed {} in {:.3f} secs; Good Filings: [{}]; Bad Filings: [{}]; Total Filings: [{}]").format(
+                     os.path.basename(options.entrypointFile or ""), time.time() - _startedAt,
+                     self.daemonFilingCounts[0], self.daemonFilingCounts[1], sum(self.daemonFilingCounts)))
+        self.daemonResetFilingState(options)
+        self.cntlr.logHandler.flush()  # flush log buffer (if any) so logs of one filing aren't saved with the next
+
+    def daemonProcessFiling(self, options):
+        filingOptions = copy.copy(options)
+        filingOptions.daemonFilingInProgress = True  # blocks re-entry of daemon startup by the nested run
+        try:
+            self.cntlr.run(filingOptions)
+        except Exception as ex:
+            self.logError(_("Failure: Daemon unable to process {}: {}").format(options.entrypointFile, ex))
+            self.logDebug(_("Exception traceback: {}").format(traceback.format_exception(*sys.exc_info())))
+            self.daemonFailFiling(options)
+
+    def daemonFailFiling(self, options):
+        if options.entrypointFile and exists(options.entrypointFile):
+            try:
+                IoManager.move_clobbering_file(options.entrypointFile, self.errorsFolder)
+            except OSError as err:
+                self.logError(_("Failure: Post-processing I/O or OS error: {}").format(err))
+        if self.failFile is not None:
+            open(self.failFile, 'w').close()
+
+    def daemonForkFiling(self, options):
+        # fork-server: render the filing in a child process which inherits the preloaded standard taxonomies copy-on-write,
+        # and discards all of the filing's state (and any changes to the preloaded documents) when it exits
+        self.cntlr.logHandler.flush()  # don't duplicate buffered log records into the child
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                TaxonomyPreloader.enableAdoption()
+                self.daemonProcessFiling(options)
+                status = 0
+            finally:
+                try:
+                    self.cntlr.logHandler.flush()
+                finally:
+                    os._exit(status)  # skip atexit and finalizers of state shared with the daemon process
+        try:
+            status = os.waitpid(pid, 0)[1]
+        except ChildProcessError:
+            status = None
+        if status:
+            self.logError(_("Failure: Daemon filing process {} for {} exited with status {}").format(pid, options.entrypointFile, status))
+            self.daemonFailFiling(options)
+
+    def daemonResetFilingState(self, options):
+        # clear any per-filing state left on the controller, model manager and options so nothing leaks into the next filing
+        cntlr = self.cntlr
+        modelManager = cntlr.modelManager
+        if hasattr(modelManager, "efmFiling"):  # filing ended abnormally before validate plugin's filingEnd
+            try:
+                modelManager.efmFiling.close()
+            except Exception:
+                pass
+            del modelManager.efmFiling
+        for modelXbrl in list(modelManager.loadedModelXbrls):
+            modelManager.close(modelXbrl)
+        if getattr(self, "rFileTransformCache", None) is not None:  # filing ended before its dissemination pass
+            self.rFileTransformCache.close()
+            self.rFileTransformCache = None
+        for attr in ("editedIxDocs", "redlineIxDocs", "editedModelXbrls", "redactTgtElts", "redactTgtEltContent",
+                     "redactFileReferences", "nonRedactedFileNames"):
+            if hasattr(cntlr, attr):
+                getattr(cntlr, attr).clear()
+        del self.createdFolders[:]  # owned (and removed) by the filing's EdgarRenderer
+        self.processingFolder = self.originalProcessingFolder
+        options.entrypointFile = options.zipOutputFile = options.doneFile = None
+        if hasattr(options, "daemonCreatedFolders"):
+            del options.daemonCreatedFolders
+        gc.collect()
 
     def isRunningUnderTestcase(self):
         return (getattr(self.cntlr.modelManager.loadedModelXbrls[0], "modelDocument", None) is not None and
@@ -753,6 +949,7 @@ class EdgarRenderer(Cntlr.Cntlr):
         filing.edgarRenderer = self
         self.reportZip = filing.reportZip
         self.writeFile = filing.writeFile
+        self.openOutputZip = filing.openReportZip
         # Set default config params; overwrite with command line args if necessary
         self.retrieveDefaultREConfigParams(options)
         # Initialize the folders and objects required in both modes.
@@ -1000,7 +1197,7 @@ class EdgarRenderer(Cntlr.Cntlr):
         return _text
 
     def transformFilingSummary(self, filing, rootETree, xsltFile, reportsFolder, htmFileName, includeLogs, title=None, zipDir=""):
-        summary_transform = etree.XSLT(etree.parse(xsltFile))
+        summary_transform = Utils.compiledXslt(xsltFile)
         trargs = {"asPage": etree.XSLT.strparam('true'),
                   "accessionNumber": "'{}'".format(getattr(filing, "accessionNumber", "")),
                   "resourcesFolder": "'{}'".format(self.resourcesFolder.replace("\\", "/")),
@@ -1072,17 +1269,23 @@ class EdgarRenderer(Cntlr.Cntlr):
                 reportXslt = None
                 if self.reportXslt:
                     _xsltStartedAt = time.time()
-                    reportXslt = etree.XSLT(etree.parse(self.reportXslt))
+                    reportXslt = Utils.compiledXslt(self.reportXslt)
                     if self.reportXsltDissem:
-                        reportXsltDissem = etree.XSLT(etree.parse(self.reportXsltDissem))
+                        reportXsltDissem = Utils.compiledXslt(self.reportXsltDissem)
                     else:
                         reportXsltDissem = None
-                    self.logDebug("Excel XSLT transform {:.3f} secs.".format(time.time() - _xsltStartedAt))
+                    self.logDebug("Excel XSLT transform {:.3f} secs, {}.".format(time.time() - _xsltStartedAt, Utils.compiledXsltCacheSummary()))
                 # R files can be produced after knowing if any instance had private data
                 self.nextFileNum = 1  # important for naming file numbers for multi-instance filings
                 self.nextUncategorizedFileNum = 9999
                 self.nextBarChartFileNum = 0
                 rFilePrefix = "Private" if hasPrivateData and self.isWorkstationFirstPass else None
+                # with private data, R file transforms of the first pass are reused for identical dissemination pass R files,
+                # by reportXslt only, as the dissemination pass's reportXsltDissem is not used in the first pass
+                self.rFileTransformCache = IoManager.SpooledTransformCache() if hasPrivateData and reportXslt is not None else None
+                self.rFileCachedTransform = reportXslt
+                self.isRFileTransformCacheFilling = True
+                self.rFileTransformsReused = self.rFileTransformLookups = 0
                 targetDocumentSuffix = ("_ht2." if hasPrivateData else "_ht1.") if self.isWorkstationFirstPass else "_htm."
                 for report in filing.reports:
                     Inline.saveTargetDocumentIfNeeded(self, options, report.modelXbrl, filing, suffix=targetDocumentSuffix)  # save extracted xml from inline reports
@@ -1152,7 +1355,7 @@ class EdgarRenderer(Cntlr.Cntlr):
                             with filesource.file(_filepath, binary=True)[0] as fout:  # returned in a tuple
                                 serializedDoc = fout.read()
                         if self.reportZip:
-                            if filename not in self.reportZip.namelist():
+                            if not IoManager.zipHasMember(self.reportZip, filename):
                                 self.reportZip.writestr(filename, serializedDoc)
                         elif self.reportsFolder is not None:
                             reportsFolderFilePath = join(self.reportsFolder, filename)
@@ -1212,6 +1415,16 @@ class EdgarRenderer(Cntlr.Cntlr):
                         for report in filing.reports:
                             modelXbrl = report.modelXbrl
                             report.redactedContinuationSources = redactedContinuationSources = set()
+                            if removableCntxs or removableUnits:
+                                # count the unredacted facts referencing each context and unit, in one pass of the facts,
+                                # a removable context or unit with no count is orphaned
+                                cntxFactCounts = defaultdict(int)
+                                unitFactCounts = defaultdict(int)
+                                for f in modelXbrl.facts:
+                                    if isinstance(f, ModelFact) and f.id not in redactTgtElts:
+                                        cntxFactCounts[f.context] += 1
+                                        if f.unit is not None:
+                                            unitFactCounts[f.unit] += 1
                             # bypass continuedAt's to redacted elements
                             if redactTgtElts:  # if any redacted continued at elements
                                 for ixdsHtmlRootElt in getattr(modelXbrl, "ixdsHtmlElements", ()):
@@ -1233,28 +1446,28 @@ class EdgarRenderer(Cntlr.Cntlr):
                                                 redactedContinuationSources.add(e)
                                                 e._continuationElement = contAt = None
                                             hasEditedCont = True
-                                    for e in ixdsHtmlRootElt.iter("{http://www.xbrl.org/2013/inlineXBRL}relationship"):
-                                        if any(ref in cntlr.redactTgtElts
-                                               for refsAttr in ("fromRefs", "toRefs")
-                                               for refs in e.get(refsAttr)
+                                    for e in list(ixdsHtmlRootElt.iter("{http://www.xbrl.org/2013/inlineXBRL}relationship")):
+                                        refsByAttr = dict((refsAttr, e.get(refsAttr, "").split()) for refsAttr in ("fromRefs", "toRefs"))
+                                        if any(ref in redactTgtElts
+                                               for refs in refsByAttr.values()
                                                for ref in refs):
                                             hasEditedCont = True
-                                            for refsAttr in ("fromRefs", "toRefs"):
-                                                refs = (ref for refs in e.get(refsAttr) if ref not in cntlr.redactTgtElts)
+                                            for refsAttr, refs in refsByAttr.items():
+                                                refs = [ref for ref in refs if ref not in redactTgtElts]
                                                 if refs:  # any refs remain
-                                                    e.set(' '.join(refs))
+                                                    e.set(refsAttr, ' '.join(refs))
                                                 else:
                                                     e.getparent().remove(e)  # remove this relationship
                                                     break
                                     if removableCntxs:  # check for orphaned contexts
-                                        for e in ixdsHtmlRootElt.iter("{http://www.xbrl.org/2003/instance}context"):
-                                            if e in removableCntxs and not any((f.id not in redactTgtElts) for f in modelXbrl.facts if isinstance(f, ModelFact) and f.context == e):
+                                        for e in list(ixdsHtmlRootElt.iter("{http://www.xbrl.org/2003/instance}context")):
+                                            if e in removableCntxs and not cntxFactCounts[e]:
                                                 e.getparent().remove(e)  # remove this context
                                                 e.modelXbrl.contexts.pop(e.id, None)
                                                 hasEditedCont = True
                                     if removableUnits:  # check for orphaned units
-                                        for e in ixdsHtmlRootElt.iter("{http://www.xbrl.org/2003/instance}unit"):
-                                            if e in removableUnits and not any((f.id not in redactTgtElts) for f in modelXbrl.facts if isinstance(f, ModelFact) and f.unit == e):
+                                        for e in list(ixdsHtmlRootElt.iter("{http://www.xbrl.org/2003/instance}unit")):
+                                            if e in removableUnits and not unitFactCounts[e]:
                                                 e.getparent().remove(e)  # remove this context
                                                 e.modelXbrl.units.pop(e.id, None)
                                                 hasEditedCont = True
@@ -1340,7 +1553,7 @@ class EdgarRenderer(Cntlr.Cntlr):
                     if filing.reports: self.renderedFiles.add("FilingSummary.xml")
                     if filing.reports and self.renderingLogsXslt and self.summaryHasLogEntries and not self.processXsltInBrowser:
                         _startedAt = time.time()
-                        logs_transform = etree.XSLT(etree.parse(self.renderingLogsXslt))
+                        logs_transform = Utils.compiledXslt(self.renderingLogsXslt)
                         result = logs_transform(rootETree, asPage=etree.XSLT.strparam('true'))
                         self.logDebug("RenderingLogs XSLT transform {:.3f} secs.".format(time.time() - _startedAt))
                         IoManager.writeHtmlDoc(filing, result, self.reportZip, self.reportsFolder, 'RenderingLogs.htm')
@@ -1389,14 +1602,13 @@ class EdgarRenderer(Cntlr.Cntlr):
                                 _fileName = os.path.splitext(os.path.basename(_fileName.partition('#')[0]))[0] + ".zip"
                         if _fileName and sum(not getattr(report, "isNotDisseminated", False) for report in filing.reports) > 0:
                             # don't provide zip if no disseminated reports
-                            zipStream = io.BytesIO()
-                            xbrlZip = zipfile.ZipFile(zipStream, 'w', zipfile.ZIP_DEFLATED, True)
+                            xbrlZip = IoManager.OutputArchive(self.openOutputZip)
                             for report in filing.reports:
                                 if not getattr(report, "isNotDisseminated", False):
                                     for filepath in report.filepaths:  # may be multi-document IXDS (even in different directories)
                                         _xbrldir = os.path.dirname(filepath)
                                         for reportedFile in sorted(report.reportedFiles):
-                                            if reportedFile not in privateFilesNotDisseminated and reportedFile not in xbrlZip.namelist():
+                                            if reportedFile not in privateFilesNotDisseminated and reportedFile not in xbrlZip:
                                                 if reportedFile in cntlr.editedIxDocs:
                                                     doc = cntlr.editedIxDocs[reportedFile]
                                                     # redline removed file is not readable in encoded version, create from dom in memory
@@ -1410,19 +1622,16 @@ class EdgarRenderer(Cntlr.Cntlr):
                                                         file = FileSource.openFileSource(_filepath, cntlr, sourceZipStream).file(_filepath, binary=True)[0]
                                                     else:
                                                         file = filesource.file(_filepath, binary=True)[0]  # returned in a tuple
-                                                    xbrlZip.writestr(reportedFile, file.read())
+                                                    xbrlZip.writeFileObject(reportedFile, file)
                                                     file.close()
-                            xbrlZip.close()
-                            zipStream.seek(0)
                             if self.reportZip:
                                 if dissemReportsFolder:
                                     _fileName = "dissem/" + _fileName
-                                self.reportZip.writestr(_fileName, zipStream.read())
+                                xbrlZip.saveToZip(self.reportZip, _fileName)
                             elif dissemReportsFolder and not self.isWorkstationFirstPass:
-                                self.writeFile(os.path.join(dissemReportsFolder, _fileName), zipStream.read())
+                                xbrlZip.saveToFile(filing, os.path.join(dissemReportsFolder, _fileName))
                             else:
-                                self.writeFile(os.path.join(self.reportsFolder, _fileName), zipStream.read())
-                            zipStream.close()
+                                xbrlZip.saveToFile(filing, os.path.join(self.reportsFolder, _fileName))
                             self.logDebug("Write {} complete".format(_fileName))
 
                 # save documents with removed redlines (only when saving dissemReportsFolder)
@@ -1473,7 +1682,7 @@ class EdgarRenderer(Cntlr.Cntlr):
                     for filename in inputsToCopyToOutput - privateFilesNotDisseminated:
                         if not self.isWorkstationFirstPass or filename.endswith("_ht2.xml") or filename.endswith("_ix2.htm"):
                             basename = os.path.basename(filename)
-                            if self.reportZip and basename in self.reportZip.namelist():
+                            if self.reportZip and IoManager.zipHasMember(self.reportZip, basename):
                                 serializedDoc = self.reportZip.read(basename)
                             else:
                                 if self.reportZip:
@@ -1508,6 +1717,7 @@ class EdgarRenderer(Cntlr.Cntlr):
                         self.nextBarChartFileNum = 0
                         self.instanceSummaryList = []
                         numDisseminatedReports = 0
+                        self.isRFileTransformCacheFilling = False  # only looked up, entries are released when reused
                         for report in filing.reports:
                             if not getattr(report, "isNotDisseminated", False):
                                 if self.isWorkstationFirstPass:
@@ -1516,6 +1726,12 @@ class EdgarRenderer(Cntlr.Cntlr):
                                 else:  # Arelle GUI operation
                                     Filing.mainFun(self, report.modelXbrl, dissemReportsFolder, transform=reportXslt, zipDir="dissem/")  # no suffix, Arelle GUI
                                 numDisseminatedReports += 1
+                        self.logDebug("Dissemination R files reused {} first pass XSLT transforms of {} looked up ({:.0%}).".format(
+                            self.rFileTransformsReused, self.rFileTransformLookups,
+                            self.rFileTransformsReused / self.rFileTransformLookups if self.rFileTransformLookups else 0))
+                        if self.rFileTransformCache is not None:
+                            self.rFileTransformCache.close()  # first pass html not reused
+                        self.rFileTransformCache = None  # deref
                         summary = Summary.Summary(self)
                         rootETree = summary.buildSummaryETree()
                         summary.removeSummaryLogs()  # produce filing summary without logs
@@ -1648,7 +1864,7 @@ class EdgarRenderer(Cntlr.Cntlr):
         rootETree = summary.buildSummaryETree()
         IoManager.writeXmlDoc(rootETree, self.reportZip, self.reportsFolder, 'FilingSummary.xml')
         if self.summaryXslt and len(self.summaryXslt) > 0 :
-            summary_transform = etree.XSLT(etree.parse(self.summaryXslt))
+            summary_transform = Utils.compiledXslt(self.summaryXslt)
             result = summary_transform(rootETree, asPage=etree.XSLT.strparam('true'))
             IoManager.writeHtmlDoc(result, self.reportZip, self.reportsFolder, 'FilingSummary.htm')
         if self.auxMetadata:
@@ -1664,7 +1880,10 @@ class EdgarRenderer(Cntlr.Cntlr):
             self.logDebug(_("Creating output {} containing rendering results and other input files."
                            ).format(self.zipOutputFile))
             try:
-                zf = zipfile.ZipFile(self.zipOutputFile, 'w', allowZip64=False)
+                if hasattr(self, "openOutputZip"):
+                    zf = self.openOutputZip(self.zipOutputFile, 'w', allowZip64=False)
+                else:
+                    zf = zipfile.ZipFile(self.zipOutputFile, 'w', zipfile.ZIP_DEFLATED, allowZip64=False)
                 for f in os.listdir(self.reportsFolder):
                     if not Utils.isZipFilename(f) and not isdir(f) and not IoManager.isFileHidden(f):
                         IoManager.moveToZip(zf, join(zipdir, f), basename(f))
@@ -1756,7 +1975,8 @@ class EdgarRenderer(Cntlr.Cntlr):
 
 def edgarRendererCheckIfDaemonStartup(cntlr, options, sourceZipStream=None, *args, **kwargs):
     """ starts up EdgarRenderer when run as a Deamon (no input files selected) """
-    EdgarRenderer(cntlr).checkIfDaemonStartup(options)
+    if not getattr(options, "daemonFilingInProgress", False):  # not a filing run by a warm daemon process
+        EdgarRenderer(cntlr).checkIfDaemonStartup(options)
     iXBRLViewerInterface.hasIXBRLViewerPlugin(cntlr)  # block iXBRLViewerPlugin actions if the plugin is utilized
 
 
@@ -1830,6 +2050,16 @@ def edgarRendererGuiStartLogging(modelXbrl, mappedUri, normalizedUri, filepath,
     return False  # called for class 'ModelDocument.IsPullLoadable'
 
 
+def edgarRendererAdoptPreloadedDocument(modelXbrl, normalizedUri, filepath, isEntry=False, namespace=None, **kwargs):
+    if isEntry:
+        return None
+    return TaxonomyPreloader.adoptDocument(modelXbrl, normalizedUri)
+
+
+def edgarRendererModelXbrlInit(modelXbrl, *args, **kwargs):
+    TaxonomyPreloader.initModelXbrl(modelXbrl)
+
+
 def edgarRendererGuiRun(cntlr, modelXbrl, *args, **kwargs):
     """ run EdgarRenderer using GUI interactions for a single instance or testcases """
     if cntlr.hasGui and modelXbrl.modelDocument:
@@ -2224,6 +2454,9 @@ __pluginInfo__ = {
     'EdgarRenderer.Filing.End': edgarRendererFilingEnd,
     # GUI operation start log buffering
     'ModelDocument.IsPullLoadable': edgarRendererGuiStartLogging,
+    # daemon fork-server, adopt preloaded standard taxonomy documents instead of loading them
+    'ModelDocument.PullLoader': edgarRendererAdoptPreloadedDocument,
+    'ModelXbrl.Init': edgarRendererModelXbrlInit,
     # detect if any redline markups when appropriate
     'ModelDocument.Discover': edgarRendererDetectRedlining,
     # GUI operation startup (renders all reports of an input instance or test suite)
@@ -1,6 +1,10 @@
 #!/bin/bash
 SCRIPT_PID=`cat pid.pid`
 for SCRIPT_CHILD_PID in $(ps -o pid --no-headers --ppid $SCRIPT_PID); do
+    for WORKER_PID in $(ps -o pid --no-headers --ppid $SCRIPT_CHILD_PID); do
+        echo Stopping Rendering Daemon worker process $WORKER_PID
+        kill -9 $WORKER_PID
+    done
     echo Stopping Rendering Daemon process $SCRIPT_CHILD_PID
     kill -9 $SCRIPT_CHILD_PID
 done
@@ -0,0 +1,4 @@
+# tests import the render and validate packages from the repository directory, with arelle installed
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,95 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+Flow through suppression hides the columns of a statement whose elements are all in other reports.
+'''
+import builtins
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip("arelle")
+from render.Filing import Filing
+
+@pytest.fixture(autouse=True)
+def noTranslation(monkeypatch):
+    monkeypatch.setattr(builtins, "_", lambda message: message, raising=False)
+
+def makeCol(factQnames, memberPairs, index):
+    col = SimpleNamespace(isHidden=False, factList=[SimpleNamespace(qname=qname) for qname in factQnames],
+                          elementQnameMemberForColHidingSet=set(memberPairs), index=index, context=SimpleNamespace(id="c{}".format(index)))
+    col.hide = lambda: setattr(col, "isHidden", True)
+    return col
+
+def makeCube(shortName, cubeType, cols, isStatementOfEquity=False, noFactsOrAllFactsSuppressed=False, isEmbeddingOrReportBroken=False):
+    hasElements = {fact.qname for col in cols for fact in col.factList}
+    report = SimpleNamespace(colList=cols, numVisibleColumns=len(cols), rowList=[])
+    embedding = SimpleNamespace(hasElementsAndElementMemberPairs=hasElements.union(*(col.elementQnameMemberForColHidingSet for col in cols)),
+                                hasElements=hasElements, isEmbeddingOrReportBroken=isEmbeddingOrReportBroken, report=report)
+    return SimpleNamespace(noFactsOrAllFactsSuppressed=noFactsOrAllFactsSuppressed, embeddingList=[embedding], cubeType=cubeType,
+                           isStatementOfEquity=isStatementOfEquity, shortName=shortName)
+
+def makeFiling():
+    filing = Filing.__new__(Filing)
+    filing.modelXbrl = SimpleNamespace(modelDocument=None, messages=[])
+    filing.modelXbrl.info = lambda code, message, **kwargs: filing.modelXbrl.messages.append((kwargs["presentationGroup"], kwargs["columns"]))
+    return filing
+
+def outcome(cubes):
+    return [([col.isHidden for col in cube.embeddingList[0].report.colList], cube.embeddingList[0].hasElementsAndElementMemberPairs)
+            for cube in cubes]
+
+def test_filterOutColumnsWhereAllElementsAreInOtherReports():
+    balanceSheet = makeCube("Balance Sheet", "statement", [makeCol(["Assets", "Cash"], [], 0), makeCol(["Assets", "Liabilities"], [], 1)])
+    cashFlow = makeCube("Cash Flow", "statement", [makeCol(["Cash"], [], 0), makeCol(["Cash", "Capex"], [], 1)])
+    details = makeCube("Details", "disclosure", [makeCol(["Assets"], [], 0)])
+    filing = makeFiling()
+    filing.filterOutColumnsWhereAllElementsAreInOtherReports([balanceSheet, cashFlow, details])
+    # the balance sheet's Cash column is hidden, so the cash flow is then the only report with Cash, and keeps its columns
+    assert outcome([balanceSheet, cashFlow]) == [([True, False], {"Assets", "Liabilities"}), ([False, False], {"Cash", "Capex"})]
+    assert filing.modelXbrl.messages == [("Balance Sheet", "1(c0)")]
+
+def test_statementOfEquityIsNotFilteredOut():
+    equity = makeCube("Equity", "statement", [makeCol(["Cash"], [], 0), makeCol(["Cash", "Dividends"], [], 1)], isStatementOfEquity=True)
+    details = makeCube("Details", "disclosure", [makeCol(["Cash"], [], 0)])
+    filing = makeFiling()
+    filing.filterOutColumnsWhereAllElementsAreInOtherReports([equity, details])
+    assert outcome([equity]) == [([False, False], {"Cash", "Dividends"})]
+    assert filing.modelXbrl.messages == []
+
+def test_allColumnsInOtherReportsAreKept():
+    # hiding every visible column would leave nothing, so none are hidden
+    balanceSheet = makeCube("Balance Sheet", "statement", [makeCol(["Assets"], [], 0), makeCol(["Assets", "Cash"], [], 1)])
+    details = makeCube("Details", "disclosure", [makeCol(["Assets", "Cash"], [], 0)])
+    filing = makeFiling()
+    filing.filterOutColumnsWhereAllElementsAreInOtherReports([balanceSheet, details])
+    assert outcome([balanceSheet]) == [([False, False], {"Assets", "Cash"})]
+    assert filing.modelXbrl.messages == []
+
+def test_elementMemberPairNotInOtherReportsKeepsColumn():
+    balanceSheet = makeCube("Balance Sheet", "statement", [makeCol(["Assets"], [("Assets", "Segment")], 0),
+                                                            makeCol(["Assets"], [], 1),
+                                                            makeCol(["Liabilities"], [], 2)])
+    details = makeCube("Details", "disclosure", [makeCol(["Assets"], [], 0)])
+    filing = makeFiling()
+    filing.filterOutColumnsWhereAllElementsAreInOtherReports([balanceSheet, details])
+    # the kept elements replace both hasElements and hasElementsAndElementMemberPairs, without the member pairs
+    assert outcome([balanceSheet]) == [([False, True, False], {"Assets", "Liabilities"})]
+    assert filing.modelXbrl.messages == [("Balance Sheet", "2(c1)")]
+
+def test_statementsOwnElementsAreNotInOtherReports():
+    balanceSheet = makeCube("Balance Sheet", "statement", [makeCol(["Assets"], [], 0), makeCol(["Assets", "Liabilities"], [], 1)])
+    filing = makeFiling()
+    filing.filterOutColumnsWhereAllElementsAreInOtherReports([balanceSheet])
+    assert outcome([balanceSheet]) == [([False, False], {"Assets", "Liabilities"})]
+    assert filing.modelXbrl.messages == []
+
+@pytest.mark.parametrize("otherCubeFlags", [{"noFactsOrAllFactsSuppressed": True}, {"isEmbeddingOrReportBroken": True}])
+def test_suppressedOrBrokenReportsAreNotOtherReports(otherCubeFlags):
+    balanceSheet = makeCube("Balance Sheet", "statement", [makeCol(["Assets"], [], 0), makeCol(["Liabilities"], [], 1)])
+    details = makeCube("Details", "disclosure", [makeCol(["Assets"], [], 0)], **otherCubeFlags)
+    filing = makeFiling()
+    filing.filterOutColumnsWhereAllElementsAreInOtherReports([balanceSheet, details])
+    assert outcome([balanceSheet]) == [([False, False], {"Assets", "Liabilities"})]
+    assert filing.modelXbrl.messages == []
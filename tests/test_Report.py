@@ -0,0 +1,79 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+Report's redundant column hiding and the occupancy bitsets of its merge passes.
+'''
+import pytest
+
+pytest.importorskip("arelle")
+from render.Report import Report, Row, Column
+
+def makeReport(rows=(), cols=()):
+    # rows: (isHidden, cellList) of each row, cols: (isHidden, factList) of each col
+    report = Report.__new__(Report)
+    report.numVisibleRows = report.numVisibleColumns = 0
+    report.rowList, report.colList = [], []
+    for i, (isHidden, cellList) in enumerate(rows):
+        row = Row.__new__(Row)
+        row.report, row.index, row.isHidden, row.cellList = report, i, isHidden, cellList
+        report.rowList.append(row)
+    for i, (isHidden, factList) in enumerate(cols):
+        col = Column.__new__(Column)
+        col.report, col.index, col.isHidden, col.factList = report, i, isHidden, factList
+        report.colList.append(col)
+    return report
+
+a, b, c = object(), object(), object()  # facts
+
+@pytest.mark.parametrize("factLists, isHidden, hiddenCols", [
+    # a column with the same facts as an earlier column is hidden, whatever their order or repetition
+    (([a, b], [b, a], [a, a, b]), (), [False, True, True]),
+    # a column whose facts are a proper subset of another column's facts is hidden, before or after it
+    (([a], [a, b], [b]), (), [True, False, True]),
+    (([a], [a, b], [a, b, c]), (), [True, True, False]),
+    # a column with a fact not in any other column is kept
+    (([a], [b], [b, c]), (), [False, True, False]),
+    # an empty column is hidden when there is any other column, and the first of only empty columns is kept
+    (([], [a]), (), [True, False]),
+    (([], []), (), [False, True]),
+    # columns already hidden don't hide others
+    (([a, b], [a]), (True, False), [True, False]),
+])
+def test_hideRedundantColumns(factLists, isHidden, hiddenCols):
+    report = makeReport(cols=[(i < len(isHidden) and isHidden[i], factList) for i, factList in enumerate(factLists)])
+    report.hideRedundantColumns()
+    assert [col.isHidden for col in report.colList] == hiddenCols
+    assert report.numVisibleColumns == sum(isHidden) - sum(hiddenCols)  # hide() decrements it for each newly hidden col
+
+cell = object()
+grid = makeReport(rows=((False, [cell, None, cell, None]),
+                        (True, [cell, cell, cell, cell]),
+                        (False, [None, cell, None, cell]),
+                        (False, [None, None, cell, cell])),
+                  cols=((False, []), (False, []), (True, []), (False, [])))
+
+def test_occupancy():
+    # bit i for the i-th visible col of a row, or visible row of a col
+    assert [grid.occupancy('row', row) for row in grid.rowList] == [0b001, 0b111, 0b110, 0b100]
+    assert [grid.occupancy('col', col) for col in grid.colList] == [0b001, 0b010, 0b101, 0b110]
+
+@pytest.mark.parametrize("rowOrColStr, indexes, overlap", [
+    ('row', (0, 2), False),
+    ('row', (0, 3), False),  # their cells in the same col are in a hidden col
+    ('row', (2, 3), True),
+    ('row', (0, 2, 3), True),
+    ('row', (0, 1), True),  # a hidden row's cells count for itself
+    ('col', (0, 1), False),  # their cells in the same row are in a hidden row
+    ('col', (0, 2), True),
+    ('col', (1, 3), True),
+])
+def test_doVectorsOverlap(rowOrColStr, indexes, overlap):
+    rowOrColList = grid.rowList if rowOrColStr == 'row' else grid.colList
+    rowsOrCols = [rowOrColList[i] for i in indexes]
+    assert grid.doVectorsOverlap(rowsOrCols, rowOrColStr) == overlap
+    occupancies = {}
+    assert grid.doVectorsOverlap(rowsOrCols, rowOrColStr, occupancies) == overlap
+    assert grid.doVectorsOverlap(rowsOrCols, rowOrColStr, occupancies) == overlap  # from occupancies
+    assert set(occupancies) <= set(rowsOrCols)
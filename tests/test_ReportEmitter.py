@@ -0,0 +1,33 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+An R file which fails to be transformed doesn't stop the other R files being written, and is reported by
+ReportEmitter.close, which stops the emitter's threads.
+'''
+import pytest
+
+pytest.importorskip("arelle")
+from render.IoManager import ReportEmitter
+
+def produce(name):
+    def _produce():
+        if name == "R2.htm":
+            raise ValueError("xslt failed")
+        return name
+    return _produce
+
+@pytest.mark.parametrize("numThreads", [1, 4])
+def test_failedOutput(numThreads):
+    emitter = ReportEmitter(numThreads)
+    written = []
+    for name in ("R1.htm", "R2.htm", "R3.htm"):
+        emitter.emit(produce(name), written.append, name)
+    emitter.emitWrite(lambda _ignored: written.append("BarChart1.png"), "BarChart1.png")
+    with pytest.raises(RuntimeError, match="^R2.htm was not written: xslt failed$") as excinfo:
+        emitter.close()
+    assert isinstance(excinfo.value.__cause__, ValueError)
+    assert written == ["R1.htm", "R3.htm", "BarChart1.png"]
+    assert emitter.executor is None and not emitter.pending
+    emitter.close()  # failures are raised once
@@ -0,0 +1,50 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+Members of validate's report zip written by the renderer's file object and file writers have the report zip's
+compression: stored for already compressed media, otherwise deflated at its level.
+'''
+import io, os, zipfile
+import pytest
+
+pytest.importorskip("arelle")
+from validate.ReportZip import ReportZipFile
+from render.IoManager import zipWriteFileObject, moveToZip
+
+text = "".join("<Row><Id>{}</Id><Label>Revenues, net of returns</Label></Row>\n".format(i % 97) for i in range(5000)).encode()
+
+def test_zipWriteFileObject():
+    stream = io.BytesIO()
+    with ReportZipFile(stream, "w", compresslevel=1, threads=1) as zf:
+        zipWriteFileObject(zf, "image.png", io.BytesIO(text))
+        zipWriteFileObject(zf, "R1.htm", io.BytesIO(text))
+        zf.writestr("R2.htm", text)
+    with zipfile.ZipFile(stream) as zf:
+        assert zf.getinfo("image.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("R1.htm").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("R1.htm").compress_size == zf.getinfo("R2.htm").compress_size
+        assert zf.read("R1.htm") == zf.read("image.png") == text
+
+def test_zipWriteFileObjectZipFile():
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zipWriteFileObject(zf, "R1.htm", io.BytesIO(text))
+        zf.writestr("R2.htm", text)
+    with zipfile.ZipFile(stream) as zf:
+        assert zf.getinfo("R1.htm").compress_size == zf.getinfo("R2.htm").compress_size
+        assert zf.read("R1.htm") == text
+
+def test_moveToZip(tmp_path):
+    stream = io.BytesIO()
+    with ReportZipFile(stream, "w", compresslevel=1, threads=1) as zf:
+        for name in ("image.jpg", "R1.htm"):
+            path = tmp_path / name
+            path.write_bytes(text)
+            moveToZip(zf, str(path), name)
+            assert not os.path.exists(path)
+        zf.writestr("R2.htm", text)
+    with zipfile.ZipFile(stream) as zf:
+        assert zf.getinfo("image.jpg").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("R1.htm").compress_size == zf.getinfo("R2.htm").compress_size
@@ -0,0 +1,94 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+Validation rule units selected and skipped by --validation-rules-select and --validation-rules-skip, and the
+--validation-rule-profile json, of EFM validation of a small inline instance run by arelle's command line.
+'''
+import json, os, re, subprocess, sys
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip("arelle")
+from validate.RuleRegistry import ruleUnits, ValidationRules
+
+validateDir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "validate")
+
+files = {
+"ext.xsd": '''<schema xmlns="http://www.w3.org/2001/XMLSchema" xmlns:xbrli="http://www.xbrl.org/2003/instance"
+  xmlns:ext="http://example.com/ext" targetNamespace="http://example.com/ext" elementFormDefault="qualified">
+  <import namespace="http://www.xbrl.org/2003/instance" schemaLocation="http://www.xbrl.org/2003/xbrl-instance-2003-12-31.xsd"/>
+  <element id="ext_Cash" name="Cash" type="xbrli:monetaryItemType" substitutionGroup="xbrli:item" xbrli:periodType="instant" nillable="true"/>
+</schema>''',
+# the inl prefix of the inline XBRL namespace is reported by efm.inline (EFM.5.02.05.standardNamespacePrefix)
+"doc.htm": '''<html xmlns="http://www.w3.org/1999/xhtml" xmlns:inl="http://www.xbrl.org/2013/inlineXBRL"
+  xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:link="http://www.xbrl.org/2003/linkbase"
+  xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:iso4217="http://www.xbrl.org/2003/iso4217" xmlns:ext="http://example.com/ext">
+<head><title>doc</title></head>
+<body>
+<div style="display:none"><inl:header><inl:references><link:schemaRef xlink:type="simple" xlink:href="ext.xsd"/></inl:references>
+<inl:resources>
+<xbrli:context id="c1"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000000001</xbrli:identifier></xbrli:entity>
+<xbrli:period><xbrli:instant>2025-12-31</xbrli:instant></xbrli:period></xbrli:context>
+<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>
+</inl:resources></inl:header></div>
+<p><inl:nonFraction name="ext:Cash" contextRef="c1" unitRef="usd" decimals="0">100</inl:nonFraction></p>
+</body></html>''',
+}
+inlineCode = "EFM.5.02.05.standardNamespacePrefix"
+nonSkippableCodes = ("EFM.6.05.20.deiFactsMissing", # efm.requiredFacts
+                     "EFM.6.07.04", # efm.dts
+                     "EFM.6.12.03") # efm.relationships
+
+def validate(tmp_path, *options):
+    for name, text in files.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+    process = subprocess.run([sys.executable, "-m", "arelle.CntlrCmdLine", "--file", str(tmp_path / "doc.htm"),
+                              "--plugins", validateDir, "--disclosureSystem", "efm-pragmatic", "--validate",
+                              "--internetConnectivity", "offline"] + list(options),
+                             env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path), XDG_CONFIG_HOME=str(tmp_path / "config")),
+                             capture_output=True, text=True)
+    assert process.returncode == 0, process.stdout + process.stderr
+    return set(re.findall(r"^\[([^\]]+)\]", process.stdout, re.MULTILINE))
+
+@pytest.mark.parametrize("select, skip, selectedNames", [
+    (None, None, ["efm.contexts", "efm.inline", "efm.dimensions", "DQC.US.0001", "DQC.US.0004"]),
+    (None, r"efm\..*|DQC\.US\.0001", ["efm.contexts", "DQC.US.0004"]),
+    (r"DQC\.US\.00(01|04)", r"DQC\.US\.0004", ["efm.contexts", "DQC.US.0001"]),
+])
+def test_selected(select, skip, selectedNames):
+    # rule units not declared skippable are selected whatever the select and skip patterns
+    validationRules = ValidationRules(SimpleNamespace(modelXbrl=None),
+                                      SimpleNamespace(validationRulesSelect=select, validationRulesSkip=skip))
+    assert [name for name in ("efm.contexts", "efm.inline", "efm.dimensions", "DQC.US.0001", "DQC.US.0004")
+            if validationRules.selected(name)] == selectedNames
+    assert not validationRules.isProfiling
+
+def test_allRulesRun(tmp_path):
+    messageCodes = validate(tmp_path)
+    assert inlineCode in messageCodes
+    assert messageCodes.issuperset(nonSkippableCodes)
+
+@pytest.mark.parametrize("options", [
+    ("--validation-rules-skip", r"efm\.inline"),
+    ("--validation-rules-skip", r"efm\..*"), # matches non-skippable units too
+    ("--validation-rules-select", r"efm\.dts|efm\.relationships"), # non-skippable units, efm.inline not selected
+])
+def test_skippedRulesDontRun(tmp_path, options):
+    messageCodes = validate(tmp_path, *options)
+    assert inlineCode not in messageCodes
+    assert messageCodes.issuperset(nonSkippableCodes)
+
+def test_ruleProfile(tmp_path):
+    profileFile = str(tmp_path / "profile.json")
+    validate(tmp_path, "--validation-rules-skip", r"efm\.inline", "--validation-rule-profile", profileFile)
+    with open(profileFile, encoding="utf-8") as fh:
+        instances = json.load(fh)["instances"]
+    assert [instance["instance"] for instance in instances] == ["doc.htm"]
+    # every rule unit is begun, a skipped one too, in the order of validateFiling, without DQC rules as xule isn't loaded
+    rules = instances[0]["rules"]
+    assert [rule["rule"] for rule in rules] == list(ruleUnits)
+    assert all(rule["calls"] == 1 and rule["seconds"] >= 0 and "peakAllocatedBytes" not in rule for rule in rules)
+    assert rules[0]["description"] == ruleUnits["efm.setup"].description
+    assert rules[0]["inputs"] == list(ruleUnits["efm.setup"].inputs)
@@ -0,0 +1,26 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+First pass R file html kept for the dissemination pass is moved to disk once it exceeds the spool size, and
+each entry is released when it is reused.
+'''
+import pytest
+
+pytest.importorskip("arelle")
+from render.IoManager import SpooledTransformCache
+
+def test_spooledTransformCache(monkeypatch):
+    monkeypatch.setattr(SpooledTransformCache, "spoolMaxSize", 1000)
+    cache = SpooledTransformCache()
+    cache[("digest1", ())] = b"<html>R1</html>"
+    assert cache.stream.name is None  # in memory while small
+    cache[("digest2", ())] = b"<html>" + b"R2 " * 500 + b"</html>"
+    assert cache.stream.name is not None  # rolled over to a temporary file
+    assert len(cache) == 2
+    assert cache.pop(("digest2", ())) == b"<html>" + b"R2 " * 500 + b"</html>"
+    assert cache.pop(("digest2", ())) is None
+    assert cache.pop(("digest1", ())) == b"<html>R1</html>"
+    assert cache.pop(("digest3", ()), b"") == b"" and len(cache) == 0
+    cache.close()
@@ -0,0 +1,152 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+A filing DTS which adopts preloaded standard taxonomy documents (as in a daemon fork-server child) has the same
+documents, concepts, role types and relationship sets, and validates the same, as when it loads them itself.
+'''
+import pytest
+
+pytest.importorskip("arelle")
+from arelle import XbrlConst
+from arelle.Cntlr import Cntlr
+from arelle.ModelRelationshipSet import ModelRelationshipSet
+from arelle.ValidateXbrl import ValidateXbrl
+import render
+from render import TaxonomyPreloader
+
+stdTaxonomy = {
+"std.xsd": '''<schema xmlns="http://www.w3.org/2001/XMLSchema" xmlns:xbrli="http://www.xbrl.org/2003/instance"
+  xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink"
+  xmlns:std="http://example.com/std" xmlns:stdt="http://example.com/std-types"
+  targetNamespace="http://example.com/std" elementFormDefault="qualified">
+  <annotation><appinfo>
+    <link:roleType roleURI="http://example.com/std/role/BalanceSheet" id="BalanceSheet">
+      <link:definition>0001 - Statement - Balance Sheet</link:definition>
+      <link:usedOn>link:presentationLink</link:usedOn>
+    </link:roleType>
+    <link:linkbaseRef xlink:type="simple" xlink:href="std-pre.xml" xlink:arcrole="http://www.w3.org/1999/xlink/properties/linkbase"/>
+    <link:linkbaseRef xlink:type="simple" xlink:href="std-lab.xml" xlink:arcrole="http://www.w3.org/1999/xlink/properties/linkbase"/>
+  </appinfo></annotation>
+  <import namespace="http://www.xbrl.org/2003/instance" schemaLocation="http://www.xbrl.org/2003/xbrl-instance-2003-12-31.xsd"/>
+  <import namespace="http://example.com/std-types" schemaLocation="std-types.xsd"/>
+  <element name="BalanceSheetAbstract" id="std_BalanceSheetAbstract" type="xbrli:stringItemType" substitutionGroup="xbrli:item" abstract="true" nillable="true" xbrli:periodType="duration"/>
+  <element name="Assets" id="std_Assets" type="xbrli:monetaryItemType" substitutionGroup="xbrli:item" nillable="true" xbrli:periodType="instant" xbrli:balance="debit"/>
+  <element name="Cash" id="std_Cash" type="xbrli:monetaryItemType" substitutionGroup="xbrli:item" nillable="true" xbrli:periodType="instant" xbrli:balance="debit"/>
+  <element name="Ticker" id="std_Ticker" type="stdt:tickerItemType" substitutionGroup="xbrli:item" nillable="true" xbrli:periodType="duration"/>
+</schema>''',
+"std-types.xsd": '''<schema xmlns="http://www.w3.org/2001/XMLSchema" xmlns:xbrli="http://www.xbrl.org/2003/instance"
+  targetNamespace="http://example.com/std-types" elementFormDefault="qualified">
+  <import namespace="http://www.xbrl.org/2003/instance" schemaLocation="http://www.xbrl.org/2003/xbrl-instance-2003-12-31.xsd"/>
+  <complexType name="tickerItemType"><simpleContent><restriction base="xbrli:tokenItemType">
+    <pattern value="[A-Z]{1,5}"/></restriction></simpleContent></complexType>
+</schema>''',
+"std-pre.xml": '''<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:roleRef roleURI="http://example.com/std/role/BalanceSheet" xlink:type="simple" xlink:href="std.xsd#BalanceSheet"/>
+  <link:presentationLink xlink:type="extended" xlink:role="http://example.com/std/role/BalanceSheet">
+    <link:loc xlink:type="locator" xlink:href="std.xsd#std_BalanceSheetAbstract" xlink:label="abstract"/>
+    <link:loc xlink:type="locator" xlink:href="std.xsd#std_Cash" xlink:label="cash"/>
+    <link:loc xlink:type="locator" xlink:href="std.xsd#std_Assets" xlink:label="assets"/>
+    <link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child" xlink:from="abstract" xlink:to="cash" order="1"/>
+    <link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child" xlink:from="abstract" xlink:to="assets" order="2"/>
+  </link:presentationLink>
+</link:linkbase>''',
+"std-lab.xml": '''<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:labelLink xlink:type="extended" xlink:role="http://www.xbrl.org/2003/role/link">
+    <link:loc xlink:type="locator" xlink:href="std.xsd#std_Assets" xlink:label="assets"/>
+    <link:label xlink:type="resource" xlink:label="assets_lbl" xlink:role="http://www.xbrl.org/2003/role/label" xml:lang="en-US">Assets</link:label>
+    <link:label xlink:type="resource" xlink:label="assets_lbl" xlink:role="http://www.xbrl.org/2003/role/totalLabel" xml:lang="en-US">Total assets</link:label>
+    <link:labelArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/concept-label" xlink:from="assets" xlink:to="assets_lbl"/>
+    <link:loc xlink:type="locator" xlink:href="std.xsd#std_Cash" xlink:label="cash"/>
+    <link:label xlink:type="resource" xlink:label="cash_lbl" xlink:role="http://www.xbrl.org/2003/role/label" xml:lang="en-US">Cash</link:label>
+    <link:labelArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/concept-label" xlink:from="cash" xlink:to="cash_lbl"/>
+  </link:labelLink>
+</link:linkbase>'''}
+
+extension = {
+"ext.xsd": '''<schema xmlns="http://www.w3.org/2001/XMLSchema" xmlns:xbrli="http://www.xbrl.org/2003/instance"
+  xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink"
+  targetNamespace="http://example.com/ext" elementFormDefault="qualified">
+  <annotation><appinfo>
+    <link:linkbaseRef xlink:type="simple" xlink:href="ext-pre.xml" xlink:arcrole="http://www.w3.org/1999/xlink/properties/linkbase"/>
+  </appinfo></annotation>
+  <import namespace="http://www.xbrl.org/2003/instance" schemaLocation="http://www.xbrl.org/2003/xbrl-instance-2003-12-31.xsd"/>
+  <import namespace="http://example.com/std" schemaLocation="std.xsd"/>
+  <element name="RestrictedCash" id="ext_RestrictedCash" type="xbrli:monetaryItemType" substitutionGroup="xbrli:item" nillable="true" xbrli:periodType="instant" xbrli:balance="debit"/>
+</schema>''',
+"ext-pre.xml": '''<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:roleRef roleURI="http://example.com/std/role/BalanceSheet" xlink:type="simple" xlink:href="std.xsd#BalanceSheet"/>
+  <link:presentationLink xlink:type="extended" xlink:role="http://example.com/std/role/BalanceSheet">
+    <link:loc xlink:type="locator" xlink:href="std.xsd#std_BalanceSheetAbstract" xlink:label="abstract"/>
+    <link:loc xlink:type="locator" xlink:href="ext.xsd#ext_RestrictedCash" xlink:label="restricted"/>
+    <link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child" xlink:from="abstract" xlink:to="restricted" order="3"/>
+  </link:presentationLink>
+</link:linkbase>'''}
+
+class PluginHooks:
+    # the render plugin's fork-server hooks, as the arelle plugin manager would call them
+    hookMethods = {"ModelDocument.PullLoader": render.edgarRendererAdoptPreloadedDocument,
+                   "ModelXbrl.Init": render.edgarRendererModelXbrlInit}
+
+    def hooks(self, hookName):
+        if hookName in self.hookMethods:
+            yield self.hookMethods[hookName]
+
+@pytest.fixture
+def cntlr(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    cntlr = Cntlr(hasGui=False, logFileName="logToBuffer")
+    cntlr.webCache.workOffline = True
+    cntlr.plugins = PluginHooks()
+    # as a daemon fork-server child, which exits without closing the template of which it adopted documents
+    monkeypatch.setattr(TaxonomyPreloader, "template", None)
+    monkeypatch.setattr(TaxonomyPreloader, "docContributions", {})
+    monkeypatch.setattr(TaxonomyPreloader, "adoptionEnabled", False)
+    yield cntlr
+    cntlr.close()
+
+def loadDts(cntlr, entryPoint):
+    modelXbrl = cntlr.modelManager.load(entryPoint)
+    ValidateXbrl(modelXbrl).validate(modelXbrl)
+    return modelXbrl
+
+def dtsSummary(modelXbrl):
+    def qn(modelObject):
+        return str(modelObject.qname)
+    labelRelationships = ModelRelationshipSet(modelXbrl, XbrlConst.conceptLabel)
+    return {"documents": sorted((url, doc.type) for url, doc in modelXbrl.urlDocs.items()),
+            "namespaces": sorted((ns, sorted(doc.uri for doc in docs)) for ns, docs in modelXbrl.namespaceDocs.items()),
+            "concepts": sorted((str(qname), str(concept.typeQname), concept.periodType, concept.balance, concept.isAbstract,
+                                str(concept.substitutionGroupQname), concept.modelDocument.uri)
+                               for qname, concept in modelXbrl.qnameConcepts.items()),
+            "types": sorted((str(qname), str(modelType.baseXsdType)) for qname, modelType in modelXbrl.qnameTypes.items()),
+            "nameConcepts": sorted((name, sorted(qn(concept) for concept in concepts)) for name, concepts in modelXbrl.nameConcepts.items()),
+            "roleTypes": sorted((uri, [roleType.definition for roleType in roleTypes]) for uri, roleTypes in modelXbrl.roleTypes.items()),
+            "parentChild": sorted((rel.linkrole, qn(rel.fromModelObject), qn(rel.toModelObject), rel.orderDecimal)
+                                  for rel in ModelRelationshipSet(modelXbrl, XbrlConst.parentChild).modelRelationships),
+            "labels": sorted((qn(rel.fromModelObject), rel.toModelObject.role, rel.toModelObject.xmlLang, rel.toModelObject.textValue)
+                             for rel in labelRelationships.modelRelationships),
+            "langs": sorted(modelXbrl.langs), "labelroles": sorted(modelXbrl.labelroles),
+            "errors": list(modelXbrl.errors)}
+
+def test_adoptedDocuments(tmp_path, cntlr, monkeypatch):
+    for fileName, content in dict(stdTaxonomy, **extension).items():
+        (tmp_path / fileName).write_text(content, encoding="utf-8")
+    entryPoint = str(tmp_path / "ext.xsd")
+    loaded = loadDts(cntlr, entryPoint)
+    expected = dtsSummary(loaded)
+    loaded.close()
+    assert expected["errors"] == [] and len(expected["parentChild"]) == 3 and len(expected["labels"]) == 3
+
+    monkeypatch.setattr(TaxonomyPreloader, "latestStandardTaxonomyHrefs", lambda disclosureSystem: [str(tmp_path / "std.xsd")])
+    assert TaxonomyPreloader.preload(cntlr) >= 4
+    TaxonomyPreloader.enableAdoption()
+    preloaded = {doc: doc.objectIndex for doc in TaxonomyPreloader.docContributions}
+    adopting = loadDts(cntlr, entryPoint)
+    adopted = [doc for doc in preloaded if doc.modelXbrl is adopting]
+    assert {doc.basename for doc in adopted} >= set(stdTaxonomy)  # the standard taxonomy was not loaded again
+    assert all(doc.objectIndex == preloaded[doc] for doc in adopted)
+    assert all(adopting.modelObject(doc.objectIndex) is doc for doc in adopted)
+    assert dtsSummary(adopting) == expected
+    adopting.close()
@@ -0,0 +1,42 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+The ixt-sec transforms of the tests.xml testcase, applied by transformValues and by the benchmark script.
+'''
+import json, os, subprocess, sys
+from xml.etree import ElementTree
+import pytest
+
+pytest.importorskip("arelle")
+from arelle.formula.XPathContext import FunctionArgType
+from transform import transformValues
+
+confDir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "transform", "conf")
+caseNS = "{http://xbrl.org/2011/conformance-rendering/transforms}"
+
+def test_transformValues(monkeypatch):
+    monkeypatch.setattr("builtins._", lambda message: message, raising=False)  # FunctionArgType's message
+    for transformElt in ElementTree.parse(os.path.join(confDir, "tests.xml")).getroot().iter(caseNS + "transform"):
+        variationElts = list(transformElt.iter(caseNS + "variation"))
+        inputs = [variationElt.get("input") for variationElt in variationElts]
+        # repeated inputs are transformed once, and have the same result in each of their places
+        results = transformValues(transformElt.get("name"), inputs + inputs[::-1])
+        assert results[len(inputs):] == results[:len(inputs)][::-1]
+        for variationElt, result in zip(variationElts, results):
+            if variationElt.get("result") == "valid":
+                assert not isinstance(result, FunctionArgType) and str(result) == variationElt.get("output"), \
+                       (transformElt.get("name"), variationElt.get("input"))
+            else:
+                assert isinstance(result, FunctionArgType), (transformElt.get("name"), variationElt.get("input"))
+
+def test_benchmarkIxtSecTests(tmp_path):
+    jsonFile = str(tmp_path / "benchmark.json")
+    process = subprocess.run([sys.executable, os.path.join(confDir, "benchmarkIxtSecTests.py"), "--repeat", "1", "--json", jsonFile],
+                             env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)), capture_output=True, text=True)
+    assert process.returncode == 0, process.stdout + process.stderr
+    with open(jsonFile, encoding="utf-8") as fh:
+        results = json.load(fh)["transforms"]
+    assert [result["transform"] for result in results][:3] == ["boolballotbox", "yesnoballotbox", "countrynameen"]
+    assert all(result["inputs"] and not result["unexpectedResults"] for result in results)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+Micro-benchmark of the ixt-sec transforms over the inputs of the tests.xml testcase file.
+
+Each transform is applied to its variations' inputs, one call at a time (reporting throughput and mean,
+median and p99 latency per call) and as one batch by transformValues, so regressions in the transform
+patterns (such as the numwordsen and durwordsen alternations) show up before deployment.  The valid or
+invalid result of each input is compared with the testcase's expectation.
+
+Requires arelle to be importable (installed or on PYTHONPATH), as the transforms raise its exceptions:
+    python3 benchmarkIxtSecTests.py [--repeat 50] [--transform countrynameen] [--max-p99 200] [--json out.json]
+
+Exits with status 1 when any transform's p99 latency exceeds --max-p99 microseconds or a result is not
+as expected by the testcase.
+'''
+import os, sys, time, json, gettext
+from collections import OrderedDict
+from optparse import OptionParser
+from xml.etree import ElementTree
+
+confDir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(confDir))) # directory containing the transform package
+gettext.install("arelle") # the transforms' FunctionArgType messages are translated by _, as when run in arelle
+from transform import secTransforms, transformValues
+from arelle.formula.XPathContext import FunctionArgType
+
+caseNS = "{http://xbrl.org/2011/conformance-rendering/transforms}"
+
+def testcaseInputs(testcaseFile):
+    # {transform local name: [(input, isValid), ...]} in testcase order
+    inputs = OrderedDict()
+    for transformElt in ElementTree.parse(testcaseFile).getroot().iter(caseNS + "transform"):
+        name = transformElt.get("name").rpartition(":")[2]
+        inputs.setdefault(name, []).extend((variationElt.get("input"), variationElt.get("result") == "valid")
+                                           for variationElt in transformElt.iter(caseNS + "variation"))
+    return inputs
+
+def percentile(sortedTimes, pct):
+    return sortedTimes[min(len(sortedTimes) - 1, int(len(sortedTimes) * pct / 100.0))]
+
+def benchmark(name, variations, repeat):
+    transform = secTransforms[name]
+    values = [value for value, isValid in variations]
+    times = []
+    for _i in range(repeat):
+        for value in values:
+            start = time.perf_counter_ns()
+            try:
+                transform(value)
+            except FunctionArgType:
+                pass
+            times.append(time.perf_counter_ns() - start)
+    batchStart = time.perf_counter_ns()
+    for _i in range(repeat):
+        results = transformValues(transform, values)
+    batchNs = (time.perf_counter_ns() - batchStart) / repeat
+    unexpected = [value for (value, isValid), result in zip(variations, results)
+                  if isValid == isinstance(result, FunctionArgType)]
+    times.sort()
+    totalNs = sum(times)
+    return OrderedDict((("transform", name),
+                        ("inputs", len(values)),
+                        ("callsPerSecond", round(len(times) * 1e9 / totalNs) if totalNs else 0),
+                        ("meanMicroseconds", round(totalNs / len(times) / 1000.0, 2)),
+                        ("p50Microseconds", round(percentile(times, 50) / 1000.0, 2)),
+                        ("p99Microseconds", round(percentile(times, 99) / 1000.0, 2)),
+                        ("batchValuesPerSecond", round(len(values) * 1e9 / batchNs) if batchNs else 0),
+                        ("unexpectedResults", unexpected)))
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("--testcase", dest="testcase", default=os.path.join(confDir, "tests.xml"),
+                      help="Testcase file of transform variations (default tests.xml).")
+    parser.add_option("--transform", action="append", dest="transforms", default=[],
+                      help="ixt-sec transform local name to benchmark, may be repeated (default all in the testcase).")
+    parser.add_option("--repeat", type="int", dest="repeat", default=50,
+                      help="Times each input is transformed (default 50).")
+    parser.add_option("--max-p99", type="float", dest="maxP99",
+                      help="Fail when a transform's p99 latency exceeds this many microseconds.")
+    parser.add_option("--json", dest="jsonFile",
+                      help="Write the results to this json file.")
+    options, args = parser.parse_args()
+
+    inputs = testcaseInputs(options.testcase)
+    failed = False
+    results = []
+    print("{:<24}{:>7}{:>12}{:>10}{:>10}{:>10}{:>12}{:>12}".format(
+          "transform", "inputs", "calls/s", "mean us", "p50 us", "p99 us", "batch/s", "unexpected"))
+    for name, variations in inputs.items():
+        if (options.transforms and name not in options.transforms) or name not in secTransforms or not variations:
+            continue
+        result = benchmark(name, variations, max(1, options.repeat))
+        results.append(result)
+        print("{transform:<24}{inputs:>7}{callsPerSecond:>12}{meanMicroseconds:>10}{p50Microseconds:>10}"
+              "{p99Microseconds:>10}{batchValuesPerSecond:>12}".format(**result) +
+              "{:>12}".format(len(result["unexpectedResults"])))
+        for value in result["unexpectedResults"]:
+            print("    unexpected result for input {!r}".format(value))
+        if result["unexpectedResults"] or (options.maxP99 is not None and result["p99Microseconds"] > options.maxP99):
+            failed = True
+    if options.jsonFile:
+        with open(options.jsonFile, "w", encoding="utf-8") as fh:
+            json.dump({"testcase": options.testcase, "repeat": options.repeat, "transforms": results}, fh, indent=1)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+Fact index of an instance for validateFiling (Filing.py), built in one pass over the instance facts on first
+use, so that checks and sevFacts look up facts by bucket instead of each scanning all the facts.
+
+Buckets are lists in document order of the facts (modelXbrl.facts, as scanned by the checks).
+'''
+from collections import defaultdict
+from arelle.ModelValue import qname
+from arelle.XmlValidateConst import VALID
+
+class FactIndex:
+    def __init__(self, modelXbrl):
+        self.modelXbrl = modelXbrl
+        self.isBuilt = False
+        self.qnamesByName = {} # prefixed name to qname, per deiDefaultPrefixedNamespaces of the instance
+        self.axesValsKeys = {} # by (axisKey, context id), memoized axesValsKey of Filing.py
+
+    def build(self):
+        self.ordinal = {} # document order position of fact
+        self.byQname = defaultdict(list)
+        self.byNamespace = defaultdict(list)
+        self.byContextID = defaultdict(list)
+        self.byContextDimAwareHash = defaultdict(list) # valid facts with a context
+        for i, f in enumerate(self.modelXbrl.facts):
+            self.ordinal[f] = i
+            factQname = f.qname
+            self.byQname[factQname].append(f)
+            self.byNamespace[factQname.namespaceURI].append(f)
+            self.byContextID[f.contextID].append(f)
+            if f.xValid >= VALID and f.context is not None:
+                self.byContextDimAwareHash[f.context.contextDimAwareHash].append(f)
+        self.isBuilt = True
+
+    def __getattr__(self, name): # buckets are built on first use
+        if name in ("ordinal", "byQname", "byNamespace", "byContextID", "byContextDimAwareHash") and not self.__dict__.get("isBuilt"):
+            self.build()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def factsByName(self, name, prefixedNamespaces):
+        # facts of a prefixed name (such as dei:DocumentType), from modelXbrl.factsByQname (including tuple contents)
+        if name not in self.qnamesByName:
+            self.qnamesByName[name] = qname(name, prefixedNamespaces)
+        return self.modelXbrl.factsByQname.get(self.qnamesByName[name])
+
+    def factsInContext(self, contextID):
+        return self.byContextID.get(contextID, ())
+
+    def hasFactInNamespace(self, pattern):
+        # pattern is a compiled regular expression matched to fact namespaces
+        return any(pattern.match(ns) for ns in self.byNamespace.keys())
+
+    def factsOfQnames(self, qnames):
+        # facts of any of the qnames in document order
+        return sorted((f for qn in qnames for f in self.byQname.get(qn, ())), key=self.ordinal.__getitem__)
@@ -24,7 +24,7 @@ from arelle.ModelDtsObject import ModelConcept, ModelResource
 from arelle.ModelXbrl import NONDEFAULT
 from arelle.PluginManager import pluginClassMethods
 from arelle.PrototypeDtsObject import LinkPrototype, LocPrototype, ArcPrototype
-from arelle.PythonUtil import pyNamedObject, strTruncate, normalizeSpace, lcStr, flattenSequence, flattenToSet, OrderedSet
+from arelle.PythonUtil import pyNamedObject, strTruncate, normalizeSpace, lcStr, flattenSequence, flattenToSet, OrderedSet, attrdict
 from arelle.UrlUtil import isHttpUrl
 from arelle.ValidateXbrlCalcs import inferredDecimals, rangeValue, roundValue, ONE
 from arelle.XmlValidate import VALID, INVALID
@@ -43,11 +43,14 @@ from .Consts import submissionTypesAllowingSeriesClasses, \
                     nsPatternNotAllowedinxBRLXML, subTypesWarningforxBRLXml
 
 from .Dimensions import checkFilingDimensions
+from .FactIndex import FactIndex
+from .RuleRegistry import ValidationRules
 from .PreCalAlignment import checkCalcsTreeWalk
 from .Util import conflictClassFromNamespace, abbreviatedNamespace, NOYEAR, WITHYEARandWILD, loadDeprecatedConceptDates, \
                     loadCustomAxesReplacements, loadNonNegativeFacts, loadDeiValidations, loadOtherStandardTaxonomies, \
                     loadUgtRelQnames, loadDqcRules, factBindings, leastDecimals, axisMemQnames, memChildQnames, \
-                    loadTaxonomyCompatibility, loadIxTransformRegistries, ValueRange, loadXuleConstantsForPythonRules
+                    loadTaxonomyCompatibility, loadIxTransformRegistries, ValueRange, loadXuleConstantsForPythonRules, \
+                    whereRegexOperators, WhereCondition
 from .XuleInterface import xuleValidate
 
 MIN_DOC_PER_END_DATE = ModelValue.dateTime("1980-01-01", type=ModelValue.DATE)
@@ -131,6 +134,9 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
     modelXbrl.modelManager.showStatus(_("validating {0}").format(disclosureSystem.name))
 
     val.modelXbrl.profileActivity()
+    validationRules = ValidationRules(val, getattr(getattr(modelXbrl.modelManager, "efmFiling", None), "options", None))
+    validationRules.begin("efm.setup")
+    factIndex = FactIndex(modelXbrl) # fact buckets, built on first use
     conceptsUsed = {} # key=concept object value=True if has presentation label
     labelsRelationshipSet = modelXbrl.relationshipSet(XbrlConst.conceptLabel)
     # genLabelsRelationshipSet = modelXbrl.relationshipSet(XbrlConst.elementLabel)
@@ -205,6 +211,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
         val.otherStandardTaxonomies = loadOtherStandardTaxonomies(modelXbrl, val)
         compatibleTaxonomies = loadTaxonomyCompatibility(modelXbrl)
     if isXbrlInstance:
+        validationRules.begin("efm.identifiers")
         deprecatedConceptDates = {}
         deprecatedConceptFacts = defaultdict(list) # index by concept Qname, value is list of facts
         deprecatedConceptContexts = defaultdict(list) # index by contextID, value is list of concept QNames of deprecated dimensions, members
@@ -312,6 +319,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                                 filerIdentifier=",".join(sorted(val.params["cikNameList"].keys()) if "cikNameList" in val.params else []))
             val.modelXbrl.profileActivity("... filer identifier checks", minTimeToShow=1.0)
 
+        validationRules.begin("efm.contexts")
         # taxonomy not allowed in xml-XBRL
         if not isInlineXbrl:
             for prefix, nsURL in modelXbrl.prefixedNamespaces.items():
@@ -446,6 +454,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 pass # something wrong with match table
         del uniqueContextHashes, contextsWithDisallowedOCEs, contextsWithDisallowedOCEcontent, nonStandardTypedDimensions, nonStandardReplacableDimensions
         val.modelXbrl.profileActivity("... filer context checks", minTimeToShow=1.0)
+        validationRules.begin("efm.facts")
 
 
         #fact items from standard context (no dimension)
@@ -699,6 +708,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 modelObject=modelXbrl, subType=submissionType, efmSection="0520", severityVerb="must", tag="DEI-Facts", context="Required Context")
 
         val.modelXbrl.profileActivity("... filer fact checks", minTimeToShow=1.0)
+        validationRules.begin("efm.instantDuration")
 
         if len(modelXbrl.ixdsUnmappedContexts) > 0:
             modelXbrl.error(("EFM.6.05.08", "GFM.1.02.08"),
@@ -790,6 +800,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
             del durationCntxStartDatetimes
             val.modelXbrl.profileActivity("... filer instant-duration checks", minTimeToShow=1.0)
 
+        validationRules.begin("efm.units")
         #6.5.19 required context
         #for c in sorted(candidateRequiredContexts, key=lambda c: (c.endDatetime, c.endDatetime-c.startDatetime), reverse=True):
         #    val.requiredContext = c
@@ -844,6 +855,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
 
         del deprecatedConceptContexts, deprecatedConceptFacts, deprecatedConceptDates, nonNegFacts
         val.modelXbrl.profileActivity("... filer unit checks", minTimeToShow=1.0)
+        validationRules.begin("efm.duplicateFacts")
 
 
         # EFM.6.05.14, GFM.1.02.13 xml:lang tests, as of v-17, full default lang is compared
@@ -931,6 +943,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 aspectEqualFacts.clear()
         del factForConceptContextUnitHash, aspectEqualFacts
         val.modelXbrl.profileActivity("... filer fact checks", minTimeToShow=1.0)
+        validationRules.begin("efm.labelsText")
 
         #6.5.14 facts without english text
         for keyNotDefaultLang, factNotDefaultLang in keysNotDefaultLang.items():
@@ -1052,6 +1065,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                                 edgarCode="dq-0557-Class-Id-Member-Not-In-Context",
                                 modelObject=(modelXbrl,classIdMember), classIdMember=classIdMemberName, subType=submissionType)
         val.modelXbrl.profileActivity("... filer label and text checks", minTimeToShow=1.0)
+        validationRules.begin("efm.submissionType")
 
         if isEFM:
             if attachmentDocumentType and deiDocumentType is not None:
@@ -1244,6 +1258,94 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 def __repr__(self):
                     return str(self.xValue)
 
+            axisPlans = {} # by axisKey, axis validation with axes resolved to qnames of this instance
+            def axisPlan(axisKey):
+                plan = axisPlans.get(axisKey)
+                if plan is None:
+                    axesValidations = deiValidations["axis-validations"][axisKey]
+                    axes = axesValidations["axes"]
+                    axesQNs = []
+                    for axis in axes:
+                        if axis is None:
+                            axesQNs.append(None)
+                        elif axis.startswith("!std!:"):
+                            for c in modelXbrl.nameConcepts.get(axis[6:],()):
+                                if c.qname.namespaceURI in disclosureSystem.standardTaxonomiesDict:
+                                    axesQNs.append(c.qname)
+                        elif axis.startswith("*:"):
+                            for c in modelXbrl.nameConcepts.get(axis[2:],()):
+                                axesQNs.append(c.qname)
+                        elif axis != "!not!":
+                            qn = qname(axis, deiDefaultPrefixedNamespaces)
+                            if qn is not None:
+                                axesQNs.append(qn)
+                    members = axesValidations.get("members")
+                    plan = axisPlans[axisKey] = attrdict(
+                        axes=axes,
+                        axesQNs=axesQNs, # None for no-dimension binding
+                        dimAxesQNs=[qn for qn in axesQNs if qn is not None],
+                        excludesAxes="!not!" in axes,
+                        axisOperator=axesValidations.get("axes-operator", "any"),
+                        matchCubes=axesValidations.get("cubes"),
+                        members=set(members) if members else None)
+                return plan
+
+            evalCodes = {} # compiled function call strings of where and reference function conditions
+            def evalCode(evalString):
+                if evalString not in evalCodes:
+                    evalCodes[evalString] = compile(evalString, "<ft-validations function>", "eval")
+                return evalCodes[evalString]
+
+            def whereConditionIsFalse(wValue, wCond):
+                wOp = wCond[0]
+                if wOp in whereRegexOperators: # pattern is compiled by loadDeiValidations for where and exclude fields
+                    pattern = wCond.pattern if isinstance(wCond, WhereCondition) else WhereCondition(wCond).pattern
+                    return (pattern.search(str(wValue)) is None) != wOp.startswith("!")
+                return ((wOp != "less than or equal" and (wValue not in wCond) == ("!not!" not in wCond)) or
+                        (wValue != "absent" and wOp == "less than or equal" and (wValue > wCond[1]) == ("!not!" not in wCond)))
+
+            def sevComparison(sev, otherFact):
+                names = sev.get("comparison-names")
+                refNames = sev.get("comparison-ref-names")
+                comparisonOperator = sev.get("comparison-operator")
+                tolerance = sev.get("comparison-tolerance", 0)
+                items1 = []
+                items2 = []
+                for name1 in names:
+                    for f in sevFacts(sev, name1, otherFact=otherFact, deduplicate=True):
+                        items1.append(f)
+                for name2 in refNames:
+                    for g in sevFacts(sev, name2, otherFact=otherFact, deduplicate=True):
+                        items2.append(g)
+                item1Vals = [f.xValue if f is not None else 0 for f in items1]
+                item2Vals = [g.xValue if g is not None else 0 for g in items2]
+                sum1 = sum(item1Vals)
+                sum2 = sum(item2Vals)
+                if ((comparisonOperator == "equal" and abs(sum1 - sum2) <= tolerance) or
+                    (comparisonOperator == "not-equal" and abs(sum1 - sum2) >= tolerance) or
+                    (comparisonOperator == "less than or equal" and (sum1 - sum2) <= tolerance) or
+                    (comparisonOperator == "less than" and (sum1 - sum2) < tolerance) or
+                    (comparisonOperator == "greater than or equal" and (sum1 - sum2) > tolerance) or
+                    (comparisonOperator == "greater" and (sum1 - sum2) > tolerance)):
+                    return True
+                return False
+
+            def factsByContextsInAxis(axisKey, excludeDimHash=None):
+                axes = deiValidations["axis-validations"][axisKey]["axes"]
+                axesQNs = [qname(axis, deiDefaultPrefixedNamespaces) for axis in axes]
+                axesKeys = axisKey.split('-')
+                axisContexts = {}
+                for index, axisQN in enumerate(axesQNs):
+                    currentAxisKey = axesKeys[index]
+                    for fd in modelXbrl.factsByDimMemQname(axisQN):
+                        if excludeDimHash and fd.context.dimsHash == excludeDimHash:
+                            continue
+                        if fd.context.dimsHash in axisContexts:
+                            axisContexts[fd.context.dimsHash][ftName(fd)] = fd.xValue
+                        else:
+                            axisContexts[fd.context.dimsHash] = {ftName(fd): fd.xValue}
+                return axisContexts
+
             # called with sev, returns iterator of sev facts for names and axes matching
             # called with sev and name, returns single fact for name matching axesMembers (if any)
             def sevFacts(sev=None, name=None, otherFact=None, matchDims=None, requiredContext=False, axisKey=None, deduplicate=False, whereKey=None, fallback=None, sevCovered=True, excludeKey=None):
@@ -1271,88 +1373,18 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                     axisKey = sev.get("axis","")
                 elif axisKey != sev.get("axis",""):
                     otherFact = None # block other fact comparison when axis key is for a different axis binding
-                axesValidations = deiValidations["axis-validations"][axisKey]
-                axes = axesValidations["axes"]
-                excludesAxes = "!not!" in axes
-                axisOperator = axesValidations.get("axes-operator", "any")
-                matchCubes = axesValidations.get("cubes")
-                axesQNs = []
-                for axis in axes:
-                    if axis is None:
-                        axesQNs.append(None)
-                    elif axis.startswith("!std!:"):
-                        for c in modelXbrl.nameConcepts.get(axis[6:],()):
-                            if c.qname.namespaceURI in disclosureSystem.standardTaxonomiesDict:
-                                axesQNs.append(c.qname)
-                    elif axis.startswith("*:"):
-                        for c in modelXbrl.nameConcepts.get(axis[2:],()):
-                            axesQNs.append(c.qname)
-                    elif axis != "!not!":
-                        qn = qname(axis, deiDefaultPrefixedNamespaces)
-                        if qn is not None:
-                            axesQNs.append(qn)
-
-                members = axesValidations.get("members")
-
-                def whereConditionIsFalse(wValue, wCond):
-                    wOp = wCond[0]
-                    if ((wOp == "~" and not re.search(wCond[1], str(wValue))) or
-                        (wOp == "~*" and not re.search(wCond[1], str(wValue), re.IGNORECASE)) or
-                        (wOp == "!~" and re.search(wCond[1], str(wValue))) or
-                        (wOp == "!~*" and re.search(wCond[1], str(wValue))) or
-                        ((wOp not in {"~", "~*", "!~", "!~*", "less than or equal"}) and
-                            (wValue not in wCond) == ("!not!" not in wCond)) or
-                        ((wValue != "absent" and wOp == "less than or equal" and (wValue > wCond[1]) == ("!not!" not in wCond)))
-                        ):
-                        return True
-                    return False
-
-                def comparison(sev, otherFact):
-                    names = sev.get("comparison-names")
-                    refNames = sev.get("comparison-ref-names")
-                    comparisonOperator = sev.get("comparison-operator")
-                    tolerance = sev.get("comparison-tolerance", 0)
-                    items1 = []
-                    items2 = []
-                    for name1 in names:
-                        for f in sevFacts(sev, name1, otherFact=otherFact, deduplicate=True):
-                            items1.append(f)
-                    for name2 in refNames:
-                        for g in sevFacts(sev, name2, otherFact=otherFact, deduplicate=True):
-                            items2.append(g)
-                    item1Vals = [f.xValue if f is not None else 0 for f in items1]
-                    item2Vals = [g.xValue if g is not None else 0 for g in items2]
-                    sum1 = sum(item1Vals)
-                    sum2 = sum(item2Vals)
-                    if ((comparisonOperator == "equal" and abs(sum1 - sum2) <= tolerance) or
-                        (comparisonOperator == "not-equal" and abs(sum1 - sum2) >= tolerance) or
-                        (comparisonOperator == "less than or equal" and (sum1 - sum2) <= tolerance) or
-                        (comparisonOperator == "less than" and (sum1 - sum2) < tolerance) or
-                        (comparisonOperator == "greater than or equal" and (sum1 - sum2) > tolerance) or
-                        (comparisonOperator == "greater" and (sum1 - sum2) > tolerance)):
-                        return True
-                    return False
-
-                def factsByContextsInAxis(axisKey, excludeDimHash=None):
-                    axes = deiValidations["axis-validations"][axisKey]["axes"]
-                    axesQNs = [qname(axis, deiDefaultPrefixedNamespaces) for axis in axes]
-                    axesKeys = axisKey.split('-')
-                    axisContexts = {}
-                    for index, axisQN in enumerate(axesQNs):
-                        currentAxisKey = axesKeys[index]
-                        for fd in modelXbrl.factsByDimMemQname(axisQN):
-                            if excludeDimHash and fd.context.dimsHash == excludeDimHash:
-                                continue
-                            if fd.context.dimsHash in axisContexts:
-                                axisContexts[fd.context.dimsHash][ftName(fd)] = fd.xValue
-                            else:
-                                axisContexts[fd.context.dimsHash] = {ftName(fd): fd.xValue}
-                    return axisContexts
+                plan = axisPlan(axisKey)
+                axes = plan.axes
+                excludesAxes = plan.excludesAxes
+                axisOperator = plan.axisOperator
+                matchCubes = plan.matchCubes
+                axesQNs = plan.axesQNs
+                members = plan.members
 
                 for name in names:
                     yielded = False
                     skipF = False
-                    for f in (modelXbrl.factsByQname.get(qname(name, deiDefaultPrefixedNamespaces)) or
+                    for f in (factIndex.factsByName(name, deiDefaultPrefixedNamespaces) or
                                                         (NONE_SET if fallback else EMPTY_SET)):
                         if f is not None: # not fallback
                             if langPattern is not None and not langPattern.match(f.xmlLang):
@@ -1366,9 +1398,9 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                                     getNumberofDaysLate
                                     functionName = wName[9:]
                                     evalString, functionArgs = getEvalFunctionStringAndArgs(sev, functionName)
-                                    wValue = eval(evalString) if evalString else 0
+                                    wValue = eval(evalCode(evalString)) if evalString else 0
                                 elif wName == "comparison":
-                                    wValue = comparison(sev, f)
+                                    wValue = sevComparison(sev, f)
                                 elif " axisSum " in wName:
                                     _wName, _sep, _axisKey = wName.partition(" axisSum ")
                                     items = []
@@ -1526,26 +1558,20 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 return None
 
             def axesValsKey(axisKey, cntx):
+                _key = (axisKey, cntx.id)
+                if _key not in factIndex.axesValsKeys:
+                    factIndex.axesValsKeys[_key] = contextAxesValsKey(axisKey, cntx)
+                return factIndex.axesValsKeys[_key]
+
+            def contextAxesValsKey(axisKey, cntx):
                 axesValidations = deiValidations["axis-validations"][axisKey]
                 if ("required-context-period" in axesValidations and deiDocumentType and
                     cntx.isPeriodEqualTo(documentTypeFact.context) != axesValidations["required-context-period"]):
                     return None # context period doesn't match required context
-                axesQNs = []
-                for axis in axesValidations["axes"]:
-                    if axis is not None and axis != "!not!":
-                        if axis.startswith("!std!:"):
-                            for c in modelXbrl.nameConcepts.get(axis[6:],()):
-                                if c.qname.namespaceURI in disclosureSystem.standardTaxonomiesDict:
-                                    axesQNs.append(c.qname)
-                        elif axis.startswith("*:"):
-                            for c in modelXbrl.nameConcepts.get(axis[2:],()):
-                                axesQNs.append(c.qname)
-                        else:
-                            qn = qname(axis, deiDefaultPrefixedNamespaces)
-                            if qn is not None:
-                                axesQNs.append(qn)
-                members = axesValidations.get("members")
-                cubes = axesValidations.get("cubes")
+                plan = axisPlan(axisKey)
+                axesQNs = plan.dimAxesQNs
+                members = plan.members
+                cubes = plan.matchCubes
                 presentAxisQN = [axisQN for axisQN in axesQNs if axisQN in cntx.qnameDims]
                 if len(axesQNs) == len(cntx.qnameDims):
                     if len(axesQNs) == 0:
@@ -1668,12 +1694,11 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 return max((datetimeNowAtSEC - dueDate).days, 0)
 
             def find_fact_in_context(contextID, name=None):
-                for fact in modelXbrl.facts:
-                    if fact.contextID == contextID:
-                        if not name:
-                            return fact
-                        if name == ftName(fact):
-                            return fact
+                for fact in factIndex.factsInContext(contextID):
+                    if not name:
+                        return fact
+                    if name == ftName(fact):
+                        return fact
 
             unexpectedDeiNameEfmSects = defaultdict(set) # name and sev(s)
             expectedDeiNames = defaultdict(set)
@@ -1804,12 +1829,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                     pattern = re.compile(value)
                     for nsPrefix, nsuri in modelXbrl.prefixedNamespaces.items():
                         if pattern.match(nsuri):
-                            factFound = False
-                            for f in modelXbrl.facts:
-                                if pattern.match(f.qname.namespaceURI):
-                                    factFound = True
-                                    break
-                            if not factFound:
+                            if not factIndex.hasFactInNamespace(pattern):
                                 sevMessage(sev, subType=submissionType, taxonomyNSURi=nsuri, taxonomy=nsPrefix.upper())
                 elif validation == "noDups":
                     axes = deiValidations["axis-validations"][axisKey]["axes"]
@@ -1837,27 +1857,19 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                                             found.append(matchingPair)
                 # For validation doc-type-facts-dependency check if the attachment document type exists and is in the list of document types passed in from the validation
                 elif validation == "doc-type-facts-dependency" and attachmentDocumentType is not None and any(attachmentDocumentType.startswith(dt) for dt in docTypes):
-                    factsFound = False
                     namespace = sev.get("namespace", "")
                     # Get from the validation the namespace that facts should belong to
                     pattern = re.compile(sev.get("facts-namespace", ""))
-                    # Loop through the facts until one is found that matches has a matching namespace
-                    for f in modelXbrl.facts:
-                        if pattern.match(f.qname.namespaceURI):
-                            factsFound = True
-                            break
+                    # Check the namespaces of facts until one is found that matches
+                    factsFound = factIndex.hasFactInNamespace(pattern)
                     # If a fact that matched the namespace wasn't found send the severity message
                     if not factsFound:
                         sevMessage(sev, subType=submissionType, modelObject=modelXbrl, namespace=namespace, taxonomy=taxonomy, docType=attachmentDocumentType)
                 elif validation == "item-facts-dependency" and "itemsList" in val.params: # don't validate if no itemList (e.g. stand alone)
-                    factsFound = False
                     eloItem = sev.get("elo-item", )
                     namespace = sev.get("namespace", "")
                     pattern = re.compile(sev.get("facts-namespace", ""))
-                    for f in modelXbrl.facts:
-                        if pattern.match(f.qname.namespaceURI):
-                            factsFound = True
-                            break # we can stop processing other facts
+                    factsFound = factIndex.hasFactInNamespace(pattern)
                     if eloItem in val.params["itemsList"] and not factsFound:
                         sevMessage(sev, subType=submissionType, modelObject=modelXbrl, item=eloItem, namespace=namespace)
                 # type-specific validations
@@ -2463,7 +2475,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                                 if name2.startswith("function:"):
                                     functionName = name2[9:]
                                     evalString, functionArgs = getEvalFunctionStringAndArgs(sev, functionName)
-                                    value = eval(evalString) if evalString else 0
+                                    value = eval(evalCode(evalString)) if evalString else 0
                                     termValue = sevMessageArgValue(value)
                                 else:
                                     refFact = sevFact(sev, name2, f, axisKey=sev.get("references-axes"), whereKey="references-where")
@@ -2566,13 +2578,12 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                         if fr is not None:
                             factsInMonth = [0 for i in range(12)] # count per month
                             ns = fr.qname.namespaceURI
-                            for f in modelXbrl.facts:
-                                if f.qname.namespaceURI == ns:
-                                    isMonthDuration = 0.8 < (f.context.endDatetime - f.context.startDatetime).days / 30.4375 < 1.2
-                                    monthNbr = 12 - (perEnd - f.context.startDatetime).days / 30.4375
-                                    monthInt = int(monthNbr + .2)
-                                    if isMonthDuration and 0 <= monthInt < 12:
-                                        factsInMonth[monthInt] += 1
+                            for f in factIndex.byNamespace.get(ns, ()):
+                                isMonthDuration = 0.8 < (f.context.endDatetime - f.context.startDatetime).days / 30.4375 < 1.2
+                                monthNbr = 12 - (perEnd - f.context.startDatetime).days / 30.4375
+                                monthInt = int(monthNbr + .2)
+                                if isMonthDuration and 0 <= monthInt < 12:
+                                    factsInMonth[monthInt] += 1
                             if any (m == 0 for m in factsInMonth):
                                 sevMessage(sev, subType=submissionType, modelObject=sevFacts(sev), missingMonths = ", ".join(str(m+1) for m in range(12) if factsInMonth[m] == 0))
 
@@ -2625,6 +2636,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
 
             del unexpectedDeiNameEfmSects, expectedDeiNames, sevCoveredFacts # dereference
             val.modelXbrl.profileActivity("... submission type element validations", minTimeToShow=0.1)
+            validationRules.begin("efm.requiredFacts")
 
             if deiDocumentType in ("2.01 SD",):
                 val.modelXbrl.profileActivity("... filer required facts checks (other than SD)", minTimeToShow=1.0)
@@ -2661,10 +2673,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                         return val.modelXbrl.qnameConcepts[qn].propertyView[0][1]
                     except Exception:
                         return qn.localName
-                cntxEqualFacts = defaultdict(list)
-                for f in modelXbrl.facts:
-                    if f.xValid >= VALID and f.context is not None:
-                        cntxEqualFacts[f.context.contextDimAwareHash].append(f)
+                cntxEqualFacts = factIndex.byContextDimAwareHash
                 val.modelXbrl.profileActivity("... Form SD prepare facts by context", minTimeToShow=1.0)
 
                 qnCurrencyMeasure = XbrlConst.qnIsoCurrency(deiItems.get("EntityReportingCurrencyISOCode"))
@@ -2778,6 +2787,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
         if deiDocumentType not in ("SD", "SD/A"):
             val.modelXbrl.profileActivity("... filer required facts checks", minTimeToShow=1.0)
 
+        validationRules.begin("efm.footnotes")
         # log extracted facts
         if (isXbrlInstance or isFtJson) and (extractedCoverFacts or storeDbObjectFacts):
             if storeDbObjectFacts.get("eloValuesFromFacts"):
@@ -2997,7 +3007,8 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
         pass
 
     # inline-only checks
-    if isInlineXbrl and isEFM:
+    validationRules.begin("efm.inline")
+    if isInlineXbrl and isEFM and validationRules.selected("efm.inline"):
         hiddenEltIds = {}
         presentedHiddenEltIds = defaultdict(list)
         eligibleForTransformHiddenFacts = []
@@ -3166,6 +3177,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 modelObject=unexpectedRedactElts, subType=submissionType, countRedacts=len(unexpectedRedactElts))
         del eligibleForTransformHiddenFacts, hiddenEltIds, presentedHiddenEltIds, requiredToDisplayFacts, undisplayedCoverFacts, unexpectedRedactElts
     # all-labels and references checks
+    validationRules.begin("efm.concepts")
     defaultLangStandardLabels = {}
     for concept in modelXbrl.qnameConcepts.values():
         # conceptHasDefaultLangStandardLabel = False
@@ -3261,6 +3273,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
     del defaultLangStandardLabels #dereference
 
     # checks on all documents: instance, schema, instance
+    validationRules.begin("efm.dts")
     val.hasExtensionSchema = False
     if not isFtJson:
         checkFilingDTS(val, modelXbrl.modelDocument, isEFM, isGFM, [])
@@ -3273,7 +3286,8 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                    for doc in modelXbrl.urlDocs.values()
                    for d, rd in doc.referencesDocument.items()
                    if t in abbreviatedNamespace(d.targetNamespace,WITHYEARandWILD))
-    if isEFM:
+    validationRules.begin("efm.taxonomyCompatibility")
+    if isEFM and validationRules.selected("efm.taxonomyCompatibility"):
         t = set(conflictClassFromNamespace(d.targetNamespace) for d in modelXbrl.urlDocs.values())
         t &= compatibleTaxonomies["checked-taxonomies"] # only consider checked taxonomy classes
         conflictClass = None
@@ -3340,6 +3354,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 priorLevel = level
             del seqDefRoleTypes, priorLevel, level # dereference
 
+    validationRules.begin("efm.relationships")
     conceptRelsUsedWithPreferredLabels = defaultdict(list)
     usedCalcsPresented = defaultdict(set) # pairs of concepts objectIds used in calc
     usedCalcFromTosELR = {}
@@ -3573,7 +3588,8 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 return True
         return False
         
-    if isEFM:
+    validationRules.begin("efm.customArcs")
+    if isEFM and validationRules.selected("efm.customArcs"):
         # find OEF, CEF,  VIP or ECD
         tgtMemRoles = defaultdict(set)
         tgtMemRels = defaultdict(list)
@@ -3689,8 +3705,11 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
 
 
     # checks on dimensions
-    checkFilingDimensions(val, drsELRs)
+    validationRules.begin("efm.dimensions")
+    if validationRules.selected("efm.dimensions"):
+        checkFilingDimensions(val, drsELRs)
     val.modelXbrl.profileActivity("... filer dimensions checks", minTimeToShow=1.0)
+    validationRules.begin("efm.preferredLabels")
 
     for concept, hasPresentationRelationship in conceptsUsed.items():
         if not hasPresentationRelationship:
@@ -3746,6 +3765,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
 
     # 6 16 4, 1.16.5 Base sets of Domain Relationship Sets testing
     val.modelXbrl.profileActivity("... filer preferred label checks", minTimeToShow=1.0)
+    validationRules.begin("dqc.xule")
 
     # DQC.US rules
     if dqcRules:
@@ -3778,6 +3798,9 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
             continue
         elif not dqcRuleName.startswith("DQC.US."):
             continue # skip description and any other non-rule entries
+        elif not validationRules.selected(dqcRuleName):
+            continue
+        validationRules.begin(dqcRuleName)
         msg = dqcRule.get("message")
         edgarCode = "dqc-{}-{}".format(dqcRuleName[-4:], "-".join(dqcRule["name"].title().split()))
         id = ""
@@ -4029,8 +4052,8 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
                 #additionalExcludedNames = set(dqcRule["additional-excluded-names"])
                 #excludedConceptTypedDimensions = dqcRule.get("excluded-concept-typed-dimensions", EMPTY_DICT)
                 warnedFactsByQn = defaultdict(list)
-                for f in modelXbrl.facts:
-                    if (f.qname in concepts and f.isNumeric and not f.isNil and f.xValid >= VALID and f.xValue < 0 and f.context is not None and (
+                for f in factIndex.factsOfQnames(concepts):
+                    if (f.isNumeric and not f.isNil and f.xValid >= VALID and f.xValue < 0 and f.context is not None and (
                         not isDQC0013 or (posIncomeBeforeTax.get(f.context.contextDimAwareHash, 0) > 0)) and
                         all(#(d.isTyped and # typed member exclusion
                             # d.dimensionQname.localName not in excludedConceptTypedDimensions.get(f.qname.localName, EMPTY_SET)
@@ -5727,6 +5750,7 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
             )
 
     val.modelXbrl.profileActivity("... DQCRT checks", minTimeToShow=0.1)
+    validationRules.begin("efm.finally")
     del val.summationItemRelsSetAllELRs
 
     if "EFM/Filing.py#validateFiling_end" in val.modelXbrl.arelleUnitTests:
@@ -5736,6 +5760,9 @@ def validateFiling(val, modelXbrl, isEFM=False, isGFM=False):
         for pluginXbrlMethod in pluginClassMethods("Validate.EFM.Finally"):
             pluginXbrlMethod(val, conceptsUsed)
     val.modelXbrl.profileActivity("... plug in '.Finally' checks", minTimeToShow=1.0)
+    validationRules.end()
+    if validationRules.isProfiling and hasattr(modelXbrl.modelManager, "efmFiling"):
+        modelXbrl.modelManager.efmFiling.ruleProfiles.append(validationRules.profile())
     val.modelXbrl.profileStat(_("validate{0}").format(modelXbrl.modelManager.disclosureSystem.validationType))
 
     modelXbrl.modelManager.showStatus(_("ready"), 2000)
@@ -6,6 +6,7 @@ to domestic copyright protection. 17 U.S.C. 105.
 
 Provides an integer code for each message
 '''
+from functools import lru_cache
 from regex import compile as re_compile
 from arelle.ModelInstanceObject import ModelFact
 from arelle.ModelXbrl import ModelXbrl
@@ -94,6 +95,12 @@ ftValidations = {
     "naFlagUnexpected": 1, "naFlagExpected": 2
 }
 
+# concept local name to 1-based column number of each table, built once
+ftSubTblColumns = dict((ln, i) for i, ln in enumerate(ftSubTbl, start=1))
+ftSumTblColumns = dict((ln, i) for i, ln in enumerate(ftSumTbl, start=1))
+ftTblColumns = tuple(dict((ln, i) for i, ln in enumerate(tblConcepts, start=1)) if tblConcepts else None
+                     for _code, _tblName, tblConcepts in ftTableStartCode)
+
 def messageNumericId(modelXbrl, level, messageCode, args):
     if messageCode in ignoredCodes:
         return messageCode, None
@@ -102,71 +109,76 @@ def messageNumericId(modelXbrl, level, messageCode, args):
         modelObject = modelObject[0]
     ftContext = args.get("ftContext") or args.get("axis")
     if isinstance(modelObject, (ModelFact,ModelXbrl)) and ftContext is not None and messageCode.startswith("EFM.ft."):
-        if isinstance(modelObject, (ModelFact, ModelXbrl)):
-            tagName = None
-            if "{tag}" in args.get("edgarCode"):
+        tagName = None
+        if "{tag}" in args.get("edgarCode"):
+            tagName = args.get("tag")
+        elif "{otherTag}" in args.get("edgarCode"):
+            tagName = args.get("otherTag")
+        elif args.get("msgCoda"):
+            if "{tag}" in args.get("msgCoda"):
                 tagName = args.get("tag")
-            elif "{otherTag}" in args.get("edgarCode"):
+            elif "{otherTag}" in args.get("msgCoda"):
                 tagName = args.get("otherTag")
-            elif args.get("msgCoda"):
-                if "{tag}" in args.get("msgCoda"):
-                    tagName = args.get("tag")
-                elif "{otherTag}" in args.get("msgCoda"):
-                    tagName = args.get("otherTag")
-                else:
-                    tagName = args.get("tag")
-            conceptLn = tagName.split(":")[-1] if tagName else None
-        else:
-            conceptLn = None
-        subType = args.get("subType", "")
-        msgNumId = ftStart
-        for i, (code, tblName, tblConcepts) in enumerate(ftTableStartCode):
-            if ftContext.startswith(tblName):
-                if i == 0:
-                    if conceptLn in deiSubTblCodes:
-                        msgNumId = deiSubTblCodes[conceptLn]
-                    elif conceptLn in ftSubTbl:
-                        msgNumId += code
-                        msgNumId += (ftSubTbl.index(conceptLn) + 1) * 100
-                        if subType.startswith("424I"):
-                            msgNumId += 20000
-                        else:
-                            msgNumId += 10000
-                    elif conceptLn in ftSumTbl:
-                        conceptLnNumeric = ftSumTbl.index(conceptLn) + 1
-                        msgNumId += code + 1000000
-                        msgNumId += conceptLnNumeric * 100
-                        if subType.startswith("424I"):
-                            msgNumId += 10000
-                        elif subType.startswith("SC") or subType.startswith("PRER") or subType.startswith("PREM"):
-                            msgNumId += 20000
-                        elif conceptLnNumeric <= 8:
-                            msgNumId += 30000
-                        elif subType.startswith("POS"):
-                            msgNumId += 40000
-                        elif subType.startswith("424B"):
-                            msgNumId += 50000
-                else:
+            else:
+                tagName = args.get("tag")
+        conceptLn = tagName.split(":")[-1] if tagName else None
+        tags = args.get("tags", "")
+        return ftMessageNumericId(messageCode, ftContext, conceptLn, args.get("subType", ""),
+                                  not conceptLn and isinstance(tags, str) and tags.endswith("Flg") and "Rule" in tags)
+    return patternMessageNumericId(messageCode)
+
+@lru_cache(maxsize=4096)
+def ftMessageNumericId(messageCode, ftContext, conceptLn, subType, isRuleFlagTags):
+    msgNumId = ftStart
+    for i, (code, tblName, tblConcepts) in enumerate(ftTableStartCode):
+        if ftContext.startswith(tblName):
+            if i == 0:
+                if conceptLn in deiSubTblCodes:
+                    msgNumId = deiSubTblCodes[conceptLn]
+                elif conceptLn in ftSubTblColumns:
                     msgNumId += code
-                    if tblConcepts and conceptLn in tblConcepts:
-                        msgNumId += (tblConcepts.index(conceptLn) + 1) * 100
-                    # add in rule column only when it's not a rule issue.
-                    for ruleCode, ruleName in ftRuleCode:
-                        if ruleName in ftContext:
-                            if not conceptLn and not (args.get("tags", "").endswith("Flg") and "Rule" in args.get("tags", "")):
-                                msgNumId += ruleCode
-                            elif conceptLn and not (conceptLn.endswith("Flg") and "Rule" in conceptLn):
-                                msgNumId += ruleCode
-                            break
-                break
-        if msgNumId:
-            messageCodeId = f".{(msgNumId//1000000)%10}.{(msgNumId//10000)%100}.{msgNumId//100%100}."
-            if msgNumId < 20000000:
-                messageCode = messageCode.replace(".ft.", ".FT" + messageCodeId)
+                    msgNumId += ftSubTblColumns[conceptLn] * 100
+                    if subType.startswith("424I"):
+                        msgNumId += 20000
+                    else:
+                        msgNumId += 10000
+                elif conceptLn in ftSumTblColumns:
+                    conceptLnNumeric = ftSumTblColumns[conceptLn]
+                    msgNumId += code + 1000000
+                    msgNumId += conceptLnNumeric * 100
+                    if subType.startswith("424I"):
+                        msgNumId += 10000
+                    elif subType.startswith("SC") or subType.startswith("PRER") or subType.startswith("PREM"):
+                        msgNumId += 20000
+                    elif conceptLnNumeric <= 8:
+                        msgNumId += 30000
+                    elif subType.startswith("POS"):
+                        msgNumId += 40000
+                    elif subType.startswith("424B"):
+                        msgNumId += 50000
             else:
-                messageCode = messageCode.replace(".ft.", messageCodeId)
-            msgNumId += ftValidations.get(messageCode.split(".")[-1], 0)
-            return messageCode, msgNumId
+                msgNumId += code
+                if tblConcepts and conceptLn in ftTblColumns[i]:
+                    msgNumId += ftTblColumns[i][conceptLn] * 100
+                # add in rule column only when it's not a rule issue.
+                for ruleCode, ruleName in ftRuleCode:
+                    if ruleName in ftContext:
+                        if not conceptLn and not isRuleFlagTags:
+                            msgNumId += ruleCode
+                        elif conceptLn and not (conceptLn.endswith("Flg") and "Rule" in conceptLn):
+                            msgNumId += ruleCode
+                        break
+            break
+    messageCodeId = f".{(msgNumId//1000000)%10}.{(msgNumId//10000)%100}.{msgNumId//100%100}."
+    if msgNumId < 20000000:
+        messageCode = messageCode.replace(".ft.", ".FT" + messageCodeId)
+    else:
+        messageCode = messageCode.replace(".ft.", messageCodeId)
+    msgNumId += ftValidations.get(messageCode.split(".")[-1], 0)
+    return messageCode, msgNumId
+
+@lru_cache(maxsize=4096)
+def patternMessageNumericId(messageCode):
     for code, pattern, splitChar in codesPatterns:
         m = pattern.match(messageCode)
         if m and m.lastindex is not None and m.lastindex >= 1:
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+Zip archive writer for filing outputs: large members are deflated on a thread pool (zlib releases the GIL),
+already-compressed media are stored, and the deflate level is configurable.
+'''
+import os, time, zlib, zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# members of these types are already compressed, deflating them costs time without saving space
+storedExtensions = {".jpg", ".jpeg", ".png", ".gif", ".pdf", ".zip", ".xlsx", ".docx", ".pptx", ".gz", ".7z"}
+
+def compressionLevel(value):
+    # deflate level from an option value, None for zlib's default
+    try:
+        level = int(value)
+    except (TypeError, ValueError):
+        return None
+    return level if 0 <= level <= 9 else None
+
+def compressionThreads(value):
+    # as renderingThreads: 1 for none, 0 (or not specified) for up to 4 depending on processors
+    try:
+        numThreads = int(value or 0)
+    except (TypeError, ValueError):
+        numThreads = 0
+    if numThreads <= 0:
+        numThreads = min(4, os.cpu_count() or 1)
+    return numThreads
+
+def deflate(data, level):
+    # runs on a pool thread, returns (crc, raw deflate stream) as zipfile's writer would produce them
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if level is None else level, zlib.DEFLATED, -15)
+    return zlib.crc32(data), compressor.compress(data) + compressor.flush()
+
+class ReportZipFile(zipfile.ZipFile):
+    # Members written by writestr are deflated by pool threads and written by the calling thread in the order
+    # written, so the archive is byte-for-byte that of zipfile.ZipFile with the same members and compression.
+    # Pending members are written before the archive is read, listed, opened for a member, or closed.
+
+    parallelMinSize = 64 * 1024  # smaller members are deflated inline
+
+    def __init__(self, file, mode="r", compression=zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=None, threads=0):
+        super(ReportZipFile, self).__init__(file, mode, compression, allowZip64, compresslevel)
+        self.pending = deque()  # (zinfo, data, future) in order written
+        self.pendingNames = set()
+        self.executor = None
+        self.maxPending = self.numThreads = 1
+        if mode in ("w", "x", "a") and compression == zipfile.ZIP_DEFLATED and self._seekable:
+            self.numThreads = compressionThreads(threads)
+            self.maxPending = 2 * self.numThreads  # bounds the member data held in memory awaiting deflate
+
+    def compressTypeFor(self, name, compress_type=None):
+        if compress_type is None:
+            compress_type = self.compression
+            if os.path.splitext(name)[1].lower() in storedExtensions:
+                compress_type = zipfile.ZIP_STORED
+        return compress_type
+
+    def hasMember(self, name):
+        return name in self.NameToInfo or name in self.pendingNames
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if isinstance(zinfo_or_arcname, zipfile.ZipInfo):
+            self.writePending(0)
+            super(ReportZipFile, self).writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+            return
+        compress_type = self.compressTypeFor(zinfo_or_arcname, compress_type)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if (compress_type != zipfile.ZIP_DEFLATED or len(data) < self.parallelMinSize or self.numThreads <= 1
+                or zinfo_or_arcname.endswith("/") or compresslevel is not None or self._writing):
+            self.writePending(0)
+            super(ReportZipFile, self).writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+            return
+        zinfo = zipfile.ZipInfo(filename=zinfo_or_arcname, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = compress_type
+        zinfo.external_attr = 0o600 << 16
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.numThreads, thread_name_prefix="ReportZipDeflate")
+        self.pending.append((zinfo, data, self.executor.submit(deflate, data, self.compresslevel)))
+        self.pendingNames.add(zinfo.filename)
+        self.writePending(self.maxPending)
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        self.writePending(0)
+        super(ReportZipFile, self).write(filename, arcname,
+                                         self.compressTypeFor(arcname or filename, compress_type), compresslevel)
+
+    def writePending(self, maxPending):
+        # write deflated members in order, waiting for members while more than maxPending are pending
+        while self.pending:
+            zinfo, data, future = self.pending[0]
+            if not future.done() and len(self.pending) <= maxPending:
+                break
+            self.pending.popleft()
+            self.pendingNames.discard(zinfo.filename)
+            crc, compressed = future.result()
+            self.writeDeflated(zinfo, data, crc, compressed)
+
+    def writeDeflated(self, zinfo, data, crc, compressed):
+        # the deflate stream is written as a stored member's data, then the member header is rewritten as deflated
+        zinfo.file_size = len(data)  # decides zip64 of the header as zipfile does for writestr
+        zip64 = self._allowZip64 and zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        zinfo.compress_type = zipfile.ZIP_STORED
+        with super(ReportZipFile, self).open(zinfo, mode="w") as dest:
+            dest.write(compressed)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.CRC = crc
+        zinfo.file_size = len(data)
+        self.fp.seek(zinfo.header_offset)
+        self.fp.write(zinfo.FileHeader(zip64))
+        self.fp.seek(self.start_dir)
+
+    def open(self, name, mode="r", pwd=None, *, force_zip64=False):
+        self.writePending(0)
+        if mode == "w" and not isinstance(name, zipfile.ZipInfo):
+            # a member opened by name has the compression for its name, as by writestr and write, at the archive's level
+            compression = self.compression
+            self.compression = self.compressTypeFor(name)
+            try:
+                return super(ReportZipFile, self).open(name, mode, pwd, force_zip64=force_zip64)
+            finally:
+                self.compression = compression
+        return super(ReportZipFile, self).open(name, mode, pwd, force_zip64=force_zip64)
+
+    def namelist(self):
+        self.writePending(0)
+        return super(ReportZipFile, self).namelist()
+
+    def infolist(self):
+        self.writePending(0)
+        return super(ReportZipFile, self).infolist()
+
+    def getinfo(self, name):
+        self.writePending(0)
+        return super(ReportZipFile, self).getinfo(name)
+
+    def close(self):
+        try:
+            if self.fp is not None and self.mode in ("w", "x", "a"):
+                self.writePending(0)
+        finally:
+            self.pending.clear()
+            self.pendingNames.clear()
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+            super(ReportZipFile, self).close()
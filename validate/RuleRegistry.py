@@ -0,0 +1,115 @@
+'''
+Created by staff of the U.S. Securities and Exchange Commission.
+Data and content created by government employees within the scope of their employment are not subject
+to domestic copyright protection. 17 U.S.C. 105.
+
+Registered rule units of validateFiling (Filing.py), with per-rule wall clock time and memory allocation
+counters for a structured per-filing profile, and rule selection or skipping from the command line.
+
+A rule unit is begun where its checks start in validateFiling and ends when the next rule unit begins
+(or validation ends).  Rule units declared skippable only produce messages (nothing later in validateFiling
+uses their results) and are not run when not selected; other rule units always run.  Each DQC.US rule of
+dqc-us-rules.json is a skippable rule unit named by its rule id.
+'''
+import time, tracemalloc
+import regex as re
+from collections import OrderedDict
+
+class RuleUnit:
+    def __init__(self, name, description, inputs=(), skippable=False):
+        self.name = name
+        self.description = description
+        self.inputs = inputs # declared model inputs of the rule's checks
+        self.skippable = skippable
+
+ruleUnits = OrderedDict((r.name, r) for r in (
+    RuleUnit("efm.setup", "cache lbl, pre, ref relationships and load validation resources", ("relationship sets", "resources")),
+    RuleUnit("efm.identifiers", "filer identifier checks", ("contexts", "dei facts", "parameters")),
+    RuleUnit("efm.contexts", "filer context checks", ("contexts",)),
+    RuleUnit("efm.facts", "filer fact checks", ("facts", "dei facts")),
+    RuleUnit("efm.instantDuration", "filer instant-duration checks", ("contexts", "facts")),
+    RuleUnit("efm.units", "filer unit checks", ("facts", "units", "deprecated concepts")),
+    RuleUnit("efm.duplicateFacts", "filer duplicate fact checks", ("facts",)),
+    RuleUnit("efm.labelsText", "filer label and text checks", ("facts",)),
+    RuleUnit("efm.submissionType", "submission type element validations", ("facts", "dei validations")),
+    RuleUnit("efm.requiredFacts", "filer required facts checks", ("dei facts", "contexts", "dimensions")),
+    RuleUnit("efm.footnotes", "filer extracted facts and footnotes checks", ("facts", "footnotes")),
+    RuleUnit("efm.inline", "inline XBRL checks", ("inline documents", "facts"), skippable=True),
+    RuleUnit("efm.concepts", "filer concepts checks", ("concepts", "labels", "role types")),
+    RuleUnit("efm.dts", "filer DTS checks", ("DTS documents",)),
+    RuleUnit("efm.taxonomyCompatibility", "filer standard taxonomy compatibility checks", ("DTS documents",), skippable=True),
+    RuleUnit("efm.relationships", "filer relationships checks", ("relationship sets",)),
+    RuleUnit("efm.customArcs", "filer custom arc checks", ("relationship sets", "dimension defaults"), skippable=True),
+    RuleUnit("efm.dimensions", "filer dimensions checks", ("relationship sets",), skippable=True),
+    RuleUnit("efm.preferredLabels", "filer preferred label checks", ("relationship sets",)),
+    RuleUnit("dqc.xule", "DQCRT XULE rules", ("facts", "XULE rule set")),
+    RuleUnit("efm.finally", "plug in '.Finally' checks", ()),
+    ))
+dqcRuleInputs = ("facts", "us-gaap rels", "XULE constants")
+isTracingStarted = False # allocation tracing started for rule profiling, stopped when validation ends or raises
+
+def stopTracing():
+    global isTracingStarted
+    if isTracingStarted:
+        tracemalloc.stop()
+        isTracingStarted = False
+
+class ValidationRules:
+    def __init__(self, val, options=None):
+        global isTracingStarted
+        self.modelXbrl = val.modelXbrl
+        self.selectPattern = re.compile(getattr(options, "validationRulesSelect", None) or ".*")
+        self.skipPattern = re.compile(getattr(options, "validationRulesSkip", None) or "(?!)")
+        self.isProfiling = bool(getattr(options, "validationRuleProfile", None))
+        self.measureAllocations = self.isProfiling and bool(getattr(options, "validationRuleProfileAllocations", False))
+        self.counters = OrderedDict() # by rule name: [calls, seconds, allocated bytes]
+        self.active = None
+        self.startTime = self.startAllocated = 0
+        if self.measureAllocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            isTracingStarted = True
+
+    def selected(self, name):
+        # skippable rules (declared skippable or DQC rules) may be selected or skipped, other rules always run
+        rule = ruleUnits.get(name)
+        if rule is not None and not rule.skippable:
+            return True
+        return bool(self.selectPattern.match(name)) and not self.skipPattern.match(name)
+
+    def begin(self, name):
+        # ends active rule, if any, and begins named rule
+        if not self.isProfiling:
+            return
+        now = time.perf_counter()
+        if self.active is not None:
+            counters = self.counters.setdefault(self.active, [0, 0.0, 0])
+            counters[0] += 1
+            counters[1] += now - self.startTime
+            if self.measureAllocations: # peak memory allocated by the rule above that when it began
+                counters[2] = max(counters[2], tracemalloc.get_traced_memory()[1] - self.startAllocated)
+        self.active = name
+        self.startTime = now
+        if self.measureAllocations:
+            tracemalloc.reset_peak()
+            self.startAllocated = tracemalloc.get_traced_memory()[0]
+
+    def end(self):
+        self.begin(None)
+        stopTracing()
+
+    def profile(self):
+        # structured per-instance profile, in order of rules first begun
+        rules = []
+        for name, (calls, seconds, allocated) in self.counters.items():
+            rule = ruleUnits.get(name)
+            ruleProfile = OrderedDict((("rule", name),
+                                       ("description", rule.description if rule is not None else name),
+                                       ("inputs", list(rule.inputs if rule is not None else dqcRuleInputs)),
+                                       ("calls", calls),
+                                       ("seconds", round(seconds, 6))))
+            if self.measureAllocations:
+                ruleProfile["peakAllocatedBytes"] = allocated
+            rules.append(ruleProfile)
+        return OrderedDict((("instance", getattr(self.modelXbrl.modelDocument, "basename", None)),
+                            ("seconds", round(sum(c[1] for c in self.counters.values()), 6)),
+                            ("rules", rules)))
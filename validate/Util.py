@@ -16,6 +16,39 @@ from .Consts import standardNamespacesPattern, latestTaxonomyDocs, latestEntireU
 EMPTY_DICT = {}
 EMPTY_SET = set()
 
+# process-wide cache of json resources and the structures derived from them, by (file path, variant),
+# a cached entry is used while the file's modification time and size are unchanged
+resourceCache = {}
+
+def cachedResource(cntlr, filepath, derive=None, variant=None, object_pairs_hook=None):
+    # returns derive(parsed json) for the file, shared by all filings of the process so it must not be modified
+    try:
+        _stat = os.stat(filepath)
+        stamp = (_stat.st_mtime_ns, _stat.st_size)
+    except OSError: # not a local file (e.g. in an archive), not cached
+        stamp = None
+    key = (filepath, variant)
+    entry = resourceCache.get(key)
+    if entry is not None and stamp is not None and entry[0] == stamp:
+        return entry[1]
+    _file = openFileStream(cntlr, filepath, 'rt', encoding='utf-8')
+    try:
+        resource = json.load(_file, object_pairs_hook=object_pairs_hook)
+    finally:
+        _file.close()
+    value = derive(resource) if derive is not None else resource
+    if stamp is not None:
+        resourceCache[key] = (stamp, value)
+    return value
+
+class DeferredMessages(list):
+    # errors found in building a cached resource, logged to each modelXbrl using the resource
+    def error(self, *args, **kwargs):
+        self.append((args, kwargs))
+    def log(self, modelXbrl):
+        for args, kwargs in self:
+            modelXbrl.error(*args, **kwargs)
+
 def conflictClassFromNamespace(namespaceURI):
     match = standardNamespacesPattern.match(namespaceURI or "")
     if match:
@@ -63,9 +96,8 @@ def loadNonNegativeFacts(modelXbrl, dqcRules, ugtRels):
     if dqcRules and ugtRels: # not used for us-gaap before 2020
         return None # use all available DQCRT tests
     # for us-gaap < 2020 use EFM non-negative warning  instead of DQCRT rules
-    _file = openFileStream(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "signwarnings.json"), 'rt', encoding='utf-8')
-    signwarnings = json.load(_file) # {localName: date, ...}
-    _file.close()
+    signwarnings = cachedResource(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "signwarnings.json"),
+                                  lambda signwarnings: attrdict(signwarnings, excludedMemberNamesPatterns={}))
     concepts = set()
     excludedMembers = set()
     excludedMemberStrings = set()
@@ -89,13 +121,22 @@ def loadNonNegativeFacts(modelXbrl, dqcRules, ugtRels):
     return attrdict(concepts=concepts,
                     excludedAxesMembers=excludedAxesMembers,
                     excludedMembers=excludedMembers,
-                    excludedMemberNamesPattern=re.compile("|".join(excludedMemberStrings), re.IGNORECASE)
-                                               if excludedMemberStrings else None)
+                    excludedMemberNamesPattern=excludedMemberNamesPattern(signwarnings, excludedMemberStrings))
+
+def excludedMemberNamesPattern(signwarnings, excludedMemberStrings):
+    if not excludedMemberStrings:
+        return None
+    key = frozenset(excludedMemberStrings)
+    patterns = signwarnings.excludedMemberNamesPatterns
+    if key not in patterns:
+        patterns[key] = re.compile("|".join(excludedMemberStrings), re.IGNORECASE)
+    return patterns[key]
 
 def loadCustomAxesReplacements(modelXbrl): # returns match expression, standard patterns
-    _file = openFileStream(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "axiswarnings.json"), 'rt', encoding='utf-8')
-    axiswarnings = json.load(_file) # {localName: date, ...}
-    _file.close()
+    return cachedResource(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "axiswarnings.json"),
+                          compileCustomAxesReplacements)
+
+def compileCustomAxesReplacements(axiswarnings):
     standardAxes = {}
     matchPattern = []
     for i, (standardAxis, customAxisPattern) in enumerate(axiswarnings.items()):
@@ -122,6 +163,26 @@ class DateRange(ValueRange):
         self.v1 = dateTime(r[0], type=DATE)
         self.v2 = dateTime(r[1], type=DATE)
 
+whereRegexOperators = {"~", "~*", "!~", "!~*"}
+
+class WhereCondition(list):
+    # where clause [operator, pattern] of a regular expression operator, with its pattern compiled
+    def __init__(self, clause):
+        super(WhereCondition, self).__init__(clause)
+        self.pattern = re.compile(clause[1], re.IGNORECASE if clause[0] == "~*" else 0)
+
+def compileWhereConditions(conditions):
+    # in place, for where (dict of clauses) and exclude (list of dicts of clauses) fields of sevs
+    if isinstance(conditions, list):
+        for condition in conditions:
+            compileWhereConditions(condition)
+    elif isinstance(conditions, dict):
+        for cond, clause in conditions.items():
+            if isinstance(clause, list) and len(clause) > 1 and clause[0] in whereRegexOperators:
+                conditions[cond] = WhereCondition(clause)
+            elif isinstance(clause, (dict, list)):
+                compileWhereConditions(clause)
+
 def loadDeiValidations(modelXbrl, isInlineXbrl, attachmentDocumentType):
     validationRulesFile = None
     hasAttachmentDocumentTypeRules = False # non-dei exhibit specific rules
@@ -129,16 +190,31 @@ def loadDeiValidations(modelXbrl, isInlineXbrl, attachmentDocumentType):
         if pattern is not None and pattern.match(attachmentDocumentType or ""):
             hasAttachmentDocumentTypeRules = True # non-dei exhibit type
             break
-    _file = openFileStream(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, validationRulesFilename), 'rt', encoding='utf-8')
-    validations = json.load(_file) # {localName: date, ...}
-    _file.close()
-    #print ("original validations size {}".format(pyObjectSize(validations)))
+    compiled = cachedResource(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, validationRulesFilename),
+                              lambda validations: compileDeiValidations(validations, isInlineXbrl, hasAttachmentDocumentTypeRules),
+                              variant=(isInlineXbrl, hasAttachmentDocumentTypeRules))
+    compiled.messages.log(modelXbrl)
+    validations = dict(compiled.validations) # per-filing copy of validations which depend on the filing's DTS
     prefixedNamespaces = validations["prefixed-namespaces"] = modelXbrl.prefixedNamespaces
     # set dei namespaceURI as default
     for doc in modelXbrl.urlDocs.values():
          if doc.targetNamespace and doc.targetNamespace.startswith("http://xbrl.sec.gov/dei/"):
              prefixedNamespaces[None] = doc.targetNamespace
              break
+    sevs = validations["sub-type-element-validations"] = list(validations["sub-type-element-validations"])
+    for i in compiled.filteredSevIndices:
+        sev = sevs[i] = dict(sevs[i])
+        # only include dei names in current dei taxonomy
+        sev["xbrl-names"] = [name
+                             for name in sev["xbrl-names"]
+                             if qname(name, prefixedNamespaces) in modelXbrl.qnameConcepts or name.endswith(":*") or name.startswith("header:")]
+    return validations
+
+def compileDeiValidations(validations, isInlineXbrl, hasAttachmentDocumentTypeRules):
+    # filing-independent compilation of validations, errors are logged to each filing using them
+    #print ("original validations size {}".format(pyObjectSize(validations)))
+    messages = DeferredMessages()
+    filteredSevIndices = []
     # compile sub-type-classes
     stc = validations["sub-type-classes"]
     def compileSubTypeSet(forms, formSet=None, visitedClasses=None):
@@ -148,18 +224,18 @@ def loadDeiValidations(modelXbrl, isInlineXbrl, attachmentDocumentType):
             if form.startswith("@"):
                 referencedClass = form[1:]
                 if referencedClass not in stc:
-                    modelXbrl.error("arelle:loadDeiValidations", _("Missing declaration for %(referencedClass)s."), referencedClass=form)
+                    messages.error("arelle:loadDeiValidations", _("Missing declaration for %(referencedClass)s."), referencedClass=form)
                 elif form in visitedClasses:
-                    modelXbrl.error("arelle:loadDeiValidations",
-                                    _("Circular reference to %(formClass)s in %(formClasses)s."),
-                                    formClass=referencedClass, formClasses=sorted(visitedClasses))
+                    messages.error("arelle:loadDeiValidations",
+                                   _("Circular reference to %(formClass)s in %(formClasses)s."),
+                                   formClass=referencedClass, formClasses=sorted(visitedClasses))
                 else:
                     visitedClasses.add(form)
                     compileSubTypeSet(stc[referencedClass], formSet, visitedClasses)
             else:
                 formSet.add(form)
         return formSet
-    for sev in validations["sub-type-element-validations"]:
+    for sevIndex, sev in enumerate(validations["sub-type-element-validations"]):
         if all(k.startswith("comment") for k in sev.keys()):
             continue
         for field in (
@@ -167,64 +243,63 @@ def loadDeiValidations(modelXbrl, isInlineXbrl, attachmentDocumentType):
             ("xbrl-names", "validation") if hasAttachmentDocumentTypeRules else
             ("xbrl-names", "validation", "efm" if not "msgSection" in sev else "msgSection", "source")):
             if field not in sev:
-                modelXbrl.error("arelle:loadDeiValidations",
-                                _("Missing sub-type-element-validation[\"%(field)s\"] from %(validation)s."),
-                                field=field, validation=sev)
+                messages.error("arelle:loadDeiValidations",
+                               _("Missing sub-type-element-validation[\"%(field)s\"] from %(validation)s."),
+                               field=field, validation=sev)
             elif field == "msgSection":
                 pattern = re.compile(r".*:\d+(\.\d+)*")
                 if not pattern.match(sev[field]):
-                    modelXbrl.error("arelle:loadDeiValidations",
-                                    _("Invalid format for \"%(field)s\" in %(validation)s. Value \"%(value)s\" does not match regex \"%(pattern)s\"."),
-                                    field=field, validation=sev, value=sev[field], pattern=pattern.pattern)
+                    messages.error("arelle:loadDeiValidations",
+                                   _("Invalid format for \"%(field)s\" in %(validation)s. Value \"%(value)s\" does not match regex \"%(pattern)s\"."),
+                                   field=field, validation=sev, value=sev[field], pattern=pattern.pattern)
         if "severity" in sev and not any(field.startswith("message") for field in sev) and not hasAttachmentDocumentTypeRules:
-            modelXbrl.error("arelle:loadDeiValidations",
-                            _("Missing sub-type-element-validation[\"%(field)s\"] from %(validation)s."),
-                            field="message*", validation=sev)
+            messages.error("arelle:loadDeiValidations",
+                           _("Missing sub-type-element-validation[\"%(field)s\"] from %(validation)s."),
+                           field="message*", validation=sev)
         validationCode = sev.get("validation")
         if validationCode in ("f2", "og", "ol1", "ol2", "oph", "ar", "sr", "oth", "t", "tb", "t1", "te") and "references" not in sev:
-            modelXbrl.error("arelle:loadDeiValidations",
-                            _("Missing sub-type-element-validation[\"references\"] from %(validation)s."),
-                            field=field, validation=sev)
+            messages.error("arelle:loadDeiValidations",
+                           _("Missing sub-type-element-validation[\"references\"] from %(validation)s."),
+                           field=field, validation=sev)
         if validationCode in ("ru", "ou"):
             if isinstance(sev.get("value"), list):
                 sev["value"] = set(sev["value"]) # change options list into set
             else:
-                modelXbrl.error("arelle:loadDeiValidations",
-                                _("Missing sub-type-element-validation[\"value\"] from %(validation)s, must be a list."),
-                                field=field, validation=sev)
+                messages.error("arelle:loadDeiValidations",
+                               _("Missing sub-type-element-validation[\"value\"] from %(validation)s, must be a list."),
+                               field=field, validation=sev)
         if validationCode and validationCode.startswith("fdep") and "references"not in sev:
-            modelXbrl.error("arelle:loadDeiValidations",
-                            _("Missing sub-type-element-validation[\"references\"] from %(validation)s."),
-                            field=field, validation=sev)
+            messages.error("arelle:loadDeiValidations",
+                           _("Missing sub-type-element-validation[\"references\"] from %(validation)s."),
+                           field=field, validation=sev)
         if validationCode in ():
             if isinstance(sev.get("reference-value"), list):
                 sev["reference-value"] = set(sev["reference-value"]) # change options list into set
             else:
-                modelXbrl.error("arelle:loadDeiValidations",
-                                _("Missing sub-type-element-validation[\"value\"] from %(validation)s, must be a list."),
-                                field=field, validation=sev)
+                messages.error("arelle:loadDeiValidations",
+                               _("Missing sub-type-element-validation[\"value\"] from %(validation)s, must be a list."),
+                               field=field, validation=sev)
         if not validationCode and "store-db-name" in sev:
             sev["validation"] = None # only storing, no validation
         elif validationCode not in validations["validations"]:
-            modelXbrl.error("arelle:loadDeiValidations", _("Missing validation[\"%(validationCode)s\"]."), validationCode=validationCode)
+            messages.error("arelle:loadDeiValidations", _("Missing validation[\"%(validationCode)s\"]."), validationCode=validationCode)
         axisCode = sev.get("axis")
         if axisCode and axisCode not in validations["axis-validations"]:
-            modelXbrl.error("arelle:loadDeiValidations", _("Missing axis[\"%(axisCode)s\"]."), axisCode=axisCode)
+            messages.error("arelle:loadDeiValidations", _("Missing axis[\"%(axisCode)s\"]."), axisCode=axisCode)
         if "lang" in sev:
             sev["langPattern"] = re.compile(sev["lang"])
         s = sev.get("source")
         if s is None and not validationCode and "store-db-name" in sev and not hasAttachmentDocumentTypeRules:
             pass # not a validation entry
         elif s not in ("inline", "non-inline", "both") and not hasAttachmentDocumentTypeRules:
-            modelXbrl.error("arelle:loadDeiValidations", _("Invalid source [\"%(source)s\"]."), source=s)
+            messages.error("arelle:loadDeiValidations", _("Invalid source [\"%(source)s\"]."), source=s)
         elif (isInlineXbrl and s in ("inline", "both")) or (not isInlineXbrl and s in ("non-inline", "both")) or (not s and hasAttachmentDocumentTypeRules):
             messageKey = sev.get("message")
             if messageKey and messageKey not in validations["messages"]:
-                modelXbrl.error("arelle:loadDeiValidations", _("Missing message[\"%(messageKey)s\"]."), messageKey=messageKey)
-            # only include dei names in current dei taxonomy
-            sev["xbrl-names"] = [name
-                                 for name in flattenSequence(sev.get("xbrl-names", ()))
-                                 if qname(name, prefixedNamespaces) in modelXbrl.qnameConcepts or name.endswith(":*") or name.startswith("header:")]
+                messages.error("arelle:loadDeiValidations", _("Missing message[\"%(messageKey)s\"]."), messageKey=messageKey)
+            # dei names are filtered to those in each filing's dei taxonomy
+            sev["xbrl-names"] = list(flattenSequence(sev.get("xbrl-names", ())))
+            filteredSevIndices.append(sevIndex)
             if "references" in sev:
                 sev["references"] = flattenSequence(sev["references"])
                 if "reference-value" not in sev:
@@ -252,41 +327,44 @@ def loadDeiValidations(modelXbrl, isInlineXbrl, attachmentDocumentType):
             if field.endswith("where") and isinstance(value, dict):
                 for cond, clause in value.items():
                     if not isinstance(clause, list):
-                        modelXbrl.error("arelle:loadDeiValidations",
-                                        _("Where clause %(field)s %(cond)s from %(validation)s, must be a list."),
-                                        field=field, cond=cond, validation=sev)
+                        messages.error("arelle:loadDeiValidations",
+                                       _("Where clause %(field)s %(cond)s from %(validation)s, must be a list."),
+                                       field=field, cond=cond, validation=sev)
                     else:
                         if any(e.startswith("@") for e in clause if isinstance(e,str)):
                             value[cond] = list(compileSubTypeSet(clause)) # where clause needs to keep order and be subscriptable
+            if field.endswith("where") or field.endswith("exclude"):
+                compileWhereConditions(value)
             if field.endswith("value-map") and isinstance(value, str):
                 if not value.startswith("@"):
-                        modelXbrl.error("arelle:loadDeiValidations",
-                                        _("%(field)s %(cond)s from %(validation)s, must be a dictionary or a reference to a dictionary."),
-                                        field=field, cond=value, validation=sev)
+                        messages.error("arelle:loadDeiValidations",
+                                       _("%(field)s %(cond)s from %(validation)s, must be a dictionary or a reference to a dictionary."),
+                                       field=field, cond=value, validation=sev)
                 referencedClass = value[1:]
                 if referencedClass not in stc:
-                    modelXbrl.error("arelle:loadDeiValidations", _("Missing declaration for %(referencedClass)s."), referencedClass=value)
+                    messages.error("arelle:loadDeiValidations", _("Missing declaration for %(referencedClass)s."), referencedClass=value)
                 else:
                     sev[field] = stc[referencedClass]
                                         
     for axisKey, axisValidation in validations["axis-validations"].items():
         messageKey = axisValidation.get("message")
         if messageKey and messageKey not in validations["messages"]:
-            modelXbrl.error("arelle:loadDeiValidations", _("Missing axis \"%(axisKey)s\" message[\"%(messageKey)s\"]."),
-                            axisKey=axisKey, messageKey=messageKey)
+            messages.error("arelle:loadDeiValidations", _("Missing axis \"%(axisKey)s\" message[\"%(messageKey)s\"]."),
+                           axisKey=axisKey, messageKey=messageKey)
     for valKey, validation in validations["validations"].items():
         messageKey = validation.get("message")
         if messageKey and messageKey not in validations["messages"]:
-            modelXbrl.error("arelle:loadDeiValidations", _("Missing validation \"%(valKey)s\" message[\"%(messageKey)s\"]."),
-                            valKey=valKey, messageKey=messageKey)
+            messages.error("arelle:loadDeiValidations", _("Missing validation \"%(valKey)s\" message[\"%(messageKey)s\"]."),
+                           valKey=valKey, messageKey=messageKey)
 
 #print ("compiled validations size {}".format(pyObjectSize(validations)))
-    return validations
+    return attrdict(validations=validations, filteredSevIndices=filteredSevIndices, messages=messages)
 
 def loadTaxonomyCompatibility(modelXbrl):
-    _file = openFileStream(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "taxonomy-compatibility.json"), 'rt', encoding='utf-8')
-    compat = json.load(_file, object_pairs_hook=OrderedDict) # preserve order of keys
-    _file.close()
+    return cachedResource(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "taxonomy-compatibility.json"),
+                          compileTaxonomyCompatibility, object_pairs_hook=OrderedDict) # preserve order of keys
+
+def compileTaxonomyCompatibility(compat):
     tc = compat["taxonomy-classes"]
     cc = compat["compatible-classes"]
     def refTx(txAbbrs):
@@ -299,9 +377,10 @@ def loadTaxonomyCompatibility(modelXbrl):
     return compat
 
 def loadIxTransformRegistries(modelXbrl):
-    _file = openFileStream(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "ixbrl-transform-registries.json"), 'rt', encoding='utf-8')
-    ixTrRegistries = json.load(_file, object_pairs_hook=OrderedDict) # preserve order of keys
-    _file.close()
+    return cachedResource(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "ixbrl-transform-registries.json"),
+                          compileIxTransformRegistries, object_pairs_hook=OrderedDict) # preserve order of keys
+
+def compileIxTransformRegistries(ixTrRegistries):
     ixTrRegistries.pop("copyright", None)
     ixTrRegistries.pop("description", None)
     return ixTrRegistries
@@ -315,11 +394,11 @@ def loadDeprecatedConceptDates(val, deprecatedConceptDates):
             latestTaxonomyDoc = latestTaxonomyDocs[abbrNs]
             _fileName = deprecatedConceptDatesFile(val.modelXbrl.modelManager, abbrNs, latestTaxonomyDoc)
             if _fileName:
-                _file = openFileStream(val.modelXbrl.modelManager.cntlr, _fileName, 'rt', encoding='utf-8')
-                _deprecatedConceptDates = json.load(_file) # {localName: date, ...}
-                _file.close()
-                for localName, date in _deprecatedConceptDates.items():
-                    deprecatedConceptDates[qname(ns, localName)] = date
+                deprecatedConceptDates.update(cachedResource(val.modelXbrl.modelManager.cntlr, _fileName,
+                                                             lambda _deprecatedConceptDates: # {localName: date, ...}
+                                                                 dict((qname(ns, localName), date)
+                                                                      for localName, date in _deprecatedConceptDates.items()),
+                                                             variant=ns))
 
 def resourcesFilePath(modelManager, *paths):
     # resourcesDir can be in cache dir (production) or in validate/EFM/resources (for development)
@@ -384,9 +463,7 @@ def buildDeprecatedConceptDatesFiles(cntlr):
             deprecatedConceptDatesFile(cntlr.modelManager, abbrNs, latestTaxonomyDoc)
 
 def loadOtherStandardTaxonomies(modelXbrl, val):
-    _file = openFileStream(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "other-standard-taxonomies.json"), 'rt', encoding='utf-8')
-    otherStandardTaxonomies = json.load(_file) # {localName: date, ...}
-    _file.close()
+    otherStandardTaxonomies = cachedResource(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "other-standard-taxonomies.json"))
     otherStandardNsPrefixes = otherStandardTaxonomies.get("taxonomyPrefixes",{})
     return set(doc.targetNamespace
                for doc in modelXbrl.urlDocs.values()
@@ -394,6 +471,22 @@ def loadOtherStandardTaxonomies(modelXbrl, val):
                doc.targetNamespace not in val.disclosureSystem.standardTaxonomiesDict
                and any(doc.targetNamespace.startswith(nsPrefix) for nsPrefix in otherStandardNsPrefixes))
 
+ugtRelsLists = ("accrual-items", "730000-items", "non-CF", "non-CF-abstracts1", "SHE-exceptions")
+
+def ugtRelsRows(ugtRels):
+    # rows form of a parsed json us-gaap-rels resource, cached per process:
+    # {"calcs.weights": [weight, ...], "calcs": [(weight, fromNs, fromName, [(toNs, toName), ...]), ...],
+    #  "axes": [(axisName, [memName, ...]), ...], "axis-defaults": [(axisName, defName), ...], listName: [name, ...]}
+    rows = dict((listName, ugtRels[listName]) for listName in ugtRelsLists)
+    rows["calcs.weights"] = list(ugtRels["calcs"].keys())
+    rows["calcs"] = [(wgt, fromNs, fromName, [(toNs, toName) for toNs, toNames in toNSes.items() for toName in toNames])
+                     for wgt, fromNSes in ugtRels["calcs"].items()
+                     for fromNs, fromObjs in fromNSes.items()
+                     for fromName, toNSes in fromObjs.items()]
+    rows["axes"] = list(ugtRels["axes"].items())
+    rows["axis-defaults"] = list(ugtRels["axis-defaults"].items())
+    return rows
+
 def loadUgtRelQnames(modelXbrl, dqcRules):
     if not dqcRules:
         return {} # not a us-gaap filing
@@ -410,26 +503,27 @@ def loadUgtRelQnames(modelXbrl, dqcRules):
         buildUgtFullRelsFiles(modelXbrl, dqcRules)
     if not os.path.exists(_ugtRelsFileName):
         return {}
-    _file = openFileStream(modelXbrl.modelManager.cntlr, _ugtRelsFileName, 'rt', encoding='utf-8')
-    ugtRels = json.load(_file) # {localName: date, ...}
-    _file.close()
-    def qn(nsPrefix, localName):
-        return qname(nsPrefix + ":" + localName, modelXbrl.prefixedNamespaces)
+    ugtRels = cachedResource(modelXbrl.modelManager.cntlr, _ugtRelsFileName, ugtRelsRows)
+    conceptQnames = {} # names repeat across the rels, resolve each once
+    def conceptQname(nsPrefix, localName):
+        key = (nsPrefix, localName)
+        if key not in conceptQnames:
+            concept = modelXbrl.qnameConcepts.get(qname(nsPrefix + ":" + localName, modelXbrl.prefixedNamespaces))
+            conceptQnames[key] = concept.qname if concept is not None else None
+        return conceptQnames[key]
     ugtCalcsByQnames = defaultdict(dict) # store as concept indices to avoid using memory for repetitive strings
-    for wgt, fromNSes in ugtRels["calcs"].items():
-        calcWgtObj = ugtCalcsByQnames.setdefault(float(wgt), {}) # json weight object needs to be float
-        for fromNs, fromObjs in fromNSes.items():
-            for fromName,toNSes in fromObjs.items():
-                fromConcept = modelXbrl.qnameConcepts.get(qn(fromNs, fromName))
-                if fromConcept is not None:
-                    calcFromObj = calcWgtObj.setdefault(fromConcept.qname,set())
-                    for toNs, toNames in toNSes.items():
-                        for toName in toNames:
-                            toConcept = modelXbrl.qnameConcepts.get(qn(toNs, toName))
-                            if toConcept is not None:
-                                calcFromObj.add(toConcept.qname)
+    calcWgtObjs = dict((wgt, ugtCalcsByQnames.setdefault(float(wgt), {})) # json weight object needs to be float
+                       for wgt in ugtRels["calcs.weights"])
+    for wgt, fromNs, fromName, toNames in ugtRels["calcs"]:
+        fromQname = conceptQname(fromNs, fromName)
+        if fromQname is not None:
+            calcFromObj = calcWgtObjs[wgt].setdefault(fromQname,set())
+            for toNs, toName in toNames:
+                toQname = conceptQname(toNs, toName)
+                if toQname is not None:
+                    calcFromObj.add(toQname)
     ugtAxesByQnames = defaultdict(set) # store as concept indices to avoid using memory for repetitive strings
-    for axisName, memNames in ugtRels["axes"].items():
+    for axisName, memNames in ugtRels["axes"]:
         for axisConcept in modelXbrl.nameConcepts.get(axisName,()):
             if axisConcept.qname.namespaceURI in disclosureSystem.standardTaxonomiesDict: # ignore extension concepts
                 axisObj = ugtAxesByQnames[axisConcept.name]
@@ -438,7 +532,7 @@ def loadUgtRelQnames(modelXbrl, dqcRules):
                         if memConcept.qname.namespaceURI in disclosureSystem.standardTaxonomiesDict: # ignore extension concepts
                             axisObj.add(memConcept.qname)
     ugtAxisDefaultQnames = {}
-    for axisName, defName in ugtRels["axis-defaults"].items():
+    for axisName, defName in ugtRels["axis-defaults"]:
         for axisConcept in modelXbrl.nameConcepts.get(axisName,()):
             if axisConcept.qname.namespaceURI in disclosureSystem.standardTaxonomiesDict: # ignore extension concepts
                 for defConcept in modelXbrl.nameConcepts.get(defName,()):
@@ -700,9 +794,8 @@ def loadDqcRules(modelXbrl): # returns match expression, standard patterns
         # consider primary reporting facts in main statements and dismiss facts only used
         # in notes, disclosures or parenthetically in statements.
         ((numUsGaapFacts == 0 and numIfrsFacts == 0) or (numUsGaapFacts > numIfrsFacts))):
-        _file = openFileStream(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "dqc-us-rules.json"), 'rt', encoding='utf-8')
-        dqcRules = json.load(_file, object_pairs_hook=OrderedDict) # preserve order of keys
-        _file.close()
+        dqcRules = OrderedDict(cachedResource(modelXbrl.modelManager.cntlr, resourcesFilePath(modelXbrl.modelManager, "dqc-us-rules.json"),
+                                              object_pairs_hook=OrderedDict)) # preserve order of keys, per-filing copy for the constants file
         if usGaapYr >= "2020": # files only exist starting with 2023, e.g. 2020 must use 2023 constants file
             dqcRules["XULE-constants-file"] = resourcesFilePath(modelXbrl.modelManager, "xule", f"dqcrt-us-{max(usGaapYr,'2023')}-constants.json")
         return dqcRules
@@ -756,11 +849,9 @@ def loadXuleConstantsForPythonRules(val, dqcRules):
     xuleConsts = {}
     if "XULE-constants-file" in dqcRules:
         # reload XULE constants built for XULE rule operaition
-        _file = openFileStream(val.modelXbrl.modelManager.cntlr, dqcRules["XULE-constants-file"], 'rt', encoding='utf-8')
-        xuleReloadableConstants = json.load(_file)
-        _file.close()
-        for name, obj in xuleReloadableConstants.items():
-            xuleConsts[name] = xuleReloadConstValue(obj)
+        xuleConsts.update(cachedResource(val.modelXbrl.modelManager.cntlr, dqcRules["XULE-constants-file"],
+                                         lambda xuleReloadableConstants:
+                                             dict((name, xuleReloadConstValue(obj)) for name, obj in xuleReloadableConstants.items())))
     return xuleConsts
     
 
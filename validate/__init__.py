@@ -165,6 +165,8 @@ from .Consts import (feeTagEltsNotRelevelable, feeTagMessageCodesRelevelable, fe
                      exhibitTypesPrivateNotDisseminated, primaryAttachmentDocumentTypesPattern)
 from .Filing import validateFiling
 from .MessageNumericId import messageNumericId
+from .ReportZip import ReportZipFile, compressionLevel
+from .RuleRegistry import stopTracing as stopRuleAllocationTracing
 from .XuleInterface import (menuTools as xuleMenuTools, validateMenuTools as xuleValidateMenuTools,
                             cntrlrCmdLineUtilityRun as xuleCntrlrCmdLineUtilityRun,
                             cmdOptions as xuleCmdOptions, init as xuleInit, close as xuleClose,
@@ -405,7 +407,10 @@ def validateXbrlFinally(val, *args, **kwargs):
     modelXbrl.profileActivity()
     modelXbrl.modelManager.showStatus(_statusMsg)
 
-    validateFiling(val, modelXbrl, isEFM=True)
+    try:
+        validateFiling(val, modelXbrl, isEFM=True)
+    finally:
+        stopRuleAllocationTracing() # when rule profiling measures allocations, also if validation raised
 
     modelXbrl.profileActivity(_statusMsg, minTimeToShow=0.0)
     modelXbrl.modelManager.showStatus(None)
@@ -740,6 +745,26 @@ def commandLineOptionExtender(parser, *args, **kwargs):
                       action="store_true",
                       dest="buildFTValidationsFile",
                       help=_("Build EFM Validation deprecated concepts file (pre-cache before use)"))
+
+    parser.add_option("--validation-rules-select",
+                      action="store",
+                      dest="validationRulesSelect",
+                      help=_("Regular expression of skippable EFM Validation rule units and DQC.US rules to run, e.g. DQC\\.US\\.00(01|04)"))
+
+    parser.add_option("--validation-rules-skip",
+                      action="store",
+                      dest="validationRulesSkip",
+                      help=_("Regular expression of skippable EFM Validation rule units and DQC.US rules not to run, e.g. efm\\.inline|DQC\\.US\\.0099"))
+
+    parser.add_option("--validation-rule-profile",
+                      action="store",
+                      dest="validationRuleProfile",
+                      help=_("Json file (in the output zip when there is one) of EFM Validation per-rule timings of each instance"))
+
+    parser.add_option("--validation-rule-profile-allocations",
+                      action="store_true",
+                      dest="validationRuleProfileAllocations",
+                      help=_("Include per-rule peak memory allocations in the validation rule profile (slows validation)"))
     # xule cmd options
     xuleCmdOptions(parser, *args, **kwargs)
 
@@ -766,6 +791,7 @@ class Filing:
         self.renderedFiles = set() # filing-level rendered files
         self.strippedFiles = defaultdict(set) # files to be stripped due to error, by attachmentExhibitType
         self.reportZip = None
+        self.ruleProfiles = [] # per-instance validation rule profiles, when --validation-rule-profile
         if responseZipStream:
             self.setReportZipStreamMode('w')
         else:
@@ -776,7 +802,7 @@ class Filing:
                         zipOutFile = os.path.join(zipOutDir,options.zipOutputFile)
                     else:
                         zipOutFile = options.zipOutputFile
-                    self.reportZip = zipfile.ZipFile(zipOutFile, 'w', zipfile.ZIP_DEFLATED, True)
+                    self.reportZip = self.openReportZip(zipOutFile, 'w')
             except AttributeError:
                 self.reportZip = None
         self.errorCaptureLevel = errorCaptureLevel or logging._checkLevel("INCONSISTENCY")
@@ -799,7 +825,13 @@ class Filing:
             if self.reportZip: # already open, close and reseek underlying stream
                 self.reportZip.close()
                 self.responseZipStream.seek(0)
-            self.reportZip = zipfile.ZipFile(self.responseZipStream, mode, zipfile.ZIP_DEFLATED, True)
+            self.reportZip = self.openReportZip(self.responseZipStream, mode)
+
+    def openReportZip(self, file, mode, allowZip64=True):
+        # also used for zips nested in reportZip; deflate level and threads from EdgarRenderer plugin options when present
+        return ReportZipFile(file, mode, zipfile.ZIP_DEFLATED, allowZip64,
+                             compresslevel=compressionLevel(getattr(self.options, "zipCompressionLevel", None)),
+                             threads=getattr(self.options, "renderingThreads", None))
 
     def close(self):
         ''' MetaFiling.json (not needed?) list of all files written out
@@ -831,6 +863,14 @@ class Filing:
             #else:
             #    with open(_logFile, "wt", encoding="utf-8") as fh:
             #        fh.write(_logStr)
+        _ruleProfileFile = getattr(self.options, "validationRuleProfile", None)
+        if self.ruleProfiles and _ruleProfileFile:
+            _ruleProfileStr = json.dumps({"instances": self.ruleProfiles}, indent=jsonIndent)
+            if self.reportZip and self.reportZip.fp is not None:  # open zipfile
+                self.reportZip.writestr(_ruleProfileFile, _ruleProfileStr)
+            else:
+                with open(_ruleProfileFile, "wt", encoding="utf-8") as fh:
+                    fh.write(_ruleProfileStr)
         if self.reportZip:  # ok to close if already closed
             self.reportZip.close()
         self.__dict__.clear() # dereference all contents